@@ -13,12 +13,38 @@ def create_app():
     
     # 설정 로드
     from .config import config
-    app.config.from_object(config)
+    app.config.from_object(config.get(os.environ.get('FLASK_ENV'), config['default']))
+    
+    # 코드 실행 대기열
+    from .services.scheduler import RunScheduler
+    app.extensions['run_scheduler'] = RunScheduler(
+        workers=app.config['RUNNER_WORKERS'],
+        max_queue=app.config['RUN_QUEUE_SIZE'],
+        max_per_client=app.config['RUN_QUEUE_PER_CLIENT']
+    )
+    
+    # 서버 측 그래프 렌더러 (그림 풀 + 이미지 캐시)
+    from .services.render import Renderer
+    app.extensions['renderer'] = Renderer(
+        pool_size=app.config['RENDER_POOL_SIZE'],
+        cache_size=app.config['RENDER_CACHE_SIZE'],
+        acquire_timeout=app.config['RENDER_ACQUIRE_TIMEOUT']
+    )
     
     # 라우터 등록
-    from .api import cards, health
+    from .api import answers, cards, functions, health, problems, render, run, tiles
+    app.register_blueprint(answers.bp)
     app.register_blueprint(cards.bp)
+    app.register_blueprint(functions.bp)
     app.register_blueprint(health.bp)
+    app.register_blueprint(problems.bp)
+    app.register_blueprint(render.bp)
+    app.register_blueprint(run.bp)
+    app.register_blueprint(tiles.bp)
+    
+    # CLI 명령 등록
+    from .cli import register_commands
+    register_commands(app)
     
     return app
 
@@ -0,0 +1,54 @@
+from flask import Blueprint, current_app, jsonify, request
+
+from ..services.answers import DEFAULT_ATOL, DEFAULT_RTOL, DEFAULT_SAMPLES, AnswerError, check_answers
+from ..services.catalog import find_card_dir
+
+bp = Blueprint('answers', __name__, url_prefix='/api/cards/<card_id>/answers')
+
+@bp.route('/check', methods=['POST'])
+def check(card_id):
+    """
+    학생 수식이 정답 수식과 같은 함수인지 수치적으로 확인
+    
+    `submission`(하나) 또는 `submissions`(반 전체 목록)를 받으며, 결과는
+    제출 순서대로 반환됩니다. 정답 수식의 표본 격자는 (정답, 구간, 표본 수)별로 캐시됩니다.
+    """
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    
+    try:
+        if find_card_dir(card_id, current_app.config['DATA_DIR']) is None:
+            raise AnswerError('Card not found', 404)
+        reference = data.get('reference')
+        if not reference:
+            raise AnswerError('reference is required')
+        submissions = data['submissions'] if 'submissions' in data else [data.get('submission')]
+        if not isinstance(submissions, list):
+            raise AnswerError('submissions must be a list')
+        x_range = data.get('x_range', [-10, 10])
+        if not isinstance(x_range, list) or len(x_range) != 2:
+            raise AnswerError('x_range must be [x_min, x_max] with x_min < x_max')
+        
+        results = check_answers(
+            reference,
+            submissions,
+            current_app.config['DATA_DIR'],
+            x_range=x_range,
+            samples=int(data.get('samples', DEFAULT_SAMPLES)),
+            rtol=float(data.get('rtol', DEFAULT_RTOL)),
+            atol=float(data.get('atol', DEFAULT_ATOL)),
+            check_domain=bool(data.get('check_domain', True))
+        )
+        return jsonify({
+            'reference': reference,
+            'results': results,
+            'count': len(results),
+            'equivalent_count': sum(result['equivalent'] for result in results)
+        })
+    except AnswerError as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
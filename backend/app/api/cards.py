@@ -1,42 +1,39 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request, send_from_directory
 import os
 import json
 from pathlib import Path
+from werkzeug.security import safe_join
+
+from ..services.catalog import find_card_dir, iter_card_dirs, load_metadata
+from ..services.outputs import card_output
+from ..services.scheduler import SchedulerOverloaded
 
 bp = Blueprint('cards', __name__, url_prefix='/api/cards')
 
 def load_cards_from_filesystem():
     """파일 시스템에서 카드 데이터를 로드하는 함수"""
     cards = []
-    sample_cards_path = Path(__file__).parent.parent.parent.parent / 'data' / 'raw'
     
     try:
-        if sample_cards_path.exists():
-            for category_dir in sample_cards_path.iterdir():
-                if category_dir.is_dir():
-                    for subcategory_dir in category_dir.iterdir():
-                        if subcategory_dir.is_dir():
-                            metadata_file = subcategory_dir / 'metadata.json'
-                            
-                            if metadata_file.exists():
-                                try:
-                                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                                        metadata = json.load(f)
-                                    
-                                    cards.append({
-                                        'id': metadata.get('id'),
-                                        'title': metadata.get('title'),
-                                        'category': metadata.get('category'),
-                                        'subcategory': metadata.get('subcategory'),
-                                        'difficulty': metadata.get('difficulty'),
-                                        'description': metadata.get('description'),
-                                        'tags': metadata.get('tags', []),
-                                        'learningObjectives': metadata.get('learningObjectives', []),
-                                        'estimatedTime': metadata.get('estimatedTime'),
-                                        'prerequisites': metadata.get('prerequisites', [])
-                                    })
-                                except Exception as e:
-                                    print(f"메타데이터 파일 읽기 오류 ({metadata_file}): {e}")
+        for card_dir in iter_card_dirs(current_app.config['DATA_DIR']):
+            metadata_file = card_dir / 'metadata.json'
+            try:
+                metadata = load_metadata(card_dir)
+                
+                cards.append({
+                    'id': metadata.get('id'),
+                    'title': metadata.get('title'),
+                    'category': metadata.get('category'),
+                    'subcategory': metadata.get('subcategory'),
+                    'difficulty': metadata.get('difficulty'),
+                    'description': metadata.get('description'),
+                    'tags': metadata.get('tags', []),
+                    'learningObjectives': metadata.get('learningObjectives', []),
+                    'estimatedTime': metadata.get('estimatedTime'),
+                    'prerequisites': metadata.get('prerequisites', [])
+                })
+            except Exception as e:
+                print(f"메타데이터 파일 읽기 오류 ({metadata_file}): {e}")
     except Exception as e:
         print(f'카드 데이터 로드 오류: {e}')
     
@@ -75,3 +72,32 @@ def get_cards_by_category(category):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/<card_id>/output', methods=['GET'])
+def get_card_output(card_id):
+    """빌드 시 미리 계산된 카드 기본 실행 결과를 반환 (없으면 실시간 실행)"""
+    try:
+        card_dir = find_card_dir(card_id, current_app.config['DATA_DIR'])
+        if card_dir is None:
+            return jsonify({'error': 'Card not found'}), 404
+        
+        manifest = card_output(card_dir, current_app.config['OUTPUTS_DIR'], current_app.config['RUNNER_TIMEOUT'],
+                               scheduler=current_app.extensions['run_scheduler'],
+                               client_id=request.remote_addr or 'anonymous')
+        return jsonify(manifest)
+    except SchedulerOverloaded as e:
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, e.status_code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/<card_id>/output/<version>/<filename>', methods=['GET'])
+def get_card_output_file(card_id, version, filename):
+    """미리 계산된 결과의 그림 파일을 반환"""
+    directory = safe_join(str(current_app.config['OUTPUTS_DIR']), card_id, version)
+    if directory is None:
+        return jsonify({'error': 'Output file not found'}), 404
+    response = send_from_directory(directory, filename)
+    response.cache_control.public = True
+    response.cache_control.max_age = 31536000
+    return response
@@ -0,0 +1,143 @@
+import inspect
+import json
+
+from flask import Blueprint, current_app, jsonify, request
+
+from ..services.card_functions import (
+    CardFunctionError, call_function, describe_functions, load_card_module, public_functions
+)
+from ..services.catalog import find_card_dir
+from ..services.downsample import MAX_WIDTH, METHODS, target_points, viewport_result
+from ..services.sampling import (
+    DEFAULT_MAX_POINTS, DEFAULT_TOLERANCE, INITIAL_POINTS, MAX_POINTS, resample_result
+)
+from ..services.scheduler import SchedulerOverloaded
+from ..services.singleflight import single_flight
+from ..services.transport import TransportError, make_response
+
+# 응답 인코딩만 바꾸고 계산 결과에는 영향이 없는 쿼리 인자
+ENCODING_ARGS = ('format', 'dtype')
+
+bp = Blueprint('functions', __name__, url_prefix='/api/cards/<card_id>/functions')
+
+def _viewport_args():
+    """`x_min`, `x_max`, `width`, `method` 쿼리에서 뷰포트를 읽습니다. 없으면 None."""
+    if 'width' not in request.args:
+        return None
+    x_min = request.args.get('x_min', type=float)
+    x_max = request.args.get('x_max', type=float)
+    width = request.args.get('width', type=int)
+    method = request.args.get('method', 'minmax')
+    if x_min is None or x_max is None or x_min >= x_max:
+        raise CardFunctionError('Viewport requires x_min < x_max', 400)
+    if width is None or not 1 <= width <= MAX_WIDTH:
+        raise CardFunctionError(f'Viewport width must be between 1 and {MAX_WIDTH}', 400)
+    if method not in METHODS:
+        raise CardFunctionError(f'Unsupported downsampling method: {method}', 400)
+    return x_min, x_max, width, method
+
+def _sampling_args():
+    """적응형 샘플링의 `max_points`, `tolerance` 쿼리를 읽고 범위를 검사합니다."""
+    max_points = request.args.get('max_points', DEFAULT_MAX_POINTS, type=int)
+    tolerance = request.args.get('tolerance', DEFAULT_TOLERANCE, type=float)
+    if max_points is None or not INITIAL_POINTS <= max_points <= MAX_POINTS:
+        raise CardFunctionError(f'max_points must be between {INITIAL_POINTS} and {MAX_POINTS}', 400)
+    if tolerance is None or not 0 < tolerance <= 1:
+        raise CardFunctionError('tolerance must be in (0, 1]', 400)
+    return max_points, tolerance
+
+def _card_module(card_id):
+    card_dir = find_card_dir(card_id, current_app.config['DATA_DIR'])
+    if card_dir is None or not (card_dir / 'code.py').exists():
+        raise CardFunctionError('Card not found', 404)
+    return load_card_module(card_dir)
+
+@bp.route('', methods=['GET'])
+def list_functions(card_id):
+    """카드의 공개 analyze_*/solve_* 함수와 시그니처 목록을 반환"""
+    try:
+        functions = describe_functions(_card_module(card_id))
+        return jsonify({'functions': functions, 'count': len(functions)})
+    except CardFunctionError as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/<name>', methods=['POST'])
+def invoke_function(card_id, name):
+    """
+    카드 함수를 키워드 인자로 호출하고 결과 딕셔너리만 반환
+    
+    배열은 `?format=`(json, base64, msgpack)과 `?dtype=`(float32, float64)에 따라
+    JSON 리스트 또는 바이너리 블록으로 전송됩니다. `?sampling=adaptive`이면
+    곡선을 적응형 샘플(`max_points`, `tolerance`)로 바꿔 반환하고, 뷰포트
+    (`x_min`, `x_max`, `width`, `method`)가 주어지면 화면 너비에 맞게 줄여 반환합니다.
+    같은 카드, 함수, 인자의 동시 호출은 하나의 계산으로 병합됩니다.
+    
+    계산은 코드 실행 대기열(RunScheduler)의 작업자에서 실행되어 같은 승인 제어를 받고,
+    CARD_FUNCTION_TIMEOUT 안에 끝나지 않으면 504를 반환합니다.
+    """
+    kwargs = request.get_json(silent=True) or {}
+    if not isinstance(kwargs, dict):
+        return jsonify({'error': 'Request body must be a JSON object of keyword arguments'}), 400
+    
+    sampling = request.args.get('sampling', 'uniform')
+    if sampling not in ('uniform', 'adaptive'):
+        return jsonify({'error': f'Unsupported sampling: {sampling}'}), 400
+    
+    try:
+        viewport = _viewport_args()
+        sampling_args = _sampling_args() if sampling == 'adaptive' else None
+        module = _card_module(card_id)
+        func = public_functions(module).get(name)
+        if viewport is not None and func is not None:
+            # 뷰포트 범위와 화면 너비에 맞는 점 수로 계산해 버릴 점을 만들지 않음
+            parameters = inspect.signature(func).parameters
+            if 'x_range' in parameters:
+                kwargs = dict(kwargs, x_range=viewport[:2])
+            if 'num_points' in parameters:
+                kwargs = dict(kwargs, num_points=target_points(viewport[2], viewport[3]))
+        
+        def compute():
+            result = call_function(module, name, kwargs)
+            if viewport is not None:
+                return viewport_result(result, *viewport)
+            if sampling == 'adaptive':
+                return resample_result(func, kwargs, result, *sampling_args)
+            return result
+        
+        scheduler = current_app.extensions['run_scheduler']
+        timeout = current_app.config['CARD_FUNCTION_TIMEOUT']
+        client_id = request.remote_addr or 'anonymous'
+        submitted = []
+        
+        def execute():
+            submitted.append(True)
+            future = scheduler.submit(compute, client_id=client_id)
+            try:
+                return future.result(timeout=timeout)
+            except TimeoutError:
+                future.cancel()
+                raise CardFunctionError(f'Function call timed out after {timeout} seconds', 504)
+        
+        # 같은 인자의 동시 호출(예: 한 반이 같은 카드를 동시에 열 때)은 한 번만 계산
+        query = sorted((key, value) for key, value in request.args.items(multi=True)
+                       if key not in ENCODING_ARGS)
+        key = ('card_function', card_id, name,
+               json.dumps([kwargs, query], sort_keys=True, default=str))
+        try:
+            result = single_flight.do(key, execute)
+        except SchedulerOverloaded:
+            # 다른 클라이언트의 대기열 거절이면 이 요청으로 직접 대기열에 넣음
+            if submitted:
+                raise
+            result = execute()
+        return make_response(result, request)
+    except SchedulerOverloaded as e:
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, e.status_code
+    except (CardFunctionError, TransportError) as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
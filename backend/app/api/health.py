@@ -1,7 +1,9 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 from datetime import datetime
 import time
 
+from ..services.singleflight import single_flight
+
 bp = Blueprint('health', __name__, url_prefix='/api/health')
 
 @bp.route('/', methods=['GET'])
@@ -19,3 +21,11 @@ def ping():
     """간단한 ping 응답"""
     return jsonify({'message': 'pong'})
 
+@bp.route('/metrics', methods=['GET'])
+def metrics():
+    """코드 실행 대기열, 렌더러, 요청 병합 메트릭"""
+    return jsonify({
+        'run_scheduler': current_app.extensions['run_scheduler'].metrics(),
+        'renderer': current_app.extensions['renderer'].metrics(),
+        'single_flight': single_flight.metrics()
+    })
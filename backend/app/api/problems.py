@@ -0,0 +1,91 @@
+import json
+import secrets
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from ..services.card_functions import CardFunctionError, load_card_module
+from ..services.catalog import find_card_dir
+from ..services.problems import (
+    DEFAULT_COUNT, DEFAULT_MAGNITUDE, ProblemError, generate_problems, load_problem_declarations,
+    problem_kinds
+)
+
+bp = Blueprint('problems', __name__, url_prefix='/api/cards/<card_id>/problems')
+
+QUERY_ARGS = ('kind', 'count', 'seed', 'magnitude')
+
+def _int_arg(name, default=None):
+    """정수 쿼리 인자 (정수가 아니면 기본값으로 바꾸지 않고 ProblemError)"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ProblemError(f'{name} must be an integer')
+
+def _problem_declarations(card_id):
+    """카드의 문제 생성 선언과 카드 디렉터리 (카드가 없으면 404 ProblemError)"""
+    card_dir = find_card_dir(card_id, current_app.config['DATA_DIR'])
+    if card_dir is None or not (card_dir / 'code.py').exists():
+        raise ProblemError('Card not found', 404)
+    return load_problem_declarations(card_dir), card_dir
+
+@bp.route('/kinds', methods=['GET'])
+def list_kinds(card_id):
+    """카드가 지원하는 연습 문제 종류 목록 (첫 번째가 기본값)"""
+    try:
+        declarations, _ = _problem_declarations(card_id)
+    except ProblemError as e:
+        return jsonify({'error': str(e)}), e.status_code
+    kinds = problem_kinds(declarations)
+    if not kinds:
+        return jsonify({'error': 'Card has no problem generator'}), 404
+    return jsonify({'kinds': kinds})
+
+@bp.route('', methods=['GET'])
+def stream_problems(card_id):
+    """
+    연습 문제와 답을 NDJSON(한 줄에 문제 하나)으로 스트리밍
+    
+    `?kind=`, `?count=`, `?seed=`, `?magnitude=` 외의 쿼리는 종류별 옵션
+    (예: `discriminant=negative`, `integer_roots=false`)으로 전달되며,
+    종류가 지원하지 않는 옵션은 400으로 거절합니다.
+    seed가 없으면 새로 만들어 `X-Problem-Seed` 헤더로 알려주므로 같은
+    문제지를 다시 받을 수 있습니다.
+    """
+    try:
+        count = _int_arg('count', DEFAULT_COUNT)
+        seed = _int_arg('seed')
+        if seed is None:
+            seed = secrets.randbits(32)
+        if seed < 0:
+            raise ProblemError('seed must be a non-negative integer')
+        
+        declarations, card_dir = _problem_declarations(card_id)
+        problems = generate_problems(
+            load_card_module(card_dir),
+            declarations,
+            kind=request.args.get('kind'),
+            count=count,
+            seed=seed,
+            magnitude=_int_arg('magnitude', DEFAULT_MAGNITUDE),
+            options={name: value for name, value in request.args.items() if name not in QUERY_ARGS}
+        )
+    except (CardFunctionError, ProblemError) as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
+    def lines():
+        # 상태 코드는 이미 보냈으므로 도중의 오류는 마지막 줄의 error 객체로 알림
+        try:
+            for problem in problems:
+                yield json.dumps(problem, ensure_ascii=False) + '\n'
+        except Exception as e:
+            yield json.dumps({'error': str(e)}, ensure_ascii=False) + '\n'
+    
+    response = Response(lines(), mimetype='application/x-ndjson')
+    response.headers['X-Problem-Seed'] = str(seed)
+    response.headers['X-Problem-Count'] = str(count)
+    return response
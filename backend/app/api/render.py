@@ -0,0 +1,33 @@
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from ..services.render import RenderError, spec_digest
+
+bp = Blueprint('render', __name__, url_prefix='/api/render')
+
+@bp.route('', methods=['POST'])
+def render():
+    """
+    분석 결과(선 데이터)를 서버에서 이미지로 렌더링
+    
+    같은 내용의 요청은 이미지 캐시에서 반환되며, 내용 해시를 ETag로 보내므로
+    If-None-Match 요청에는 304로 응답합니다.
+    """
+    spec = request.get_json(silent=True)
+    if spec_digest(spec) in request.if_none_match:
+        return Response(status=304)
+    
+    try:
+        digest, mimetype, image = current_app.extensions['renderer'].render(spec)
+    except RenderError as e:
+        response = jsonify({'error': str(e)})
+        if e.status_code == 503:
+            response.headers['Retry-After'] = '1'
+        return response, e.status_code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
+    response = Response(image, mimetype=mimetype)
+    response.set_etag(digest)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response
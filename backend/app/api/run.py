@@ -0,0 +1,72 @@
+import hashlib
+import json
+
+from flask import Blueprint, current_app, jsonify, request
+
+from ..services.runner_client import run_code
+from ..services.scheduler import LANES, SchedulerOverloaded
+from ..services.singleflight import single_flight
+
+bp = Blueprint('run', __name__, url_prefix='/api/run-code')
+
+def _client_id():
+    """요청한 클라이언트 식별자 (원격 주소, 클라이언트가 바꿀 수 있는 헤더는 쓰지 않음)"""
+    return request.remote_addr or 'anonymous'
+
+@bp.route('', methods=['POST'])
+def run():
+    """
+    Python 코드를 대기열을 거쳐 runner로 실행
+    
+    같은 코드(와 variables, plot_mode)로 같은 대기열(priority)에 동시에 들어온 요청은
+    하나의 실행으로 병합됩니다. 먼저 온 요청의 대기열 거절(429)은 공유하지 않고,
+    기다리던 요청은 자기 클라이언트로 다시 대기열에 넣습니다.
+    """
+    data = request.get_json(silent=True) or {}
+    code = data.get('code', '')
+    if not isinstance(code, str) or not code.strip():
+        return jsonify({'success': False, 'error': 'No code provided'}), 400
+    
+    lane = data.get('priority', 'interactive')
+    if lane not in LANES:
+        return jsonify({'success': False, 'error': f'Invalid priority: {lane}'}), 400
+    
+    plot_mode = data.get('plot_mode')
+    if plot_mode not in (None, 'image', 'spec'):
+        return jsonify({'success': False, 'error': f'Invalid plot_mode: {plot_mode}'}), 400
+    
+    variables = data.get('variables') or None
+    if variables is not None and not (isinstance(variables, list) and all(isinstance(name, str) for name in variables)):
+        return jsonify({'success': False, 'error': 'variables must be a list of names'}), 400
+    timeout = current_app.config['RUNNER_TIMEOUT']
+    runner_path = current_app.config['RUNNER_PATH']
+    scheduler = current_app.extensions['run_scheduler']
+    
+    # 같은 대기열의 같은 코드 동시 실행 요청은 대기열에 한 번만 넣고 결과를 공유
+    digest = hashlib.sha256(json.dumps([code, variables, plot_mode, timeout, str(runner_path)]).encode('utf-8')).hexdigest()
+    submitted = []
+    
+    def execute():
+        submitted.append(True)
+        return scheduler.submit(
+            lambda: run_code(code, timeout=timeout, runner_path=runner_path, variables=variables,
+                             figures=plot_mode == 'image', plot_mode=plot_mode),
+            client_id=_client_id(),
+            lane=lane
+        ).result()
+    
+    try:
+        try:
+            result = single_flight.do(('run_code', digest, lane), execute)
+        except SchedulerOverloaded:
+            # 다른 클라이언트의 대기열 거절이면 이 요청으로 직접 대기열에 넣음
+            if submitted:
+                raise
+            result = execute()
+        return jsonify(result)
+    except SchedulerOverloaded as e:
+        response = jsonify({'success': False, 'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, e.status_code
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,53 @@
+from flask import Blueprint, current_app, jsonify, request
+
+from ..services.catalog import find_card_dir
+from ..services.tiles import TileError, load_card_tiles, lookup_tile
+from ..services.transport import TransportError, make_response
+
+bp = Blueprint('tiles', __name__, url_prefix='/api/cards/<card_id>/tiles')
+
+def _card_tiles(card_id):
+    card_dir = find_card_dir(card_id, current_app.config['DATA_DIR'])
+    if card_dir is None:
+        raise TileError('Card not found', 404)
+    tiles = load_card_tiles(card_dir, current_app.config['TILES_DIR'])
+    if tiles is None:
+        raise TileError('Precomputed tiles not available', 404)
+    return tiles
+
+@bp.route('', methods=['GET'])
+def get_tile_grid(card_id):
+    """카드의 타일 격자(파라미터 값, 속성, x 범위)를 반환"""
+    try:
+        meta, _ = _card_tiles(card_id)
+        return jsonify(meta)
+    except TileError as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/lookup', methods=['GET'])
+def get_tile(card_id):
+    """
+    쿼리 파라미터(예: `?a=1&b=-2&c=0`)에 가장 가까운 격자점의 타일을 반환
+    
+    곡선은 `?format=`, `?dtype=`에 따라 JSON 리스트 또는 바이너리 블록으로 전송됩니다.
+    타일이 없으면 404이므로 클라이언트는 함수 호출 API로 대체해야 합니다.
+    
+    URL에 타일 버전이 없으므로 오래 캐시하지 않고 ETag(응답 본문 해시, 타일 버전 포함)로
+    재검증하게 합니다. 타일이 다시 빌드되지 않았으면 If-None-Match에 304를 반환합니다.
+    """
+    try:
+        meta, tiles = _card_tiles(card_id)
+        params = {name: value for name, value in request.args.items() if name in meta['parameters']}
+        result = lookup_tile(meta, tiles, params)
+        response = make_response(result, request)
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        response.vary.add('Accept')
+        response.add_etag()
+        return response.make_conditional(request)
+    except (TileError, TransportError) as e:
+        return jsonify({'error': str(e)}), e.status_code
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
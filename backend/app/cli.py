@@ -0,0 +1,34 @@
+import click
+from flask import current_app
+
+def register_commands(app):
+    """Flask CLI 명령을 등록합니다."""
+    
+    @app.cli.command('build-outputs')
+    def build_outputs():
+        """모든 카드의 기본 실행 결과를 미리 계산해 저장합니다."""
+        from .services.outputs import build_all_outputs
+        
+        manifests = build_all_outputs(
+            current_app.config['DATA_DIR'],
+            current_app.config['OUTPUTS_DIR'],
+            current_app.config['RUNNER_TIMEOUT']
+        )
+        for manifest in manifests:
+            status = 'ok' if manifest['success'] else 'failed'
+            click.echo(
+                f"{manifest['card_id']} [{manifest['version']}] {status} "
+                f"({manifest['execution_time']:.2f}s, {len(manifest['figures'])} figures)"
+            )
+    
+    @app.cli.command('build-tiles')
+    def build_tiles():
+        """parameter_grid를 선언한 카드의 슬라이더 타일을 미리 계산해 저장합니다."""
+        from .services.tiles import build_all_tiles
+        
+        metas = build_all_tiles(current_app.config['DATA_DIR'], current_app.config['TILES_DIR'])
+        for meta in metas:
+            click.echo(
+                f"{meta['card_id']} [{meta['version']}] {meta['count']} tiles "
+                f"({meta['bytes'] / 1024 / 1024:.1f} MB)"
+            )
@@ -1,10 +1,33 @@
 import os
+from pathlib import Path
+
+# 저장소 루트 (backend/app/config/__init__.py 기준)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DATA_DIR = Path(os.environ.get('DATA_DIR') or PROJECT_ROOT / 'data')
 
 class Config:
     """기본 설정 클래스"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     DEBUG = True
     CORS_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000']
+    
+    # 카드 데이터 및 코드 실행 설정
+    DATA_DIR = DATA_DIR
+    OUTPUTS_DIR = Path(os.environ.get('OUTPUTS_DIR') or DATA_DIR / 'processed' / 'outputs')
+    TILES_DIR = Path(os.environ.get('TILES_DIR') or DATA_DIR / 'processed' / 'tiles')
+    RUNNER_PATH = Path(os.environ.get('RUNNER_PATH') or PROJECT_ROOT / 'runner.py')
+    RUNNER_TIMEOUT = int(os.environ.get('RUNNER_TIMEOUT', 30))
+    
+    # 코드 실행 대기열 설정
+    RUNNER_WORKERS = int(os.environ.get('RUNNER_WORKERS', 2))
+    RUN_QUEUE_SIZE = int(os.environ.get('RUN_QUEUE_SIZE', 64))
+    RUN_QUEUE_PER_CLIENT = int(os.environ.get('RUN_QUEUE_PER_CLIENT', 4))
+    CARD_FUNCTION_TIMEOUT = int(os.environ.get('CARD_FUNCTION_TIMEOUT', 10))
+    
+    # 서버 측 그래프 렌더링 설정
+    RENDER_POOL_SIZE = int(os.environ.get('RENDER_POOL_SIZE', 2))
+    RENDER_CACHE_SIZE = int(os.environ.get('RENDER_CACHE_SIZE', 256))
+    RENDER_ACQUIRE_TIMEOUT = float(os.environ.get('RENDER_ACQUIRE_TIMEOUT', 10))
 
 class DevelopmentConfig(Config):
     """개발 환경 설정"""
@@ -19,4 +42,3 @@ config = {
     'production': ProductionConfig,
     'default': DevelopmentConfig
 }
-
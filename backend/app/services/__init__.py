@@ -0,0 +1 @@
+# 서비스 모듈 초기화
@@ -0,0 +1,175 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .card_functions import load_card_module
+from .catalog import find_card_dir
+
+# 수식 컴파일러(단순화하지 않은 sympy 식을 lambdify하는 화이트리스트 컴파일러)를 제공하는 카드
+EXPRESSION_CARD = 'math-domain-range-001'
+DEFAULT_SAMPLES = 200
+MAX_SAMPLES = 5000
+MAX_SUBMISSIONS = 1000
+MAX_EVALUATIONS = 1000000  # 한 요청의 (제출 수 × 표본 수) 상한
+MAX_X_MAGNITUDE = 1e6  # 표본 구간 끝점의 최대 절댓값
+OVERSAMPLE = 4  # 정의역 밖 점을 버리고도 충분히 남도록 후보를 더 뽑음
+MIN_DEFINED = 16  # 비교에 필요한 최소 정의된 점 수
+DEFAULT_RTOL = 1e-6
+DEFAULT_ATOL = 1e-9
+GRID_SEED = 0  # 모든 제출이 같은 표본 격자를 공유하도록 고정
+REFERENCE_CACHE_SIZE = 256
+
+class AnswerError(Exception):
+    """잘못된 정답 확인 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def _expression_module(data_dir):
+    card_dir = find_card_dir(EXPRESSION_CARD, data_dir)
+    if card_dir is None:
+        raise AnswerError('Expression compiler card not found', 500)
+    return load_card_module(card_dir)
+
+def _validate_x_range(x_range):
+    """표본 구간이 유한하고 크기가 제한된 [x_min, x_max]인지 확인합니다."""
+    try:
+        x_min, x_max = map(float, x_range)
+    except (TypeError, ValueError):
+        raise AnswerError('x_range must be [x_min, x_max] with x_min < x_max')
+    if not (-MAX_X_MAGNITUDE <= x_min < x_max <= MAX_X_MAGNITUDE):
+        raise AnswerError(f'x_range must satisfy -{MAX_X_MAGNITUDE:g} <= x_min < x_max <= {MAX_X_MAGNITUDE:g}')
+    return x_min, x_max
+
+def _landmarks(x_range, limit):
+    """
+    무작위 점이 거의 밟지 않는 특이점 후보: 구간 안의 정수·반정수와 π/2의 배수
+
+    x**2/x나 tan(x)처럼 한 점에서만 정의되지 않는 식을 구별하기 위해 격자에 더합니다.
+    limit개를 넘으면 고르게 골라냅니다.
+    """
+    def multiples(step):
+        first, last = math.ceil(x_range[0] / step), math.floor(x_range[1] / step)
+        if first > last:
+            return np.empty(0)
+        return np.unique(np.linspace(first, last, min(limit, last - first + 1)).round()) * step
+
+    return np.unique(np.concatenate([multiples(0.5), multiples(np.pi / 2)]))
+
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
+def compile_reference(reference, x_range, samples, data_dir):
+    """
+    정답 수식을 컴파일하고 공유 표본 격자에서 한 번 평가해 캐시합니다.
+
+    격자는 x_range에서 고정 시드로 뽑은 무작위 점과 특이점 후보(_landmarks)이며,
+    정답이 정의된 점(비교용)과 정의되지 않은 점(정의역 확인용)으로 나눠 둡니다.
+
+    Returns:
+        dict: defined_x, reference_y, undefined_x
+
+    Raises:
+        AnswerError: 잘못된 정답 수식 또는 정의된 점이 너무 적은 경우
+    """
+    module = _expression_module(data_dir)
+    try:
+        module.compile_expression(reference)
+    except ValueError as e:
+        raise AnswerError(f'Invalid reference: {e}')
+
+    rng = np.random.default_rng(GRID_SEED)
+    x = np.sort(rng.uniform(x_range[0], x_range[1], samples * OVERSAMPLE))
+    y = module.evaluate_expression(reference, x)
+    defined = np.isfinite(y)
+    if defined.sum() < MIN_DEFINED:
+        raise AnswerError(f'Reference is undefined on most of {list(x_range)}')
+
+    # 정의된 점과 정의되지 않은 점을 각각 최대 samples개씩 고르게 선택
+    def spread(mask):
+        indices = np.flatnonzero(mask)
+        return indices[np.linspace(0, indices.size - 1, min(samples, indices.size)).astype(int)] \
+            if indices.size else indices
+
+    # 특이점 후보는 모두 유지
+    landmarks = _landmarks(x_range, samples)
+    landmark_y = module.evaluate_expression(reference, landmarks)
+    landmark_defined = np.isfinite(landmark_y)
+    kept = spread(defined)
+    return {
+        'module': module,
+        'defined_x': np.concatenate([x[kept], landmarks[landmark_defined]]),
+        'reference_y': np.concatenate([y[kept], landmark_y[landmark_defined]]),
+        'undefined_x': np.concatenate([x[spread(~defined)], landmarks[~landmark_defined]])
+    }
+
+def check_answers(reference, submissions, data_dir, x_range=(-10, 10),
+                  samples=DEFAULT_SAMPLES, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL, check_domain=True):
+    """
+    제출한 수식들이 정답 수식과 같은 함수인지 수치적으로 확인합니다.
+
+    기호 단순화 없이 입력 그대로 컴파일한 모든 제출을 같은 표본 격자에서 벡터화 평가해
+    (제출 수 × 점 수) 행렬로 한 번에 비교합니다. 같은 문자열의 제출은
+    한 번만 평가합니다. 정답이 정의된 점에서 |제출 - 정답| <= atol + rtol·|정답|
+    이어야 하며, check_domain이면 정답이 정의되지 않은 점에서 제출도
+    정의되지 않아야 합니다 (예: sqrt(x)**2와 x는 다름). check_domain이 아니면
+    둘 다 정의된 점만 비교합니다.
+
+    Returns:
+        list: 제출별 {'submission', 'equivalent', 'status', 'max_error', 'counterexample'}
+              status는 equivalent, not_equivalent, domain_mismatch, invalid 중 하나
+    """
+    if not MIN_DEFINED <= samples <= MAX_SAMPLES:
+        raise AnswerError(f'samples must be between {MIN_DEFINED} and {MAX_SAMPLES}')
+    if not submissions or len(submissions) > MAX_SUBMISSIONS:
+        raise AnswerError(f'Provide between 1 and {MAX_SUBMISSIONS} submissions')
+    if len(submissions) * samples > MAX_EVALUATIONS:
+        raise AnswerError(f'submissions × samples must be at most {MAX_EVALUATIONS}')
+    if not all(isinstance(item, str) for item in [reference] + list(submissions)):
+        raise AnswerError('Expressions must be strings')
+
+    # 정답 격자는 카드와 무관하므로 (정답, 구간, 표본 수)로만 캐시
+    grid = compile_reference(reference.strip(), _validate_x_range(x_range), int(samples), str(data_dir))
+    module = grid['module']
+
+    unique = list(dict.fromkeys(item.strip() for item in submissions))
+    outcomes = {}
+    compiled = []
+    for expression in unique:
+        try:
+            module.compile_expression(expression)
+            compiled.append(expression)
+        except ValueError as e:
+            outcomes[expression] = {'equivalent': False, 'status': 'invalid', 'error': str(e)}
+
+    if compiled:
+        x = np.concatenate([grid['defined_x'], grid['undefined_x']])
+        values = np.vstack([module.evaluate_expression(expression, x) for expression in compiled])
+        count = grid['defined_x'].size
+        submitted, outside = values[:, :count], values[:, count:]
+        expected = grid['reference_y']
+
+        with np.errstate(all='ignore'):
+            error = np.abs(submitted - expected)
+        common = np.isfinite(submitted)
+        mismatched = common & ~(error <= atol + rtol * np.abs(expected))
+        # 정답이 정의된 곳에서 정의되지 않거나, 정의되지 않은 곳에서 정의되는 제출
+        domain_mismatch = ~common.all(axis=1) | np.isfinite(outside).any(axis=1)
+
+        for row, expression in enumerate(compiled):
+            bad = np.flatnonzero(mismatched[row])
+            if check_domain and domain_mismatch[row]:
+                status = 'domain_mismatch'
+            elif bad.size or common[row].sum() < MIN_DEFINED:
+                status = 'not_equivalent'
+            else:
+                status = 'equivalent'
+            finite_error = error[row][common[row]]
+            outcomes[expression] = {
+                'equivalent': status == 'equivalent',
+                'status': status,
+                'max_error': float(finite_error.max()) if finite_error.size else None,
+                'counterexample': float(grid['defined_x'][bad[0]]) if bad.size else None
+            }
+
+    return [dict(outcomes[item.strip()], submission=item) for item in submissions]
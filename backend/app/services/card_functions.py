@@ -0,0 +1,134 @@
+import inspect
+import re
+
+from .card_loader import load_card
+from .transport import to_jsonable
+
+# 카드 모듈에서 외부에 노출하는 함수 이름 규칙
+PUBLIC_FUNCTION_PATTERN = re.compile(r'^(analyze|solve)_\w+$')
+
+# 호출자가 정하는 크기/시간 인자의 서버 허용 범위. 범위를 넘는 값은 경계값으로 줄입니다.
+PARAMETER_BOUNDS = {
+    'num_points': (2, 10000),   # 배치/곡선 함수의 곡선 점 수
+    'resolution': (2, 256),     # 부등식 영역 RLE 마스크 한 변의 칸 수
+    'time_budget': (0.0, 2.0),  # 기호 풀이 시간 예산 (초)
+}
+MAX_RESULT_POINTS = 1_000_000  # 한 호출의 곡선 점 수 상한 (배치 행 수 x num_points)
+MAX_ARGUMENT_ITEMS = 10000     # 인자 JSON에 담긴 값 개수 상한 (배치 행 수 등)
+
+class CardFunctionError(Exception):
+    """카드 함수 호출 오류 (HTTP 상태 코드 포함)"""
+    
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def load_card_module(card_dir):
+    """
+    카드의 함수 정의만 담긴 모듈을 반환합니다.
+    
+    데모 코드는 실행하지 않으며 모듈은 워커 프로세스당 한 번만 로드됩니다.
+    """
+    return load_card(card_dir).module
+
+def public_functions(module):
+    """카드 모듈의 공개 analyze_*/solve_* 함수 딕셔너리"""
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if PUBLIC_FUNCTION_PATTERN.match(name)
+        and inspect.isfunction(value)
+        and value.__module__ == module.__name__
+    }
+
+def _describe_default(default):
+    if default is inspect.Parameter.empty:
+        return None
+    return to_jsonable(default)
+
+def describe_functions(module):
+    """공개 함수의 이름, 시그니처, 매개변수, 설명을 반환합니다."""
+    descriptions = []
+    for name, func in public_functions(module).items():
+        signature = inspect.signature(func)
+        doc = inspect.getdoc(func) or ''
+        descriptions.append({
+            'name': name,
+            'signature': f'{name}{signature}',
+            'parameters': [
+                {
+                    'name': param.name,
+                    'required': param.default is inspect.Parameter.empty,
+                    'default': _describe_default(param.default)
+                }
+                for param in signature.parameters.values()
+            ],
+            'description': doc.splitlines()[0] if doc else ''
+        })
+    return descriptions
+
+def allowed_parameters(func):
+    """호출자가 지정할 수 있는 매개변수 이름 (이름 있는 매개변수만, *args/**kwargs 제외)"""
+    return [
+        param.name
+        for param in inspect.signature(func).parameters.values()
+        if param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    ]
+
+def _count_items(value):
+    if isinstance(value, dict):
+        return sum(_count_items(item) for item in value.values()) or 1
+    if isinstance(value, (list, tuple)):
+        return sum(_count_items(item) for item in value) or 1
+    return 1
+
+def bound_arguments(func, kwargs):
+    """
+    허용된 매개변수만 받고 크기/시간 인자를 서버 허용 범위로 줄인 인자를 반환합니다.
+    
+    num_points는 배치 행 수(가장 긴 배열 인자의 길이)와 곱해 MAX_RESULT_POINTS를
+    넘지 않도록 추가로 줄입니다.
+    
+    Raises:
+        CardFunctionError: 허용되지 않은 인자, 너무 큰 인자, 숫자가 아닌 크기 인자(400)
+    """
+    allowed = allowed_parameters(func)
+    unknown = sorted(set(kwargs) - set(allowed))
+    if unknown:
+        raise CardFunctionError(f"Unknown arguments: {', '.join(unknown)}", 400)
+    if _count_items(kwargs) > MAX_ARGUMENT_ITEMS:
+        raise CardFunctionError(f'Arguments may contain at most {MAX_ARGUMENT_ITEMS} values', 400)
+    
+    kwargs = dict(kwargs)
+    rows = max([len(value) for value in kwargs.values() if isinstance(value, list)], default=1)
+    for name, (low, high) in PARAMETER_BOUNDS.items():
+        if name not in kwargs:
+            continue
+        value = kwargs[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value != value:
+            raise CardFunctionError(f'{name} must be a number', 400)
+        if name == 'num_points':
+            high = max(low, min(high, MAX_RESULT_POINTS // max(rows, 1)))
+        kwargs[name] = type(low)(min(max(value, low), high))
+    return kwargs
+
+def call_function(module, name, kwargs):
+    """
+    카드 모듈의 공개 함수를 키워드 인자로 호출하고 결과를 반환합니다.
+    
+    인자는 bound_arguments로 검사하고 서버 허용 범위로 줄인 뒤 전달합니다.
+    
+    Raises:
+        CardFunctionError: 알 수 없는 함수(404) 또는 잘못된 인자(400)
+    """
+    func = public_functions(module).get(name)
+    if func is None:
+        raise CardFunctionError(f'Unknown function: {name}', 404)
+    
+    kwargs = bound_arguments(func, kwargs)
+    try:
+        bound = inspect.signature(func).bind(**kwargs)
+    except TypeError as e:
+        raise CardFunctionError(f'Invalid arguments: {e}', 400)
+    
+    return func(*bound.args, **bound.kwargs)
@@ -0,0 +1,118 @@
+import ast
+import io
+import os
+import types
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from .singleflight import single_flight
+
+# 정의로 취급해 모듈에 실행하는 최상위 문장
+DEFINITION_NODES = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+_card_cache = {}
+
+def _is_constant_assignment(node):
+    """UPPER_CASE 이름에 대한 대입(모듈 상수)인지 확인합니다."""
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, ast.AnnAssign) and node.value is not None:
+        targets = [node.target]
+    else:
+        return False
+    return all(isinstance(target, ast.Name) and target.id.isupper() for target in targets)
+
+def _is_definition(node):
+    if isinstance(node, DEFINITION_NODES) or _is_constant_assignment(node):
+        return True
+    # 모듈 docstring
+    return isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) \
+        and isinstance(node.value.value, str)
+
+def split_card_source(source, filename='<card>'):
+    """
+    카드 소스를 정의 부분과 데모 부분으로 나눠 각각 컴파일합니다.
+
+    정의 부분은 import, 함수/클래스 정의, 모듈 상수이고 나머지 최상위
+    문장(예제 루프, plt.figure, plt.show, if __name__ == "__main__")은 데모입니다.
+    줄 번호는 원본 그대로 유지됩니다.
+
+    Returns:
+        tuple: (정의 code object, 데모 code object 또는 None, 데모 소스)
+    """
+    tree = ast.parse(source, filename)
+    definitions = [node for node in tree.body if _is_definition(node)]
+    demo = [node for node in tree.body if not _is_definition(node)]
+
+    definitions_code = compile(ast.Module(body=definitions, type_ignores=[]), filename, 'exec')
+    if not demo:
+        return definitions_code, None, ''
+
+    demo_code = compile(ast.Module(body=demo, type_ignores=[]), filename, 'exec')
+    demo_source = '\n'.join(ast.get_source_segment(source, node, padded=True) for node in demo)
+    return definitions_code, demo_code, demo_source
+
+class CardModule:
+    """데모 코드 없이 로드된 카드 모듈과 별도로 실행 가능한 데모"""
+
+    def __init__(self, module, demo_code, demo_source):
+        self.module = module
+        self.demo_code = demo_code
+        self.demo_source = demo_source
+
+    def run_demo(self, capture_output=True):
+        """
+        모듈 정의를 복사한 네임스페이스에서 데모를 __main__으로 실행합니다.
+
+        캐시된 모듈은 변경되지 않습니다.
+
+        Returns:
+            tuple: (데모 실행 후 네임스페이스, 표준 출력 문자열)
+        """
+        namespace = dict(vars(self.module), __name__='__main__')
+        if self.demo_code is None:
+            return namespace, ''
+
+        stdout = io.StringIO()
+        if capture_output:
+            with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                exec(self.demo_code, namespace)
+        else:
+            exec(self.demo_code, namespace)
+        return namespace, stdout.getvalue()
+
+def _load_card(code_path):
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    source = code_path.read_text(encoding='utf-8')
+    definitions_code, demo_code, demo_source = split_card_source(source, str(code_path))
+
+    module = types.ModuleType(f'card_{code_path.parent.name.replace("-", "_")}')
+    module.__file__ = str(code_path)
+    exec(definitions_code, module.__dict__)
+    return CardModule(module, demo_code, demo_source)
+
+def load_card(card_dir):
+    """
+    카드를 헤드리스로 로드하고 워커 프로세스 안에서 캐시합니다.
+
+    code.py가 수정되면(mtime 변경) 다시 로드합니다. 같은 카드에 대한 동시
+    로드 요청은 하나의 로드로 병합됩니다.
+    """
+    code_path = Path(card_dir) / 'code.py'
+    mtime = code_path.stat().st_mtime_ns
+    key = str(code_path)
+
+    cached = _card_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # 같은 카드를 동시에 여러 번 로드하지 않도록 병합 (다른 카드는 동시에 로드)
+    def load():
+        cached = _card_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        card = _load_card(code_path)
+        _card_cache[key] = (mtime, card)
+        return card
+
+    return single_flight.do(('card_load', key, mtime), load)
@@ -0,0 +1,31 @@
+import json
+from pathlib import Path
+
+from ..config import DATA_DIR
+
+def iter_card_dirs(data_dir=DATA_DIR):
+    """data/raw/<category>/<card> 구조의 카드 디렉터리를 순회합니다."""
+    raw_dir = Path(data_dir) / 'raw'
+    if not raw_dir.exists():
+        return
+    for category_dir in sorted(raw_dir.iterdir()):
+        if not category_dir.is_dir():
+            continue
+        for card_dir in sorted(category_dir.iterdir()):
+            if card_dir.is_dir() and (card_dir / 'metadata.json').exists():
+                yield card_dir
+
+def load_metadata(card_dir):
+    """카드 디렉터리의 metadata.json을 읽습니다."""
+    with open(Path(card_dir) / 'metadata.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def find_card_dir(card_id, data_dir=DATA_DIR):
+    """카드 ID에 해당하는 카드 디렉터리를 찾습니다. 없으면 None."""
+    for card_dir in iter_card_dirs(data_dir):
+        try:
+            if load_metadata(card_dir).get('id') == card_id:
+                return card_dir
+        except (OSError, ValueError):
+            continue
+    return None
@@ -0,0 +1,108 @@
+import numpy as np
+
+METHODS = ('minmax', 'lttb')
+MAX_WIDTH = 10000
+
+def target_points(width, method='minmax'):
+    """뷰포트 너비에서 남길 최대 점 수 (minmax는 열마다 2점, lttb는 열마다 1점)"""
+    return 2 * width if method == 'minmax' else width
+
+def _finite_runs(x, y):
+    """정의된 값이 연속된 구간별 (x, y) 조각을 반환합니다."""
+    finite = np.isfinite(x) & np.isfinite(y)
+    runs = np.split(np.arange(x.size), np.flatnonzero(np.diff(finite)) + 1)
+    return [(x[run], y[run]) for run in runs if run.size and finite[run[0]]]
+
+def minmax(x, y, x_min, x_max, width):
+    """
+    픽셀 열마다 최솟값과 최댓값 점만 남깁니다.
+
+    각 열의 극값이 유지되므로 점근선 근처의 급격한 값과 극대/극소가
+    사라지지 않습니다. 결과는 최대 2 * width개의 점입니다.
+    """
+    inside = (x >= x_min) & (x <= x_max)
+    x, y = x[inside], y[inside]
+    if x.size <= 2 * width:
+        return x, y
+
+    columns = np.minimum(((x - x_min) / (x_max - x_min) * width).astype(int), width - 1)
+    starts = np.flatnonzero(np.r_[True, np.diff(columns) != 0])
+    ends = np.r_[starts[1:], x.size]
+
+    keep = np.zeros(x.size, dtype=bool)
+    for start, end in zip(starts, ends):
+        segment = y[start:end]
+        keep[start + np.argmin(segment)] = True
+        keep[start + np.argmax(segment)] = True
+    return x[keep], y[keep]
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링
+
+    첫 점과 마지막 점을 유지하고, 각 버킷에서 이전 선택점과 다음 버킷
+    평균점으로 이루는 삼각형의 넓이가 가장 큰 점을 선택합니다.
+    """
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+
+    return x[selected], y[selected]
+
+def decimate(x, y, x_min, x_max, width, method='minmax'):
+    """
+    뷰포트(x 범위, 픽셀 너비)에 맞춰 점을 줄입니다.
+
+    정의되지 않은 점으로 끊긴 구간은 따로 처리해 점근선이 이어지지 않습니다.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xs, ys = [], []
+    for run_x, run_y in _finite_runs(x, y):
+        if method == 'lttb':
+            inside = (run_x >= x_min) & (run_x <= x_max)
+            share = max(3, int(round(width * inside.sum() / max(x.size, 1))))
+            run_x, run_y = lttb(run_x[inside], run_y[inside], share)
+        else:
+            run_x, run_y = minmax(run_x, run_y, x_min, x_max, width)
+        xs.append(run_x)
+        ys.append(run_y)
+    if not xs:
+        return np.array([]), np.array([])
+    return np.concatenate(xs), np.concatenate(ys)
+
+def viewport_result(result, x_min, x_max, width, method='minmax'):
+    """
+    카드 함수 결과의 곡선을 뷰포트에 맞게 줄입니다.
+
+    카드 함수는 뷰포트 x 범위로 한 번만 호출되고, 그 결과의 점이
+    target_points보다 많을 때만 화면 너비에 맞게 줄입니다. 곡선을 다시 평가하지 않습니다.
+    """
+    if not isinstance(result, dict) or 'x_values' not in result or not result.get('success', True) \
+            or np.ndim(result['y_values']) != 1:
+        return result
+
+    viewport = {'x_min': x_min, 'x_max': x_max, 'width': width, 'method': method}
+    if np.size(result['x_values']) <= target_points(width, method):
+        return dict(result, viewport=viewport)
+
+    x_values, y_values = decimate(result['x_values'], result['y_values'], x_min, x_max, width, method)
+    return dict(result, x_values=x_values, y_values=y_values, viewport=viewport)
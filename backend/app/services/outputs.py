@@ -0,0 +1,188 @@
+import base64
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from ..config import Config
+from .catalog import iter_card_dirs, load_metadata
+from .runner_client import run_code
+from .scheduler import SchedulerOverloaded
+from .singleflight import single_flight
+
+# 산출물 포맷이 바뀌면 올려서 기존 산출물을 무효화합니다.
+OUTPUT_FORMAT_VERSION = 1
+
+# 실패한 빌드를 재사용하는 시간 (초). 일시적 실패(시간 초과 등)는 이후 다시 빌드됩니다.
+FAILED_OUTPUT_TTL = 300
+
+def read_card_source(card_dir):
+    """카드 code.py 바이트를 읽습니다. 버전, 해시, 실행 코드는 모두 이 값에서 구합니다."""
+    return (Path(card_dir) / 'code.py').read_bytes()
+
+def source_hash(source):
+    """code.py 바이트와 산출물 포맷 버전으로 산출물 버전 해시를 계산합니다."""
+    digest = hashlib.sha256()
+    digest.update(f'v{OUTPUT_FORMAT_VERSION}\0'.encode('utf-8'))
+    digest.update(source)
+    return digest.hexdigest()
+
+def card_source_hash(card_dir):
+    """카드 code.py와 산출물 포맷 버전으로 산출물 버전 해시를 계산합니다."""
+    return source_hash(read_card_source(card_dir))
+
+def output_version(card_dir):
+    """산출물 디렉터리 이름으로 쓰이는 짧은 버전 문자열"""
+    return card_source_hash(card_dir)[:16]
+
+def build_card_output(card_dir, outputs_dir=Config.OUTPUTS_DIR, timeout=Config.RUNNER_TIMEOUT,
+                      source=None):
+    """
+    카드 코드를 runner로 실행하고 stdout, 그림, 실행 시간을 산출물로 저장합니다.
+
+    Args:
+        card_dir (Path): 카드 디렉터리
+        outputs_dir (Path): 산출물 루트 디렉터리
+        timeout (int): 실행 제한 시간 (초)
+        source (bytes): 이미 읽은 code.py 바이트 (없으면 읽음)
+
+    Returns:
+        dict: 저장된 manifest
+    """
+    card_dir = Path(card_dir)
+    metadata = load_metadata(card_dir)
+    card_id = metadata['id']
+    if source is None:
+        source = read_card_source(card_dir)
+    digest = source_hash(source)
+    version = digest[:16]
+
+    result = run_code(source.decode('utf-8'), timeout=timeout, figures=True, cwd=card_dir)
+
+    card_outputs_dir = Path(outputs_dir) / card_id
+    card_outputs_dir.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(dir=card_outputs_dir, prefix='.build-'))
+
+    try:
+        figure_files = []
+        for index, figure in enumerate(result.get('figures', []), start=1):
+            filename = f"figure-{index}.{figure['format']}"
+            (staging_dir / filename).write_bytes(base64.b64decode(figure['data']))
+            figure_files.append(filename)
+
+        manifest = {
+            'card_id': card_id,
+            'version': version,
+            'format_version': OUTPUT_FORMAT_VERSION,
+            'source_hash': digest,
+            'built_at': datetime.now().isoformat(),
+            'success': result.get('success', False),
+            'output': result.get('output', ''),
+            'error': result.get('error', ''),
+            'execution_time': result.get('execution_time', 0),
+            'figures': figure_files
+        }
+        with open(staging_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        # 완성된 산출물만 버전 디렉터리로 교체
+        target_dir = card_outputs_dir / version
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+        os.replace(staging_dir, target_dir)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    return manifest
+
+def build_all_outputs(data_dir=Config.DATA_DIR, outputs_dir=Config.OUTPUTS_DIR,
+                      timeout=Config.RUNNER_TIMEOUT):
+    """카탈로그의 모든 카드에 대해 산출물을 빌드합니다."""
+    return [
+        build_card_output(card_dir, outputs_dir, timeout)
+        for card_dir in iter_card_dirs(data_dir)
+    ]
+
+def _with_figure_urls(manifest):
+    manifest['figure_urls'] = [
+        f"/api/cards/{manifest['card_id']}/output/{manifest['version']}/{filename}"
+        for filename in manifest.get('figures', [])
+    ]
+    return manifest
+
+def _failure_expired(manifest):
+    try:
+        built_at = datetime.fromisoformat(manifest['built_at'])
+    except (KeyError, TypeError, ValueError):
+        return True
+    return (datetime.now() - built_at).total_seconds() > FAILED_OUTPUT_TTL
+
+def load_card_output(card_dir, outputs_dir=Config.OUTPUTS_DIR, source=None):
+    """
+    현재 code.py 버전에 맞는 산출물 manifest를 읽습니다.
+
+    코드가 바뀌어 산출물이 없거나 오래된 경우, 또는 실패한 빌드가
+    FAILED_OUTPUT_TTL보다 오래된 경우 None을 반환하므로 호출자는 다시 빌드해야 합니다.
+    그 전까지 실패한 빌드는 'success': False인 manifest 그대로 반환됩니다.
+    """
+    card_dir = Path(card_dir)
+    card_id = load_metadata(card_dir)['id']
+    if source is None:
+        source = read_card_source(card_dir)
+    digest = source_hash(source)
+    manifest_file = Path(outputs_dir) / card_id / digest[:16] / 'manifest.json'
+
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get('source_hash') != digest:
+        return None
+    if not manifest.get('success') and _failure_expired(manifest):
+        return None
+    return _with_figure_urls(manifest)
+
+def card_output(card_dir, outputs_dir=Config.OUTPUTS_DIR, timeout=Config.RUNNER_TIMEOUT,
+                scheduler=None, client_id='anonymous'):
+    """
+    카드 기본 실행 결과를 반환합니다.
+
+    유효한 빌드 산출물이 있으면 그대로 쓰고, 없으면 scheduler 대기열을 거쳐
+    runner로 실시간 실행해 산출물로 저장한 뒤 반환합니다.
+    같은 카드의 동시 실시간 실행은 하나로 병합됩니다.
+
+    Returns:
+        dict: manifest (실시간 실행이면 'live': True)
+
+    Raises:
+        SchedulerOverloaded: 대기열 또는 클라이언트 한도 초과
+    """
+    source = read_card_source(card_dir)
+    manifest = load_card_output(card_dir, outputs_dir, source)
+    if manifest is not None:
+        return manifest
+
+    submitted = []
+
+    def job():
+        return build_card_output(card_dir, outputs_dir, timeout, source)
+
+    def build():
+        submitted.append(True)
+        built = job() if scheduler is None else scheduler.submit(job, client_id=client_id).result()
+        return dict(_with_figure_urls(built), live=True)
+
+    key = ('card_output', str(card_dir), source_hash(source)[:16])
+    try:
+        return single_flight.do(key, build)
+    except SchedulerOverloaded:
+        # 다른 클라이언트의 대기열 거절이면 이 요청으로 직접 대기열에 넣음
+        if submitted:
+            raise
+        return build()
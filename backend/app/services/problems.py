@@ -0,0 +1,279 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+
+from .card_functions import call_function
+from .catalog import load_metadata
+
+DEFAULT_COUNT = 100
+MAX_COUNT = 100000
+CHUNK_SIZE = 1000  # 한 번에 샘플링하고 배치로 푸는 문제 수
+DEFAULT_MAGNITUDE = 9  # 계수, 근 등의 최대 절댓값
+MAX_MAGNITUDE = 100
+
+EXPONENTIAL_BASES = np.array([2, 3, 4, 5, 10, 0.5])  # 지수/로그방정식에 쓰는 유효한 밑
+DISCRIMINANT_SIGNS = ('positive', 'zero', 'negative', 'any')
+INEQUALITY_TYPES = np.array(['>', '<', '>=', '<='])
+BOOLEAN_OPTIONS = {'true': True, '1': True, 'false': False, '0': False}
+
+def _exact_reciprocal(base):
+    """1/base가 유한소수인지 (기약분수 분자의 소인수가 2와 5뿐인지)"""
+    numerator = Fraction(base).numerator
+    for prime in (2, 5):
+        while numerator % prime == 0:
+            numerator //= prime
+    return numerator == 1
+
+# 음의 지수를 써도 b^x가 유한소수인 밑 (3^-2 = 0.111...처럼 순환소수가 되는 밑은 x ≥ 0만 사용)
+EXACT_RECIPROCALS = np.array([_exact_reciprocal(base) for base in EXPONENTIAL_BASES])
+
+class ProblemError(Exception):
+    """잘못된 문제 생성 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def _option_flag(options, name, default):
+    value = options.get(name)
+    if value is None:
+        return default
+    if str(value).lower() not in BOOLEAN_OPTIONS:
+        raise ProblemError(f'Option {name} must be true or false')
+    return BOOLEAN_OPTIONS[str(value).lower()]
+
+def _signed(rng, low, high, size):
+    """절댓값이 low 이상 high 이하인 0이 아닌 정수"""
+    return rng.integers(low, high + 1, size) * rng.choice([-1, 1], size)
+
+def _number(value):
+    """정수면 정수로, 아니면 소수로 표시 (부동소수점 잡음은 12자리에서 정리)"""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else f'{value:.12g}'
+
+def format_polynomial(coefficients, variable='x'):
+    """[2, -3, 1] -> '2x² - 3x + 1' (높은 차수부터)"""
+    powers = {0: '', 1: variable, 2: f'{variable}²', 3: f'{variable}³'}
+    text = ''
+    degree = len(coefficients) - 1
+    for index, coefficient in enumerate(coefficients):
+        power = degree - index
+        if coefficient == 0:
+            continue
+        magnitude = abs(float(coefficient))
+        body = powers[power] if magnitude == 1 and power else _number(magnitude) + powers[power]
+        if not text:
+            text = ('-' if coefficient < 0 else '') + body
+        else:
+            text += (' - ' if coefficient < 0 else ' + ') + body
+    return text or '0'
+
+def _scaled_term(coefficient, term, constant):
+    """a·term + c 꼴의 식 (a = ±1이면 계수 생략)"""
+    if abs(coefficient) == 1:
+        text = term if coefficient > 0 else f'-{term}'
+    else:
+        text = f'{_number(coefficient)}·{term}'
+    if constant:
+        text += f' - {_number(-constant)}' if constant < 0 else f' + {_number(constant)}'
+    return text
+
+def _answer(value, digits=9):
+    """배치 결과 값을 JSON 값으로 (NaN은 None, 부동소수점 잡음 제거)"""
+    value = float(value)
+    if not math.isfinite(value):
+        return None
+    return round(value, digits) + 0.0
+
+def _sample_quadratic(rng, size, magnitude, options):
+    """판별식 부호(와 정수근)를 지정한 이차방정식 계수"""
+    sign = options.get('discriminant', 'positive')
+    if sign not in DISCRIMINANT_SIGNS:
+        raise ProblemError(f"Option discriminant must be one of {', '.join(DISCRIMINANT_SIGNS)}")
+    integer_roots = _option_flag(options, 'integer_roots', True)
+
+    a = _signed(rng, 1, min(3, magnitude), size)
+    mode = rng.integers(0, 3, size) if sign == 'any' else np.full(size, DISCRIMINANT_SIGNS.index(sign))
+
+    # 근의 곱 형태 a(x - r1)(x - r2): 정수근 (r2 = r1이면 중근)
+    root1 = rng.integers(-magnitude, magnitude + 1, size)
+    root2 = root1 + np.where(mode == 0, rng.integers(1, magnitude + 1, size), 0)
+    # 꼭짓점 형태 a(x - h)² + k: 판별식 -4ak의 부호를 k로 정함
+    h = rng.integers(-magnitude, magnitude + 1, size)
+    k = rng.integers(1, magnitude + 1, size) * np.where(mode == 2, np.sign(a), -np.sign(a))
+
+    factored = (mode == 1) | ((mode == 0) & integer_roots)
+    b = np.where(factored, -a * (root1 + root2), -2 * a * h)
+    c = np.where(factored, a * root1 * root2, a * h**2 + k)
+    return {'a': a, 'b': b, 'c': c}
+
+def _quadratic_problem(params, result, index):
+    a, b, c = (params[name][index] for name in 'abc')
+    roots = [result['root1'][index], result['root2'][index]][:int(result['root_count'][index])]
+    return (
+        f'{format_polynomial([a, b, c])} = 0의 해와 꼭짓점을 구하시오.',
+        {
+            'roots': [_answer(root) for root in roots],
+            'discriminant': _answer(result['discriminant'][index]),
+            'vertex': [_answer(result['vertex_x'][index]), _answer(result['vertex_y'][index])]
+        }
+    )
+
+def _sample_linear(rng, size, magnitude, options):
+    """기울기가 0이 아니고 (기본값) x절편이 정수인 일차함수"""
+    m = _signed(rng, 1, magnitude, size)
+    if _option_flag(options, 'integer_intercepts', True):
+        b = -m * rng.integers(-magnitude, magnitude + 1, size)
+    else:
+        b = rng.integers(-magnitude, magnitude + 1, size)
+    return {'m': m, 'b': b}
+
+def _linear_problem(params, result, index):
+    m, b = params['m'][index], params['b'][index]
+    return (
+        f'y = {format_polynomial([m, b])}의 기울기, x절편, y절편을 구하시오.',
+        {
+            'slope': _answer(result['slope'][index]),
+            'x_intercept': _answer(result['x_intercept'][index]),
+            'y_intercept': _answer(result['y_intercept'][index])
+        }
+    )
+
+def _sample_base_power(rng, size, low, high):
+    """유효한 밑 b와 b^k가 유한소수인 정수 지수 k (low ≤ k < high)"""
+    index = rng.integers(0, len(EXPONENTIAL_BASES), size)
+    exponent = rng.integers(low, high, size)
+    return EXPONENTIAL_BASES[index], np.where(EXACT_RECIPROCALS[index], exponent, np.abs(exponent))
+
+def _sample_exponential(rng, size, magnitude, options):
+    """유효한 밑과 정수해를 갖고 target이 유한소수인 지수방정식 a·b^x + c = target"""
+    b, solution = _sample_base_power(rng, size, -2, 5)
+    a = _signed(rng, 1, min(3, magnitude), size)
+    c = rng.integers(-magnitude, magnitude + 1, size)
+    return {'a': a, 'b': b, 'c': c, 'target': a * b**solution + c}
+
+def _exponential_problem(params, result, index):
+    a, b, c, target = (params[name][index] for name in ('a', 'b', 'c', 'target'))
+    base = _number(b) if float(b).is_integer() else f'({_number(b)})'
+    left = _scaled_term(a, f'{base}^x', c)
+    return (
+        f'{left} = {_number(target)}의 해를 구하시오.',
+        {'solution': _answer(result['solutions'][index])}
+    )
+
+def _sample_logarithmic(rng, size, magnitude, options):
+    """유효한 밑과 유한소수 b^k 꼴의 해를 갖는 로그방정식 a·log_b(x) + c = target"""
+    b, exponent = _sample_base_power(rng, size, -2, 4)
+    a = _signed(rng, 1, min(3, magnitude), size)
+    c = rng.integers(-magnitude, magnitude + 1, size)
+    return {'a': a, 'b': b, 'c': c, 'target': a * exponent + c}
+
+def _logarithmic_problem(params, result, index):
+    a, b, c, target = (params[name][index] for name in ('a', 'b', 'c', 'target'))
+    left = _scaled_term(a, f'log_{_number(b)}(x)', c)
+    return (
+        f'{left} = {_number(target)}의 해를 구하시오.',
+        {'solution': _answer(result['solutions'][index])}
+    )
+
+def _sample_quadratic_inequality(rng, size, magnitude, options):
+    """정수근을 갖는 이차 부등식과 부등호"""
+    params = _sample_quadratic(rng, size, magnitude, dict(options, discriminant='positive'))
+    params['inequality_type'] = INEQUALITY_TYPES[rng.integers(0, len(INEQUALITY_TYPES), size)]
+    return params
+
+def _quadratic_inequality_problem(params, result, index):
+    a, b, c = (params[name][index] for name in 'abc')
+    symbol = {'>': '>', '<': '<', '>=': '≥', '<=': '≤'}[params['inequality_type'][index]]
+    roots = [result['root1'][index], result['root2'][index]][:int(result['root_count'][index])]
+    return (
+        f'{format_polynomial([a, b, c])} {symbol} 0의 해를 구하시오.',
+        {'solution': result['solution'][index], 'roots': [_answer(root) for root in roots]}
+    )
+
+def _solve_args(params):
+    return {name: values.tolist() for name, values in params.items()}
+
+def _curve_free_args(params):
+    # 배치 분석 함수의 곡선은 쓰지 않으므로 점 두 개만 계산
+    return dict(_solve_args(params), num_points=2)
+
+# 문제 종류 -> (샘플러, 풀이 인자 변환, 문제 작성기, 허용 옵션)
+# 카드는 metadata.json의 problems에 지원하는 종류와 배치 풀이 함수를 선언합니다.
+GENERATORS = {
+    'quadratic-equation':
+        (_sample_quadratic, _curve_free_args, _quadratic_problem, ('discriminant', 'integer_roots')),
+    'linear-function': (_sample_linear, _curve_free_args, _linear_problem, ('integer_intercepts',)),
+    'exponential-equation': (_sample_exponential, _solve_args, _exponential_problem, ()),
+    'logarithmic-equation': (_sample_logarithmic, _solve_args, _logarithmic_problem, ()),
+    'quadratic-inequality':
+        (_sample_quadratic_inequality, _solve_args, _quadratic_inequality_problem, ('integer_roots',)),
+}
+
+def load_problem_declarations(card_dir):
+    """카드 metadata.json의 problems 선언 (문제 종류 -> 배치 풀이 함수)을 반환합니다. 없으면 None."""
+    return load_metadata(card_dir).get('problems')
+
+def problem_kinds(declarations):
+    """카드가 선언한 문제 종류 중 생성기가 있는 것 (첫 번째가 기본값)"""
+    return [kind for kind in declarations or {} if kind in GENERATORS]
+
+def generate_problems(module, declarations, kind=None, count=DEFAULT_COUNT, seed=0,
+                      magnitude=DEFAULT_MAGNITUDE, options=None):
+    """
+    제약 조건에 맞게 파라미터를 샘플링하고 카드의 배치 함수로 풀어
+    문제를 하나씩 내보내는 제너레이터를 반환합니다.
+
+    declarations는 카드 metadata.json의 problems 선언입니다.
+    CHUNK_SIZE개씩 샘플링하고 풀기 때문에 count와 상관없이 메모리 사용량이
+    일정합니다. 청크마다 (seed, 청크 번호)로 난수 생성기를 만들고 항상 청크
+    전체를 샘플링하므로, 같은 seed의 문제 목록은 count가 달라도 앞부분이 같습니다.
+
+    Raises:
+        ProblemError: 지원하지 않는 카드/종류 또는 잘못된 옵션 (첫 문제 전에 검사)
+    """
+    kinds = problem_kinds(declarations)
+    if not kinds:
+        raise ProblemError('Card has no problem generator', 404)
+    kind = kind or kinds[0]
+    if kind not in kinds:
+        raise ProblemError(f"Unsupported problem kind: {kind} (available: {', '.join(kinds)})")
+    if not 1 <= count <= MAX_COUNT:
+        raise ProblemError(f'count must be between 1 and {MAX_COUNT}')
+    if not 1 <= magnitude <= MAX_MAGNITUDE:
+        raise ProblemError(f'magnitude must be between 1 and {MAX_MAGNITUDE}')
+
+    sampler, solve_args, write_problem, allowed_options = GENERATORS[kind]
+    batch_function = declarations[kind]['batch_function']
+    options = options or {}
+    unknown = sorted(set(options) - set(allowed_options))
+    if unknown:
+        raise ProblemError(
+            f"Unknown option for {kind}: {', '.join(unknown)} "
+            f"(available: {', '.join(allowed_options) or 'none'})"
+        )
+    # 옵션 오류가 스트림 도중이 아니라 호출 시점에 드러나도록 미리 한 번 샘플링
+    sampler(np.random.default_rng(seed), 1, magnitude, options)
+
+    def problems():
+        for chunk, start in enumerate(range(0, count, CHUNK_SIZE)):
+            size = min(CHUNK_SIZE, count - start)
+            rng = np.random.default_rng([seed, chunk])
+            params = {name: values[:size] for name, values in
+                      sampler(rng, CHUNK_SIZE, magnitude, options).items()}
+            result = call_function(module, batch_function, solve_args(params))
+            if not result.get('success', True):
+                raise RuntimeError(result.get('error'))
+
+            for index in range(size):
+                question, answer = write_problem(params, result, index)
+                yield {
+                    'id': f'{seed}-{start + index}',
+                    'kind': kind,
+                    'question': question,
+                    'parameters': {name: values[index].item() for name, values in params.items()},
+                    'answer': answer
+                }
+
+    return problems()
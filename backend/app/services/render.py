@@ -0,0 +1,281 @@
+import hashlib
+import json
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from io import BytesIO
+
+import numpy as np
+
+# 카드에서 쓰는 서브플롯 격자: 이름 -> (행, 열, 그림 크기)
+LAYOUTS = {
+    '1x1': (1, 1, (8, 6)),
+    '2x3': (2, 3, (15, 10)),
+    '2x4': (2, 4, (15, 10)),
+}
+FORMATS = {'png': 'image/png', 'svg': 'image/svg+xml'}
+DEFAULT_DPI = 100
+MAX_DPI = 200
+MAX_SERIES = 8  # 패널당 선 개수
+MAX_POINTS = 20000  # 선당 점 개수
+ACQUIRE_TIMEOUT = 10  # 그림이 모두 사용 중일 때 기다리는 최대 시간 (초)
+
+class RenderError(Exception):
+    """잘못된 렌더링 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+class PooledFigure:
+    """
+    미리 구성된 격자의 Figure와 Agg 캔버스
+
+    축 설정(격자, 기준선)은 생성 시 한 번만 하고, 렌더링할 때는 각 축의
+    Line2D 데이터만 set_data로 바꿉니다. 부족한 선만 새로 추가하고
+    남는 선은 숨깁니다.
+    """
+
+    def __init__(self, layout):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        rows, cols, figsize = LAYOUTS[layout]
+        self.layout = layout
+        self.figure = Figure(figsize=figsize)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.axes = self.figure.subplots(rows, cols, squeeze=False).ravel().tolist()
+        self.lines = [[] for _ in self.axes]
+        for ax in self.axes:
+            ax.grid(True, alpha=0.3)
+            ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+            ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+
+    def _line(self, index, number):
+        lines = self.lines[index]
+        while len(lines) <= number:
+            line, = self.axes[index].plot([], [], linewidth=2)
+            lines.append(line)
+        return lines[number]
+
+    def draw(self, panels, fmt='png', dpi=DEFAULT_DPI):
+        """패널 목록을 그리고 이미지 바이트를 반환합니다."""
+        for index, ax in enumerate(self.axes):
+            panel = panels[index] if index < len(panels) else None
+            ax.set_visible(panel is not None)
+            if panel is None:
+                continue
+
+            series = panel.get('series', [])
+            for number, item in enumerate(series):
+                line = self._line(index, number)
+                line.set_data(item['x'], item['y'])
+                line.set_label(item.get('label') or '_nolegend_')
+                line.set_color(item.get('color') or f'C{number}')
+                line.set_linestyle(item.get('linestyle', '-'))
+                line.set_visible(True)
+            for line in self.lines[index][len(series):]:
+                line.set_visible(False)
+                line.set_label('_nolegend_')
+
+            ax.set_title(panel.get('title', ''), fontweight='bold')
+            ax.set_xlabel(panel.get('xlabel', ''))
+            ax.set_ylabel(panel.get('ylabel', ''))
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+            if panel.get('x_range'):
+                ax.set_xlim(*panel['x_range'])
+            if panel.get('y_range'):
+                ax.set_ylim(*panel['y_range'])
+
+            legend = ax.get_legend()
+            if legend is not None:
+                legend.remove()
+            if any(item.get('label') for item in series):
+                ax.legend()
+
+        buffer = BytesIO()
+        self.figure.savefig(buffer, format=fmt, dpi=dpi)
+        return buffer.getvalue()
+
+class FigurePool:
+    """
+    레이아웃별로 최대 size개의 PooledFigure를 빌려주고 돌려받습니다.
+
+    pyplot의 전역 '현재 그림' 상태를 쓰지 않고, 빌린 그림은 반환될 때까지
+    한 요청만 사용하므로 서로 다른 그림으로 여러 스레드가 동시에 렌더링할 수
+    있습니다. 그림 수가 size로 제한되므로 스레드가 많아도 메모리는 늘지 않습니다.
+    """
+
+    def __init__(self, size=2, timeout=ACQUIRE_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self._pools = {layout: queue.LifoQueue() for layout in LAYOUTS}
+        self._created = {layout: 0 for layout in LAYOUTS}
+        self._in_use = {layout: 0 for layout in LAYOUTS}
+        self._lock = threading.Lock()
+
+    def acquire(self, layout):
+        """
+        레이아웃의 그림을 빌립니다. 모두 사용 중이면 size개까지 새로 만들고,
+        그 이상은 반환될 때까지 최대 timeout초 기다립니다.
+
+        Raises:
+            RenderError: timeout 안에 그림이 반환되지 않은 경우 (503)
+        """
+        pool = self._pools[layout]
+        with self._lock:
+            create = pool.empty() and self._created[layout] < self.size
+            if create:
+                self._created[layout] += 1
+            self._in_use[layout] += 1
+        try:
+            if create:
+                return PooledFigure(layout)
+            try:
+                return pool.get(timeout=self.timeout)
+            except queue.Empty:
+                raise RenderError('All figures are busy, try again later', 503)
+        except BaseException:
+            with self._lock:
+                self._created[layout] -= create
+                self._in_use[layout] -= 1
+            raise
+
+    def release(self, figure):
+        with self._lock:
+            self._in_use[figure.layout] -= 1
+        self._pools[figure.layout].put(figure)
+
+    @contextmanager
+    def checkout(self, layout):
+        """with 블록 동안 레이아웃의 그림 하나를 독점으로 빌립니다."""
+        figure = self.acquire(layout)
+        try:
+            yield figure
+        finally:
+            self.release(figure)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                layout: {'created': self._created[layout], 'in_use': self._in_use[layout],
+                         'idle': self._pools[layout].qsize()}
+                for layout in LAYOUTS
+            }
+
+def _series_array(item, key, result_key):
+    values = item.get(key, item.get(result_key))
+    if values is None:
+        raise RenderError(f'Series requires {key} values')
+    try:
+        array = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        raise RenderError(f'Series {key} values must be numbers')
+    if array.ndim != 1 or array.size > MAX_POINTS:
+        raise RenderError(f'Series {key} values must be a list of at most {MAX_POINTS} numbers')
+    return array
+
+def _axis_range(panel, key):
+    value = panel[key]
+    if not isinstance(value, list) or len(value) != 2 \
+            or not all(isinstance(bound, (int, float)) and not isinstance(bound, bool) for bound in value) \
+            or not all(np.isfinite(value)) or value[0] >= value[1]:
+        raise RenderError(f'{key} must be [low, high] with finite low < high')
+    return [float(bound) for bound in value]
+
+def normalize_spec(spec):
+    """
+    렌더링 요청을 검증하고 그릴 수 있는 형태로 바꿉니다.
+
+    선(series)은 `x`/`y` 배열 또는 카드 함수 결과의 `x_values`/`y_values`를
+    그대로 받으며, 라벨이 없으면 결과의 `function`을 사용합니다.
+    """
+    if not isinstance(spec, dict):
+        raise RenderError('Render spec must be a JSON object')
+    layout = spec.get('layout', '1x1')
+    if layout not in LAYOUTS:
+        raise RenderError(f'Unsupported layout: {layout}')
+    fmt = spec.get('format', 'png')
+    if fmt not in FORMATS:
+        raise RenderError(f'Unsupported format: {fmt}')
+    dpi = spec.get('dpi', DEFAULT_DPI)
+    if not isinstance(dpi, int) or not 10 <= dpi <= MAX_DPI:
+        raise RenderError(f'dpi must be an integer between 10 and {MAX_DPI}')
+
+    rows, cols, _ = LAYOUTS[layout]
+    panels = spec.get('panels', [])
+    if not isinstance(panels, list) or len(panels) > rows * cols:
+        raise RenderError(f'Layout {layout} has at most {rows * cols} panels')
+
+    normalized = []
+    for panel in panels:
+        series = panel.get('series', []) if isinstance(panel, dict) else None
+        if not isinstance(series, list) or len(series) > MAX_SERIES:
+            raise RenderError(f'Each panel needs a list of at most {MAX_SERIES} series')
+        items = []
+        for item in series:
+            if not isinstance(item, dict):
+                raise RenderError('Each series must be a JSON object')
+            x = _series_array(item, 'x', 'x_values')
+            y = _series_array(item, 'y', 'y_values')
+            if x.shape != y.shape:
+                raise RenderError('Series x and y must have the same length')
+            items.append({
+                'x': x,
+                'y': y,
+                'label': item.get('label', item.get('function')),
+                'color': item.get('color'),
+                'linestyle': item.get('linestyle', '-')
+            })
+        normalized.append(dict(
+            {key: panel[key] for key in ('title', 'xlabel', 'ylabel') if key in panel},
+            **{key: _axis_range(panel, key) for key in ('x_range', 'y_range') if panel.get(key) is not None},
+            series=items
+        ))
+    return layout, fmt, dpi, normalized
+
+def spec_digest(spec):
+    """요청 내용의 해시 (이미지 캐시 키, ETag)"""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+class Renderer:
+    """크기가 제한된 그림 풀과 내용 해시 기반 이미지 캐시를 묶은 렌더러 (스레드 안전)"""
+
+    def __init__(self, pool_size=2, cache_size=256, acquire_timeout=ACQUIRE_TIMEOUT):
+        self.pool = FigurePool(pool_size, acquire_timeout)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'rendered': 0, 'cache_hits': 0}
+
+    def render(self, spec):
+        """
+        렌더링 요청을 이미지로 만듭니다. 같은 내용의 요청은 캐시에서 반환합니다.
+
+        Returns:
+            tuple: (내용 해시, MIME 타입, 이미지 바이트)
+        """
+        digest = spec_digest(spec)
+        with self._lock:
+            cached = self._cache.get(digest)
+            if cached is not None:
+                self._cache.move_to_end(digest)
+                self._counters['cache_hits'] += 1
+                return (digest,) + cached
+
+        layout, fmt, dpi, panels = normalize_spec(spec)
+        with self.pool.checkout(layout) as figure:
+            image = figure.draw(panels, fmt, dpi)
+
+        with self._lock:
+            self._counters['rendered'] += 1
+            self._cache[digest] = (FORMATS[fmt], image)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return digest, FORMATS[fmt], image
+
+    def metrics(self):
+        with self._lock:
+            return dict(self._counters, cached=len(self._cache), pool=self.pool.metrics())
@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+
+from ..config import Config
+
+def run_code(code, timeout=Config.RUNNER_TIMEOUT, runner_path=Config.RUNNER_PATH,
+             figures=False, variables=None, plot_mode=None, cwd=None):
+    """
+    별도 프로세스에서 runner.py로 코드를 실행하고 결과를 반환합니다.
+    
+    Args:
+        code (str): 실행할 Python 코드
+        timeout (int): 실행 제한 시간 (초)
+        runner_path (Path): runner.py 경로
+        figures (bool): 생성된 그림을 PNG(base64)로 받을지 여부
+        variables (list): 실행 후 추출할 전역 변수 이름 목록
+        plot_mode (str): 'spec'이면 그림을 플롯 스펙(JSON)으로 받음
+        cwd (Path): 실행 디렉터리
+    
+    Returns:
+        dict: runner.py가 반환한 실행 결과
+    """
+    command = [sys.executable, str(runner_path)]
+    if figures:
+        command.append('--figures')
+    if variables:
+        command.extend(['--variables', ','.join(variables)])
+    if plot_mode:
+        command.extend(['--plot-mode', plot_mode])
+    
+    env = dict(os.environ, PYTHONIOENCODING='utf-8')
+    try:
+        completed = subprocess.run(
+            command,
+            input=code,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            timeout=timeout,
+            cwd=cwd,
+            env=env
+        )
+    except subprocess.TimeoutExpired:
+        return {
+            'success': False,
+            'error': f'Execution timed out after {timeout} seconds'
+        }
+    
+    try:
+        return json.loads(completed.stdout)
+    except ValueError:
+        return {
+            'success': False,
+            'error': f'Runner error: {completed.stderr.strip() or "invalid runner output"}'
+        }
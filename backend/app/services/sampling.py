@@ -0,0 +1,145 @@
+import inspect
+
+import numpy as np
+
+DEFAULT_MAX_POINTS = 400
+DEFAULT_TOLERANCE = 1e-3  # 그래프 높이 대비 허용 오차
+INITIAL_POINTS = 65
+MAX_POINTS = 10000
+
+def evaluate_curve(f, x):
+    """벡터화된 함수를 평가하고 정의되지 않은 점은 NaN으로 둡니다."""
+    with np.errstate(all='ignore'):
+        y = np.asarray(f(x), dtype=float)
+    if y.shape != x.shape:
+        y = np.broadcast_to(y, x.shape).astype(float)
+    y[~np.isfinite(y)] = np.nan
+    return y
+
+def _vertical_span(y):
+    """극단값(점근선 근처)에 휘둘리지 않도록 분위수로 그래프 높이를 추정합니다."""
+    finite = y[np.isfinite(y)]
+    if finite.size < 2:
+        return 1.0
+    low, high = np.percentile(finite, [2, 98])
+    return max(high - low, 1e-12)
+
+def _refine(f, x, y, max_points, threshold, min_width):
+    """오차가 큰 구간의 중점을 추가해 곡률이 큰 곳과 정의역 경계를 세분화합니다."""
+    while x.size < max_points:
+        midpoints = (x[:-1] + x[1:]) / 2
+        y_mid = evaluate_curve(f, midpoints)
+        error = np.abs(y_mid - (y[:-1] + y[1:]) / 2)
+
+        # 정의되지 않은 점이 섞인 구간은 경계/점근선을 찾기 위해 세분화
+        undefined = ~(np.isfinite(y[:-1]) & np.isfinite(y[1:]) & np.isfinite(y_mid))
+        defined_somewhere = np.isfinite(y[:-1]) | np.isfinite(y[1:]) | np.isfinite(y_mid)
+        error = np.where(undefined, np.where(defined_somewhere, np.inf, 0.0), error)
+        error[(x[1:] - x[:-1]) < min_width] = 0.0
+
+        candidates = np.flatnonzero(error > threshold)
+        if candidates.size == 0:
+            break
+        budget = max_points - x.size
+        if candidates.size > budget:
+            candidates = candidates[np.argsort(error[candidates])[::-1][:budget]]
+
+        x = np.insert(x, candidates + 1, midpoints[candidates])
+        y = np.insert(y, candidates + 1, y_mid[candidates])
+    return x, y
+
+def _simplify(x, y, threshold):
+    """
+    Ramer-Douglas-Peucker 방식으로 선형 보간 오차가 threshold 이하인 점을 제거합니다.
+    평평하거나 직선인 구간은 양 끝점만 남습니다.
+    """
+    keep = np.zeros(x.size, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, x.size - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        inner = slice(start + 1, end)
+        t = (x[inner] - x[start]) / (x[end] - x[start])
+        error = np.abs(y[inner] - (y[start] + t * (y[end] - y[start])))
+        index = int(np.argmax(error))
+        if error[index] > threshold:
+            split = start + 1 + index
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return x[keep], y[keep]
+
+def adaptive_sample(f, x_range, max_points=DEFAULT_MAX_POINTS, tolerance=DEFAULT_TOLERANCE):
+    """
+    곡선의 모양에 맞춰 점을 배치하는 적응형 샘플링
+
+    거친 균등 격자에서 시작해 중점 오차가 큰 구간(곡률이 크거나 점근선,
+    정의역 경계 근처)을 점 예산까지 세분화한 다음, 선형 보간으로 충분한
+    구간의 점을 제거합니다. 정의되지 않은 점은 결과에서 제외됩니다.
+
+    Args:
+        f (callable): NumPy 배열을 받는 벡터화된 함수
+        x_range (tuple): x축 범위
+        max_points (int): 평가할 최대 점 수
+        tolerance (float): 그래프 높이 대비 허용 오차
+
+    Returns:
+        tuple: (x 배열, y 배열)
+    """
+    x_min, x_max = float(x_range[0]), float(x_range[1])
+    x = np.linspace(x_min, x_max, min(INITIAL_POINTS, max_points))
+    y = evaluate_curve(f, x)
+
+    threshold = tolerance * _vertical_span(y)
+    min_width = (x_max - x_min) * 1e-9
+    x, y = _refine(f, x, y, max_points, threshold, min_width)
+
+    # 정의된 구간별로 단순화
+    finite = np.isfinite(y)
+    runs = np.split(np.arange(x.size), np.flatnonzero(np.diff(finite)) + 1)
+    xs, ys = [], []
+    for run in runs:
+        if finite[run[0]]:
+            run_x, run_y = _simplify(x[run], y[run], threshold)
+            xs.append(run_x)
+            ys.append(run_y)
+    if not xs:
+        return np.array([]), np.array([])
+    return np.concatenate(xs), np.concatenate(ys)
+
+def build_curve(func, kwargs):
+    """
+    카드 함수와 호출 인자로 벡터화된 곡선 함수를 만듭니다.
+
+    카드 모듈의 CURVES 상수(분석 함수 이름 -> curve(파라미터..., x_vals))에서
+    곡선 함수를 찾아 호출 인자 중 같은 이름의 값을 바인딩합니다.
+
+    Returns:
+        tuple: (곡선 함수 또는 None, 기본값이 채워진 인자)
+    """
+    bound = inspect.signature(func).bind(**kwargs)
+    bound.apply_defaults()
+    curve = func.__globals__.get('CURVES', {}).get(func.__name__)
+    if curve is None:
+        return None, bound.arguments
+    params = list(inspect.signature(curve).parameters)[:-1]
+    values = [bound.arguments[param] for param in params]
+    return (lambda x: curve(*values, x)), bound.arguments
+
+def resample_result(func, kwargs, result, max_points=DEFAULT_MAX_POINTS,
+                    tolerance=DEFAULT_TOLERANCE):
+    """
+    카드 함수 결과의 x_values/y_values를 적응형 샘플로 바꿉니다.
+
+    곡선을 알 수 없는 함수이거나 실패한 결과는 그대로 반환합니다.
+    """
+    if not isinstance(result, dict) or 'x_values' not in result or not result.get('success', True):
+        return result
+
+    curve, arguments = build_curve(func, kwargs)
+    if curve is None:
+        return result
+    x_values, y_values = adaptive_sample(curve, arguments['x_range'], max_points, tolerance)
+    return dict(result, x_values=x_values, y_values=y_values, sampling='adaptive')
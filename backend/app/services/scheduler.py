@@ -0,0 +1,175 @@
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+# 우선순위 순서: 슬라이더 등 대화형 요청이 배치/검증 작업보다 먼저 처리됩니다.
+LANES = ('interactive', 'batch')
+
+class SchedulerOverloaded(Exception):
+    """대기열이 가득 차 요청을 받을 수 없을 때 발생합니다."""
+
+    def __init__(self, message, status_code, retry_after):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+class _Job:
+    __slots__ = ('fn', 'client_id', 'lane', 'future', 'enqueued_at')
+
+    def __init__(self, fn, client_id, lane):
+        self.fn = fn
+        self.client_id = client_id
+        self.lane = lane
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+class RunScheduler:
+    """
+    코드 실행 요청 앞단의 승인 제어 및 우선순위 대기열
+
+    - 전체 대기열 크기 제한: 초과 시 503과 재시도 힌트
+    - 클라이언트별 동시 요청 제한: 초과 시 429와 재시도 힌트
+    - 레인 내에서는 클라이언트 간 라운드 로빈으로 공정하게 처리
+    - 대화형 레인 우선, 단 batch_interval번마다 배치 작업 하나를 처리해 기아 방지
+    """
+
+    def __init__(self, workers=2, max_queue=64, max_per_client=4, batch_interval=4,
+                 window=1000):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_per_client = max_per_client
+        self.batch_interval = batch_interval
+
+        self._condition = threading.Condition()
+        self._lanes = {lane: OrderedDict() for lane in LANES}
+        self._queued = 0
+        self._client_load = {}
+        self._running = 0
+        self._interactive_streak = 0
+        self._threads = []
+
+        self._wait_times = {lane: deque(maxlen=window) for lane in LANES}
+        self._service_times = deque(maxlen=window)
+        self._counters = {'submitted': 0, 'completed': 0, 'failed': 0,
+                          'rejected_queue_full': 0, 'rejected_client_limit': 0}
+
+    def submit(self, fn, client_id='anonymous', lane='interactive'):
+        """
+        작업을 대기열에 넣고 결과를 받을 Future를 반환합니다.
+
+        Raises:
+            ValueError: 알 수 없는 레인
+            SchedulerOverloaded: 대기열 또는 클라이언트 한도 초과
+        """
+        if lane not in self._lanes:
+            raise ValueError(f'Unknown lane: {lane}')
+
+        with self._condition:
+            if self._queued >= self.max_queue:
+                self._counters['rejected_queue_full'] += 1
+                raise SchedulerOverloaded('Run queue is full', 503, self._retry_after(self._queued))
+            if self._client_load.get(client_id, 0) >= self.max_per_client:
+                self._counters['rejected_client_limit'] += 1
+                raise SchedulerOverloaded('Too many pending runs for this client', 429,
+                                          self._retry_after(self.max_per_client))
+
+            job = _Job(fn, client_id, lane)
+            self._lanes[lane].setdefault(client_id, deque()).append(job)
+            self._queued += 1
+            self._client_load[client_id] = self._client_load.get(client_id, 0) + 1
+            self._counters['submitted'] += 1
+            self._ensure_workers()
+            self._condition.notify()
+
+        return job.future
+
+    def _retry_after(self, pending):
+        """대기 작업 수와 평균 처리 시간으로 재시도까지의 초를 추정합니다."""
+        if self._service_times:
+            average = sum(self._service_times) / len(self._service_times)
+        else:
+            average = 1.0
+        return max(1, math.ceil(average * pending / self.workers))
+
+    def _ensure_workers(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f'run-worker-{len(self._threads)}',
+                                      daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_lane(self):
+        interactive, batch = self._lanes['interactive'], self._lanes['batch']
+        if batch and (not interactive or self._interactive_streak >= self.batch_interval):
+            self._interactive_streak = 0
+            return 'batch'
+        self._interactive_streak += 1
+        return 'interactive'
+
+    def _pop_job(self):
+        """다음 레인에서 맨 앞 클라이언트의 작업을 꺼내고 클라이언트를 뒤로 보냅니다."""
+        clients = self._lanes[self._next_lane()]
+        client_id, jobs = next(iter(clients.items()))
+        job = jobs.popleft()
+        del clients[client_id]
+        if jobs:
+            clients[client_id] = jobs
+        self._queued -= 1
+        return job
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._queued:
+                    self._condition.wait()
+                job = self._pop_job()
+                self._running += 1
+                self._wait_times[job.lane].append(time.monotonic() - job.enqueued_at)
+
+            started = time.monotonic()
+            succeeded = False
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    job.future.set_result(job.fn())
+                    succeeded = True
+            except BaseException as e:
+                # SystemExit 등도 Future로 전달해 기다리는 요청이 멈추지 않게 함
+                job.future.set_exception(e)
+            finally:
+                with self._condition:
+                    self._running -= 1
+                    self._service_times.append(time.monotonic() - started)
+                    self._counters['completed' if succeeded else 'failed'] += 1
+                    remaining = self._client_load[job.client_id] - 1
+                    if remaining:
+                        self._client_load[job.client_id] = remaining
+                    else:
+                        del self._client_load[job.client_id]
+
+    def metrics(self):
+        """대기열 깊이, 대기 시간 통계, 처리 카운터를 반환합니다."""
+        with self._condition:
+            lanes = {}
+            for lane in LANES:
+                waits = sorted(self._wait_times[lane])
+                lanes[lane] = {
+                    'depth': sum(len(jobs) for jobs in self._lanes[lane].values()),
+                    'clients': len(self._lanes[lane]),
+                    'wait_time': {
+                        'count': len(waits),
+                        'mean': sum(waits) / len(waits) if waits else 0.0,
+                        'p95': waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+                        'max': waits[-1] if waits else 0.0
+                    }
+                }
+            return {
+                'queue_depth': self._queued,
+                'running': self._running,
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'max_per_client': self.max_per_client,
+                'lanes': lanes,
+                **self._counters
+            }
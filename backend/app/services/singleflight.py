@@ -0,0 +1,74 @@
+import threading
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    같은 키의 동시 계산을 하나로 합치는 요청 병합기 (스레드 안전)
+
+    진행 중인 계산이 있는 키로 들어온 호출은 새로 계산하지 않고 그 계산이
+    끝나기를 기다려 같은 결과(또는 같은 예외)를 받습니다. 결과는 계산이 끝나면
+    버려지므로 캐시가 아니며, 공유된 결과는 호출자가 변경하면 안 됩니다.
+
+    키는 튜플이고 첫 번째 원소(그룹 이름)별로 병합 카운터를 집계합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._counters = {}
+
+    def do(self, key, fn):
+        """
+        key로 진행 중인 계산이 없으면 fn()을 실행하고, 있으면 그 결과를 기다립니다.
+
+        Returns:
+            fn()의 반환값 (병합된 호출은 먼저 시작한 호출과 같은 객체)
+        """
+        with self._lock:
+            counters = self._counters.setdefault(key[0], {'calls': 0, 'executions': 0, 'coalesced': 0})
+            counters['calls'] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                counters['coalesced'] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                counters['executions'] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            # 기다리던 호출이 None을 결과로 받지 않도록 BaseException도 전달
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def metrics(self):
+        """그룹별 호출 수, 실제 실행 수, 병합된 호출 수와 병합 비율"""
+        with self._lock:
+            groups = {
+                group: dict(counters, coalescing_ratio=counters['coalesced'] / counters['calls'])
+                for group, counters in self._counters.items()
+            }
+            return {'in_flight': len(self._calls), 'groups': groups}
+
+# 카드 로더, 코드 실행, 카드 함수 엔드포인트가 함께 쓰는 프로세스 전역 인스턴스
+single_flight = SingleFlight()
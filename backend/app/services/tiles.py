@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from ..config import Config
+from .card_functions import call_function, load_card_module
+from .catalog import iter_card_dirs, load_metadata
+
+# 타일 포맷이 바뀌면 올려서 기존 타일을 무효화합니다.
+TILE_FORMAT_VERSION = 1
+CURVE_DTYPE = '<f4'
+PROPERTY_DTYPE = '<f8'
+
+_tile_cache = {}
+_tile_lock = threading.Lock()
+
+class TileError(Exception):
+    """타일 조회 오류 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def load_parameter_grid(card_dir):
+    """카드 metadata.json의 parameter_grid 선언을 반환합니다. 없으면 None."""
+    return load_metadata(card_dir).get('parameter_grid')
+
+def grid_axes(grid):
+    """파라미터 이름 -> 격자 값 배열 (선언 순서 유지)"""
+    axes = {}
+    for name, spec in grid['parameters'].items():
+        values = np.arange(spec['min'], spec['max'] + spec['step'] / 2, spec['step'])
+        axes[name] = np.round(values, 10)
+    return axes
+
+def tile_version(card_dir, grid):
+    """카드 code.py, 격자 선언, 타일 포맷으로 타일 버전을 계산합니다."""
+    digest = hashlib.sha256()
+    digest.update(f'v{TILE_FORMAT_VERSION}\0'.encode('utf-8'))
+    digest.update((Path(card_dir) / 'code.py').read_bytes())
+    digest.update(json.dumps(grid, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def _tile_dtype(axes, properties, num_points):
+    fields = [(name, PROPERTY_DTYPE) for name in axes]
+    fields += [(name, PROPERTY_DTYPE) for name in properties]
+    fields.append(('curve', CURVE_DTYPE, (num_points,)))
+    return np.dtype(fields)
+
+def build_card_tiles(card_dir, tiles_dir=Config.TILES_DIR):
+    """
+    카드의 배치 분석 함수를 선언된 파라미터 격자 전체에 대해 한 번 호출하고
+    타일(파라미터, 스칼라 속성, 곡선)을 구조화 배열 .npy로 저장합니다.
+
+    Returns:
+        dict: 저장된 타일 메타데이터 (격자 선언이 없으면 None)
+    """
+    card_dir = Path(card_dir)
+    grid = load_parameter_grid(card_dir)
+    if grid is None:
+        return None
+
+    card_id = load_metadata(card_dir)['id']
+    version = tile_version(card_dir, grid)
+    axes = grid_axes(grid)
+    properties = grid.get('properties', [])
+    num_points = grid.get('num_points', 200)
+    x_range = grid.get('x_range', [-10, 10])
+
+    # 격자의 모든 조합 (C 순서: 마지막 파라미터가 가장 빠르게 변함)
+    mesh = np.meshgrid(*axes.values(), indexing='ij')
+    kwargs = {name: values.ravel() for name, values in zip(axes, mesh)}
+    result = call_function(load_card_module(card_dir), grid['batch_function'],
+                           dict(kwargs, x_range=tuple(x_range), num_points=num_points))
+    if not result.get('success', True):
+        raise RuntimeError(f"{card_id}: {result.get('error')}")
+
+    tiles = np.zeros(result['count'], dtype=_tile_dtype(axes, properties, num_points))
+    for name, values in kwargs.items():
+        tiles[name] = values
+    for name in properties:
+        tiles[name] = result[name]
+    tiles['curve'] = result['y_values']
+
+    meta = {
+        'card_id': card_id,
+        'version': version,
+        'format_version': TILE_FORMAT_VERSION,
+        'function': grid['function'],
+        'parameters': {name: values.tolist() for name, values in axes.items()},
+        'properties': properties,
+        'x_range': list(x_range),
+        'num_points': num_points,
+        'count': int(tiles.size),
+        'bytes': int(tiles.nbytes)
+    }
+
+    card_tiles_dir = Path(tiles_dir) / card_id
+    card_tiles_dir.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(dir=card_tiles_dir, prefix='.build-'))
+    try:
+        np.save(staging_dir / 'tiles.npy', tiles)
+        with open(staging_dir / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+        target_dir = card_tiles_dir / version
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+        os.replace(staging_dir, target_dir)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    return meta
+
+def build_all_tiles(data_dir=Config.DATA_DIR, tiles_dir=Config.TILES_DIR):
+    """parameter_grid를 선언한 모든 카드의 타일을 빌드합니다."""
+    metas = (build_card_tiles(card_dir, tiles_dir) for card_dir in iter_card_dirs(data_dir))
+    return [meta for meta in metas if meta is not None]
+
+def load_card_tiles(card_dir, tiles_dir=Config.TILES_DIR):
+    """
+    현재 코드와 격자 선언에 맞는 타일을 메모리 맵으로 엽니다.
+
+    열린 타일은 워커 프로세스 안에서 캐시되며, 타일이 없거나 오래된 경우
+    None을 반환하므로 호출자는 함수 호출로 대체해야 합니다.
+
+    Returns:
+        tuple: (메타데이터, 메모리 맵 구조화 배열) 또는 None
+    """
+    card_dir = Path(card_dir)
+    grid = load_parameter_grid(card_dir)
+    if grid is None:
+        return None
+
+    tile_dir = Path(tiles_dir) / load_metadata(card_dir)['id'] / tile_version(card_dir, grid)
+    key = str(tile_dir)
+    cached = _tile_cache.get(key)
+    if cached is not None:
+        return cached
+
+    with _tile_lock:
+        if key not in _tile_cache:
+            try:
+                with open(tile_dir / 'meta.json', 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                tiles = np.load(tile_dir / 'tiles.npy', mmap_mode='r')
+            except (OSError, ValueError):
+                return None
+            _tile_cache[key] = (meta, tiles)
+        return _tile_cache[key]
+
+def lookup_tile(meta, tiles, params):
+    """
+    요청 파라미터를 가장 가까운 격자 값으로 맞추고 해당 타일을 반환합니다.
+
+    격자 범위 밖의 값은 끝 값으로 맞춰집니다.
+
+    Args:
+        meta (dict): 타일 메타데이터
+        tiles (np.ndarray): 구조화 배열 (메모리 맵)
+        params (dict): 파라미터 이름 -> 값 (없으면 격자 가운데 값)
+
+    Raises:
+        TileError: 숫자가 아닌 파라미터
+    """
+    indices = []
+    snapped = {}
+    for name, values in meta['parameters'].items():
+        values = np.asarray(values)
+        if name in params:
+            try:
+                value = float(params[name])
+            except (TypeError, ValueError):
+                raise TileError(f'Parameter {name} must be a number', 400)
+            index = int(np.argmin(np.abs(values - value)))
+        else:
+            index = len(values) // 2
+        indices.append(index)
+        snapped[name] = float(values[index])
+
+    shape = tuple(len(values) for values in meta['parameters'].values())
+    tile = tiles[np.ravel_multi_index(indices, shape)]
+
+    result = {
+        'function': meta['function'],
+        'version': meta['version'],
+        'parameters': snapped,
+        'snapped': any(name in params and float(params[name]) != value
+                       for name, value in snapped.items()),
+        'x_values': np.linspace(*meta['x_range'], meta['num_points']),
+        'y_values': np.asarray(tile['curve'])
+    }
+    for name in meta['properties']:
+        result[name] = float(tile[name])
+    return result
@@ -0,0 +1,109 @@
+import base64
+import json
+import math
+
+import numpy as np
+from flask import Response
+
+try:
+    import msgpack
+except ImportError:  # MessagePack 응답은 선택 기능
+    msgpack = None
+
+FORMATS = ('json', 'base64', 'msgpack')
+FLOAT_DTYPES = {'float32': '<f4', 'float64': '<f8'}
+MSGPACK_MIMETYPES = ('application/msgpack', 'application/x-msgpack')
+
+class TransportError(Exception):
+    """지원하지 않는 응답 형식 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def to_jsonable(value):
+    """NumPy 값, 튜플, 비유한 실수를 JSON 호환 값으로 변환합니다."""
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if hasattr(value, 'tolist'):  # numpy.ndarray, numpy scalar
+        return to_jsonable(value.tolist())
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+def encode_ndarray(array, float_dtype='<f8', raw=False):
+    """
+    NumPy 배열을 리틀엔디언 바이너리 블록으로 인코딩합니다.
+
+    Python 리스트를 거치지 않고 배열 버퍼를 그대로 사용합니다.
+    실수 배열은 float_dtype으로 변환하고, NaN은 그대로 유지됩니다.
+
+    Args:
+        array (np.ndarray): 인코딩할 배열
+        float_dtype (str): 실수 배열의 전송 dtype ('<f4' 또는 '<f8')
+        raw (bool): True면 bytes 그대로(MessagePack), False면 base64 문자열
+    """
+    if array.dtype.kind == 'f':
+        dtype = np.dtype(float_dtype)
+    elif array.dtype.kind == 'b':
+        dtype = np.dtype('u1')
+    elif array.dtype.kind in 'iu':
+        dtype = array.dtype.newbyteorder('<')
+    else:
+        return to_jsonable(array)
+
+    data = np.ascontiguousarray(array, dtype=dtype).tobytes()
+    return {
+        'type': 'ndarray',
+        'dtype': dtype.str,
+        'shape': list(array.shape),
+        'data': data if raw else base64.b64encode(data).decode('ascii')
+    }
+
+def encode_arrays(value, float_dtype='<f8', raw=False):
+    """결과 구조 안의 NumPy 배열을 바이너리 블록으로, 나머지는 JSON 호환 값으로 바꿉니다."""
+    if isinstance(value, np.ndarray):
+        return encode_ndarray(value, float_dtype, raw)
+    if isinstance(value, dict):
+        return {str(key): encode_arrays(item, float_dtype, raw) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_arrays(item, float_dtype, raw) for item in value]
+    return to_jsonable(value)
+
+def negotiate(request):
+    """
+    요청에서 응답 형식과 실수 dtype을 결정합니다.
+
+    `?format=json|base64|msgpack` 쿼리가 우선이고, 없으면 Accept 헤더가
+    MessagePack일 때 msgpack, 그 외에는 json(리스트 형태)입니다.
+    `?dtype=float32|float64`로 배열 정밀도를 고릅니다.
+    """
+    fmt = request.args.get('format')
+    if fmt is None:
+        accept = request.accept_mimetypes
+        best = accept.best_match(('application/json',) + MSGPACK_MIMETYPES)
+        fmt = 'msgpack' if best in MSGPACK_MIMETYPES else 'json'
+    if fmt not in FORMATS:
+        raise TransportError(f'Unsupported format: {fmt}', 400)
+    if fmt == 'msgpack' and msgpack is None:
+        raise TransportError('MessagePack is not available on this server', 406)
+
+    dtype = request.args.get('dtype', 'float64')
+    if dtype not in FLOAT_DTYPES:
+        raise TransportError(f'Unsupported dtype: {dtype}', 400)
+    return fmt, FLOAT_DTYPES[dtype]
+
+def make_response(result, request):
+    """협상된 형식(JSON 리스트, base64 배열, MessagePack)으로 결과 응답을 만듭니다."""
+    fmt, float_dtype = negotiate(request)
+
+    if fmt == 'msgpack':
+        body = msgpack.packb(encode_arrays(result, float_dtype, raw=True), use_bin_type=True)
+        return Response(body, mimetype='application/msgpack')
+
+    payload = to_jsonable(result) if fmt == 'json' else encode_arrays(result, float_dtype)
+    return Response(json.dumps(payload, ensure_ascii=False), mimetype='application/json')
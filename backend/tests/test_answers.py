@@ -0,0 +1,85 @@
+import pytest
+from app import create_app
+
+DOMAIN_RANGE_CARD = 'math-domain-range-001'
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+def _check(client, **body):
+    response = client.post(f'/api/cards/{DOMAIN_RANGE_CARD}/answers/check', json=body)
+    assert response.status_code == 200
+    return response.get_json()
+
+def test_single_submission(client):
+    """같은 함수의 다른 표현을 정답으로 판정하는지 테스트"""
+    data = _check(client, reference='x**2 - 1', submission='(x - 1)*(x + 1)')
+    assert data['results'][0]['equivalent']
+
+    result = _check(client, reference='x**2 - 1', submission='x**2 + 1')['results'][0]
+    assert result['status'] == 'not_equivalent'
+    assert result['counterexample'] is not None
+
+def test_batch_submissions(client):
+    """반 전체 제출을 순서대로 판정하고 잘못된 수식은 invalid로 표시하는지 테스트"""
+    submissions = ['x*x - 1', 'abs(x)**2 - 1', 'x**2 - 1.001', '__import__("os")', 'x*x - 1']
+    data = _check(client, reference='x**2 - 1', submissions=submissions)
+    assert [result['submission'] for result in data['results']] == submissions
+    assert [result['status'] for result in data['results']] == [
+        'equivalent', 'equivalent', 'not_equivalent', 'invalid', 'equivalent'
+    ]
+    assert data['equivalent_count'] == 3
+
+def test_domain_aware_comparison(client):
+    """정의역이 다른 제출은 domain_mismatch이고, 정의역 확인을 끄면 공통 정의역만 비교하는지 테스트"""
+    data = _check(client, reference='sqrt(x)', submissions=['x**0.5', 'sqrt(abs(x))'])
+    assert [result['status'] for result in data['results']] == ['equivalent', 'domain_mismatch']
+
+    result = _check(client, reference='log(x**2)', submission='2*log(x)')['results'][0]
+    assert result['status'] == 'domain_mismatch'
+    result = _check(client, reference='log(x**2)', submission='2*log(x)', check_domain=False)['results'][0]
+    assert result['equivalent']
+
+def test_no_symbolic_simplification(client):
+    """sympy가 x로 단순화하는 식도 입력 그대로의 정의역으로 비교하는지 테스트"""
+    submissions = ['sqrt(x)**2', 'x**2/x', 'exp(log(x))', 'log(exp(x))']
+    data = _check(client, reference='x', submissions=submissions)
+    assert [result['status'] for result in data['results']] == [
+        'domain_mismatch', 'domain_mismatch', 'domain_mismatch', 'equivalent'
+    ]
+    assert _check(client, reference='1', submission='x/x')['results'][0]['status'] == 'domain_mismatch'
+
+def test_tolerance(client):
+    """허용 오차 안의 차이는 같은 것으로 판정하는지 테스트"""
+    assert not _check(client, reference='x', submission='x + 1e-4')['results'][0]['equivalent']
+    assert _check(client, reference='x', submission='x + 1e-4', atol=1e-3)['results'][0]['equivalent']
+
+def test_invalid_requests(client):
+    """잘못된 정답 수식과 없는 카드는 거절하는지 테스트"""
+    response = client.post(f'/api/cards/{DOMAIN_RANGE_CARD}/answers/check',
+                           json={'reference': 'x +', 'submission': 'x'})
+    assert response.status_code == 400
+    response = client.post('/api/cards/unknown/answers/check', json={'reference': 'x', 'submission': 'x'})
+    assert response.status_code == 404
+
+@pytest.mark.parametrize('x_range', [[-1e308, 1e308], [0, float('inf')], [1, 1], [2, 1], ['a', 1], [0, 1e7]])
+def test_invalid_x_range(client, x_range):
+    """무한하거나 너무 넓거나 뒤집힌 표본 구간은 400으로 거절하는지 테스트"""
+    response = client.post(f'/api/cards/{DOMAIN_RANGE_CARD}/answers/check',
+                           json={'reference': 'x', 'submission': 'x', 'x_range': x_range})
+    assert response.status_code == 400
+
+def test_reference_cache_ignores_card(client):
+    """정답 격자 캐시가 카드와 무관하게 공유되는지 테스트"""
+    from app.services.answers import compile_reference
+
+    compile_reference.cache_clear()
+    for card_id in (DOMAIN_RANGE_CARD, 'math-linear-function-001'):
+        response = client.post(f'/api/cards/{card_id}/answers/check', json={'reference': 'x + 2', 'submission': 'x + 2'})
+        assert response.status_code == 200
+    assert compile_reference.cache_info().hits == 1
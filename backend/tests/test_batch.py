@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from app import create_app
+from app.services.card_loader import load_card
+from app.services.catalog import find_card_dir
+
+EXPONENTIAL_CARD = 'math-exponential-logarithmic-001'
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+@pytest.fixture
+def card():
+    return load_card(find_card_dir(EXPONENTIAL_CARD)).module
+
+def test_logarithmic_curve_masks_domain(card):
+    """밑 변환으로 평가하고 정의역 밖과 잘못된 밑수는 NaN인지 테스트"""
+    x = np.array([-2.0, -1.0, 0.0, 3.0])
+    y = card.logarithmic_curve(2, 1, 1, 0, x)
+    assert np.isnan(y[:2]).all()
+    assert np.allclose(y[2:], [0.0, 2.0])
+    assert np.isnan(card.logarithmic_curve(1, 1, 0, 0, x)).all()
+
+def test_batch_matches_single_analysis(card):
+    """배치 결과가 파라미터별 단일 분석과 같은지 테스트"""
+    params = [(2, 1, 0, 0), (0.5, -2, 0, 0), (10, 1, 0, -1), (2, 1, -3, 0)]
+    a, b, c, d = (list(column) for column in zip(*params))
+    batch = card.analyze_logarithmic_batch(a, b, c, d)
+    assert batch['count'] == 4
+    assert batch['y_values'].shape == (4, 1000)
+    for i, args in enumerate(params):
+        single = card.analyze_logarithmic_function(*args)
+        row = batch['y_values'][i]
+        assert np.allclose(row[~np.isnan(row)], single['y_values'])
+        assert batch['function_type'][i] == single['function_type']
+        expected = single['x_intercept']
+        assert np.isnan(batch['x_intercept'][i]) if expected is None \
+            else np.isclose(batch['x_intercept'][i], expected)
+
+def test_invalid_base_rows(card):
+    """단일 분석은 잘못된 밑수를 실패로, 배치 분석은 그 행만 NaN과 valid_base로 표시하는지 테스트"""
+    for base in (1, 0, -2):
+        result = card.analyze_logarithmic_function(base, 1)
+        assert not result['success']
+        assert 'Invalid base' in result['error']
+    
+    for batch, invalid in ((card.analyze_logarithmic_batch([2, 1, -2], 1, c=1), [False, True, True]),
+                           (card.analyze_exponential_batch([2, 1, -2], 1), [False, False, True])):
+        assert batch['success']
+        assert list(~batch['valid_base']) == invalid
+        assert [label == 'invalid base' for label in batch['function_type']] == invalid
+        assert list(np.isnan(batch['y_values']).all(axis=1)) == invalid
+        assert list(np.isnan(batch['y_intercept'])) == invalid
+
+def test_exponential_batch_endpoint(client):
+    """배치 함수를 RPC로 호출하는 테스트"""
+    response = client.post(
+        f'/api/cards/{EXPONENTIAL_CARD}/functions/analyze_exponential_batch',
+        json={'a': [2, 0.5, 1], 'b': 1, 'd': -1, 'num_points': 5}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['function_type'] == ['exponential growth', 'exponential decay', 'constant']
+    assert len(data['y_values']) == 3 and len(data['y_values'][0]) == 5
+    assert data['x_intercept'][:2] == [0.0, 0.0]
+    assert data['x_intercept'][2] is None
+
+def test_quadratic_batch_stable_roots():
+    """상쇄 오차 없이 근을 구하고 단일 분석과 일치하는지 테스트"""
+    card = load_card(find_card_dir('math-quadratic-function-complete-001')).module
+    batch = card.analyze_quadratic_batch([1, 1, 1, 2, 0], [1e8, 2, -4, -8, 3], [1, -3, 4, 6, 1])
+    assert np.isclose(batch['root2'][0], -1e-8, rtol=1e-12)
+    assert batch['root_count'].tolist() == [2, 2, 1, 2, 0]
+    assert np.isnan(batch['vertex_x'][4])
+
+    single = card.analyze_quadratic_function(2, -8, 6)
+    assert single['x_intercepts'] == [batch['root1'][3], batch['root2'][3]]
+    # 단일 분석도 같은 안정적인 근을 오름차순으로 반환
+    assert card.analyze_quadratic_function(1, 1e8, 1)['x_intercepts'] == [batch['root1'][0], batch['root2'][0]]
+    assert np.allclose((batch['vertex_x'][3], batch['vertex_y'][3]), single['vertex'])
+    assert np.allclose(batch['y_values'][3], single['y_values'])
+
+def test_linear_batch_endpoint(client):
+    """일차함수 배치를 RPC로 호출하는 테스트"""
+    response = client.post(
+        '/api/cards/math-linear-function-001/functions/analyze_linear_batch',
+        json={'m': [2, 0, -1], 'b': 4, 'num_points': 3}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['x_intercept'] == [-2.0, None, 4.0]
+    assert data['slope_type'] == ['increasing', 'constant', 'decreasing']
+    assert data['y_values'][0] == [-16.0, 4.0, 24.0]
+
+def test_equation_batch_matches_scalar_solvers(card):
+    """배치 방정식 풀이가 단일 풀이와 같은 해와 상태를 내는지 테스트"""
+    rng = np.random.default_rng(0)
+    a = rng.integers(-3, 4, 200).astype(float)
+    b = rng.choice([-1.0, 0.0, 0.5, 1.0, 2.0, 10.0], 200)
+    c = rng.integers(-5, 6, 200).astype(float)
+    target = rng.integers(-5, 20, 200).astype(float)
+
+    for batch_solver, scalar_solver in (
+        (card.solve_exponential_equations, card.solve_exponential_equation),
+        (card.solve_logarithmic_equations, card.solve_logarithmic_equation),
+    ):
+        batch = batch_solver(a, b, c, target)
+        for i in range(200):
+            single = scalar_solver(a[i], b[i], c[i], target[i])
+            if single['success'] and single['solutions']:
+                assert batch['status'][i] == card.STATUS_SOLVED
+                assert np.isclose(batch['solutions'][i], single['solutions'][0])
+            else:
+                assert batch['status'][i] != card.STATUS_SOLVED
+                assert np.isnan(batch['solutions'][i])
+
+    status = card.solve_exponential_equations([1, 1, 0], [2, 1, 2], 0, 8)['status']
+    assert status.tolist() == [card.STATUS_SOLVED, card.STATUS_INVALID_BASE, card.STATUS_NO_SOLUTION]
@@ -0,0 +1,47 @@
+from app.services.card_loader import load_card, split_card_source
+from app.services.catalog import find_card_dir
+
+CARD_CODE = '''"""예제 카드"""
+import math
+
+SCALE = 2
+
+def double(x):
+    return x * SCALE
+
+examples = [1, 2, 3]
+for value in examples:
+    print(double(value))
+
+if __name__ == "__main__":
+    print("main")
+'''
+
+def test_split_card_source():
+    """정의와 데모 코드 분리 테스트"""
+    definitions, demo, demo_source = split_card_source(CARD_CODE)
+    namespace = {}
+    exec(definitions, namespace)
+    assert namespace['double'](3) == 6
+    assert 'examples' not in namespace
+    assert demo_source.startswith('examples = [1, 2, 3]')
+
+def test_load_card_headless(tmp_path):
+    """데모를 실행하지 않고 로드하고, 데모는 따로 실행되는지 테스트"""
+    (tmp_path / 'code.py').write_text(CARD_CODE, encoding='utf-8')
+    card = load_card(tmp_path)
+    assert card.module.double(5) == 10
+    assert not hasattr(card.module, 'examples')
+    assert load_card(tmp_path) is card
+    
+    namespace, output = card.run_demo()
+    assert output == '2\n4\n6\nmain\n'
+    assert namespace['examples'] == [1, 2, 3]
+    assert not hasattr(card.module, 'examples')
+
+def test_load_catalog_card_headless():
+    """실제 카드를 데모 없이 로드하는 테스트"""
+    card = load_card(find_card_dir('math-domain-range-001'))
+    assert callable(card.module.analyze_function)
+    assert not hasattr(card.module, 'functions')
+    assert 'plt.show()' in card.demo_source
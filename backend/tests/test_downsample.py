@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from app import create_app
+from app.services.downsample import decimate, lttb, minmax
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+def test_minmax_preserves_extrema():
+    """픽셀별 최솟값/최댓값 유지 테스트"""
+    x = np.linspace(0, 1, 10000)
+    y = np.sin(40 * x)
+    y[5000] = 50.0  # 좁은 스파이크
+    dx, dy = minmax(x, y, 0.0, 1.0, 100)
+    assert len(dx) <= 200
+    assert dy.max() == 50.0
+    assert dy.min() == pytest.approx(y.min())
+
+def test_lttb_keeps_endpoints():
+    """LTTB가 지정한 점 수와 양 끝점을 유지하는지 테스트"""
+    x = np.linspace(0, 10, 5000)
+    y = x**2
+    dx, dy = lttb(x, y, 50)
+    assert len(dx) == 50
+    assert dx[0] == 0 and dx[-1] == 10
+    assert np.all(np.diff(dx) > 0)
+
+def test_decimate_splits_at_gaps():
+    """정의되지 않은 점에서 구간이 나뉘는지 테스트"""
+    x = np.linspace(-1, 1, 2001)
+    with np.errstate(divide='ignore'):
+        y = 1 / x
+    dx, dy = decimate(x, y, -1, 1, 50)
+    assert np.all(np.isfinite(dy))
+    assert dy.max() > 100 and dy.min() < -100
+
+def test_invoke_function_viewport(client):
+    """뷰포트에 맞춰 카드 함수 결과를 줄이는 테스트"""
+    response = client.post(
+        '/api/cards/math-quadratic-function-complete-001/functions/analyze_quadratic_function'
+        '?x_min=0&x_max=2&width=100',
+        json={'a': 1, 'b': 0, 'c': 0}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert len(data['x_values']) <= 200
+    assert min(data['x_values']) == 0 and max(data['x_values']) == 2
+    assert data['viewport']['width'] == 100
+    # 뷰포트 범위로 한 번 계산한 카드 결과의 점을 그대로 줄임
+    assert np.isin(data['x_values'], np.linspace(0, 2, 1000)).all()
+    
+    bad = client.post(
+        '/api/cards/math-quadratic-function-complete-001/functions/analyze_quadratic_function'
+        '?x_min=2&x_max=0&width=100',
+        json={'a': 1, 'b': 0, 'c': 0}
+    )
+    assert bad.status_code == 400
+
+def test_viewport_sets_num_points_and_skips_small_results(client):
+    """num_points를 받는 함수는 화면 너비로 계산하고, 목표보다 적은 결과는 그대로 두는지 테스트"""
+    response = client.post(
+        '/api/cards/math-quadratic-function-complete-001/functions/analyze_quadratic_batch'
+        '?x_min=-1&x_max=1&width=150',
+        json={'a': [1, 2], 'b': 0, 'c': 0}
+    )
+    assert response.status_code == 200
+    assert len(response.get_json()['y_values'][0]) == 300
+    
+    response = client.post(
+        '/api/cards/math-quadratic-function-complete-001/functions/analyze_quadratic_function'
+        '?x_min=0&x_max=2&width=600',
+        json={'a': 1, 'b': 0, 'c': 0}
+    )
+    data = response.get_json()
+    assert len(data['x_values']) == 1000
+    assert data['viewport']['width'] == 600
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from app import create_app
+from app.services.card_loader import load_card
+from app.services.catalog import find_card_dir
+
+DOMAIN_RANGE_CARD = 'math-domain-range-001'
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+@pytest.fixture
+def card():
+    return load_card(find_card_dir(DOMAIN_RANGE_CARD)).module
+
+def test_compile_expression_cached_by_structure(card):
+    """같은 구조의 식은 공백 등 표기가 달라도 한 번만 컴파일되는지 테스트"""
+    _, first = card.compile_expression('x**2 + 1')
+    _, second = card.compile_expression(' x ** 2+1')
+    assert first is second
+
+def test_compile_expression_keeps_input_domain(card):
+    """단순화 없이 컴파일해 입력 그대로의 정의역과 tan 점근선을 유지하는지 테스트"""
+    x = np.array([-1.0, 0.0, 1.0, np.pi / 2])
+    assert np.isnan(card.evaluate_expression('sqrt(x)**2', x)[0])
+    assert np.isnan(card.evaluate_expression('1/(1/x)', x)[1])
+    assert np.isnan(card.evaluate_expression('exp(-1/x**2)', x)[1])
+    assert np.isnan(card.evaluate_expression('tan(x)', x)[3])
+    assert card.analyze_function('sqrt(x)**2')['domain'] == '[0, ∞)'
+    assert card.analyze_function('x**2/x')['domain'] == '(-∞, 0) ∪ (0, ∞)'
+
+def test_compile_expression_rejects_unsafe_input(card):
+    """화이트리스트 밖의 수식 요소를 거부하는지 테스트"""
+    for expr in ('__import__("os")', 'x.real', '[x]', 'x if x else 1', '9**9**9'):
+        with pytest.raises(ValueError):
+            card.compile_expression(expr)
+
+def test_compile_expression_rejects_nested_powers(card):
+    """중첩된 숫자 거듭제곱처럼 결과가 거대한 식을 계산 전에 거부하는지 테스트"""
+    for expr in ('(((99**99)**99)**99)**99', '(1/99**99)**99', 'exp(99)**99'):
+        with pytest.raises(ValueError):
+            card.parse_expression(expr)
+    _, compiled = card.compile_expression('(2*pi)**10 * x')
+    assert np.isclose(compiled(1.0), (2 * np.pi)**10)
+
+def test_analyze_function_masks_undefined_points(card):
+    """정의되지 않는 점을 NaN 마스크로 한 번에 제거하는지 테스트"""
+    result = card.analyze_function('sqrt(x) + log(x)')
+    assert result['success']
+    assert np.all(result['x_values'] > 0)
+    assert np.allclose(result['y_values'], np.sqrt(result['x_values']) + np.log(result['x_values']))
+
+    result = card.analyze_function('open("x")')
+    assert not result['success']
+
+def test_analyze_function_adaptive(client):
+    """사용자 수식도 적응형 샘플링을 지원하는지 테스트"""
+    response = client.post(
+        f'/api/cards/{DOMAIN_RANGE_CARD}/functions/analyze_function?sampling=adaptive',
+        json={'func_expr': '1/x'}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['sampling'] == 'adaptive'
+    assert min(abs(x) for x in data['x_values']) < 0.01
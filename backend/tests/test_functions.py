@@ -0,0 +1,96 @@
+import base64
+
+import numpy as np
+import pytest
+from app import create_app
+
+QUADRATIC_CARD = 'math-quadratic-function-complete-001'
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+def test_list_functions(client):
+    """카드 공개 함수 목록 조회 테스트"""
+    response = client.get(f'/api/cards/{QUADRATIC_CARD}/functions')
+    assert response.status_code == 200
+    functions = {f['name']: f for f in response.get_json()['functions']}
+    assert 'analyze_quadratic_function' in functions
+    assert 'create_quadratic_function_examples' not in functions
+    params = functions['analyze_quadratic_function']['parameters']
+    assert [p['name'] for p in params] == ['a', 'b', 'c', 'x_range']
+    assert params[3]['default'] == [-10, 10]
+
+def test_invoke_function(client):
+    """카드 함수 호출 테스트"""
+    response = client.post(
+        f'/api/cards/{QUADRATIC_CARD}/functions/analyze_quadratic_function',
+        json={'a': 1, 'b': -3, 'c': 2}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success']
+    assert sorted(data['x_intercepts']) == [1.0, 2.0]
+    assert data['vertex'] == [1.5, -0.25]
+
+def test_invoke_function_errors(client):
+    """알 수 없는 함수와 잘못된 인자 테스트"""
+    url = f'/api/cards/{QUADRATIC_CARD}/functions'
+    assert client.post(f'{url}/create_quadratic_function_examples', json={}).status_code == 404
+    assert client.post(f'{url}/analyze_quadratic_function', json={'a': 1}).status_code == 400
+    assert client.get('/api/cards/unknown-card/functions').status_code == 404
+
+def test_invoke_function_binary_arrays(client):
+    """배열을 base64 바이너리 블록으로 전송하는 테스트"""
+    response = client.post(
+        f'/api/cards/{QUADRATIC_CARD}/functions/analyze_quadratic_function?format=base64&dtype=float32',
+        json={'a': 1, 'b': 0, 'c': 0}
+    )
+    assert response.status_code == 200
+    y_values = response.get_json()['y_values']
+    assert y_values['type'] == 'ndarray'
+    assert y_values['dtype'] == '<f4'
+    assert y_values['shape'] == [1000]
+    
+    array = np.frombuffer(base64.b64decode(y_values['data']), dtype='<f4')
+    assert array[0] == pytest.approx(100.0)
+
+def test_invoke_function_msgpack(client):
+    """MessagePack 응답 테스트"""
+    msgpack = pytest.importorskip('msgpack')
+    response = client.post(
+        f'/api/cards/{QUADRATIC_CARD}/functions/analyze_quadratic_function',
+        json={'a': 1, 'b': 0, 'c': 0},
+        headers={'Accept': 'application/msgpack'}
+    )
+    assert response.mimetype == 'application/msgpack'
+    data = msgpack.unpackb(response.data)
+    x_values = np.frombuffer(data['x_values']['data'], dtype=data['x_values']['dtype'])
+    assert x_values[-1] == 10.0
+
+def test_invoke_function_bounds_arguments(client):
+    """시그니처에 없는 인자는 거절하고 크기 인자는 서버 상한으로 줄이는지 테스트"""
+    url = f'/api/cards/{QUADRATIC_CARD}/functions'
+    response = client.post(f'{url}/analyze_quadratic_function', json={'a': 1, 'b': 0, 'c': 0, 'debug': True})
+    assert response.status_code == 400
+    assert 'debug' in response.get_json()['error']
+    
+    response = client.post(f'{url}/analyze_quadratic_batch', json={'a': [1, 2], 'b': 0, 'c': 0, 'num_points': 10 ** 9})
+    assert response.status_code == 200
+    assert len(response.get_json()['y_values'][0]) == 10000
+    
+    assert client.post(f'{url}/analyze_quadratic_batch', json={'a': 1, 'b': 0, 'c': 0, 'num_points': 'many'}).status_code == 400
+    assert client.post(f'{url}/analyze_quadratic_batch', json={'a': list(range(20000)), 'b': 0, 'c': 0}).status_code == 400
+
+def test_invoke_function_timeout(client):
+    """대기열 작업자에서 실행된 호출이 제한 시간을 넘으면 504를 반환하는지 테스트"""
+    client.application.config['CARD_FUNCTION_TIMEOUT'] = 0
+    response = client.post(
+        f'/api/cards/{QUADRATIC_CARD}/functions/analyze_quadratic_batch',
+        json={'a': list(range(1, 1001)), 'b': 0, 'c': 0, 'num_points': 1000}
+    )
+    assert response.status_code == 504
@@ -0,0 +1,277 @@
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+from app.services.card_loader import load_card
+from app.services.catalog import find_card_dir
+
+INEQUALITIES_CARD = 'math-inequalities-001'
+
+@pytest.fixture
+def card():
+    return load_card(find_card_dir(INEQUALITIES_CARD)).module
+
+def test_quadratic_inequality_closed_form(card):
+    """닫힌 형태 풀이가 부등호의 엄격성과 a의 부호를 반영하는지 테스트"""
+    assert card.solve_quadratic_inequality(1, -3, 2, '<')['solution'] == "1.00 < x < 2.00"
+    assert card.solve_quadratic_inequality(-1, 0, 4, '<=')['solution'] == "x ≤ -2.00 또는 x ≥ 2.00"
+    assert card.solve_quadratic_inequality(1, -2, 1, '>=')['solution'] == "모든 실수"
+    assert card.solve_quadratic_inequality(1, -2, 1, '<=')['solution'] == "x = 1.00"
+
+    roots = card.solve_quadratic_inequality(1, 1e8, 1, '<')['roots']
+    assert roots[1] == pytest.approx(-1e-8, rel=1e-12)
+
+def test_quadratic_inequality_degenerates_to_linear(card):
+    """a = 0이면 일차 부등식으로 푸는지 테스트"""
+    result = card.solve_quadratic_inequality(0, 2, -4, '>=')
+    assert result['success']
+    assert result['solution'] == "x ≥ 2.00"
+    assert result['roots'] == [2.0]
+    assert result['root_type'] == 'linear'
+
+def test_general_inequality(card):
+    """이차 이하는 닫힌 형태로, 그 외는 기호 풀이로 푸는지 테스트"""
+    result = card.solve_inequality('x**2 - 4', '>')
+    assert result['method'] == 'closed_form'
+    assert result['solution'] == "x < -2.00 또는 x > 2.00"
+
+    result = card.solve_inequality('x**3 - x', '>')
+    assert result['method'] == 'symbolic'
+    assert result['solution'] == 'Union(Interval.open(-1, 0), Interval.open(1, oo))'
+
+    assert not card.solve_inequality('__import__("os")', '>')['success']
+    assert not card.solve_inequality('x', '=')['success']
+
+def test_general_inequality_guards(card, monkeypatch):
+    """큰 거듭제곱은 거부하고, 제한 시간을 넘긴 기호 풀이는 중단하되 캐시하지 않는지 테스트"""
+    for expression in ['2**10000 + x**3', 'x**1000', '9**(9**9)*x**3', 'x' + ' + x' * 200]:
+        assert not card.solve_inequality(expression, '>')['success']
+
+    calls = []
+
+    def step():
+        time.sleep(0.001)
+
+    def endless(expression, inequality_type):
+        calls.append(expression)
+        while True:
+            step()
+
+    monkeypatch.setattr(card, '_symbolic_solution', endless)
+    for _ in range(2):
+        started = time.monotonic()
+        result = card.solve_inequality('sin(x)**7 - cos(x)**3 + x**5*tan(x) - exp(x)*x', '>', time_budget=0.2)
+        assert time.monotonic() - started < 1.5
+        assert not result['success']
+        assert '제한 시간' in result['error']
+    assert len(calls) == 2
+    assert sys.gettrace() is None
+
+def test_symbolic_budget_is_clamped_and_thread_safe(card, monkeypatch):
+    """time_budget은 SYMBOLIC_TIME_BUDGET을 넘지 않고, 다른 스레드에서도 프로세스 없이 중단되는지 테스트"""
+    def step():
+        time.sleep(0.001)
+
+    def endless(expression, inequality_type):
+        while True:
+            step()
+
+    monkeypatch.setattr(card, '_symbolic_solution', endless)
+    results = []
+
+    def solve():
+        started = time.monotonic()
+        results.append((card.solve_inequality('sin(x) - x/2', '<', time_budget=10 ** 6), time.monotonic() - started))
+
+    threads = [threading.Thread(target=solve) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 2
+    for result, elapsed in results:
+        assert not result['success']
+        assert f'{card.SYMBOLIC_TIME_BUDGET}초' in result['error']
+        assert elapsed < card.SYMBOLIC_TIME_BUDGET + 1
+
+def test_polynomial_inequality_skips_sympy(card):
+    """이차 이하 다항식은 sympy 없이 NumPy 계수로 푸는지 테스트"""
+    script = (
+        'import sys\n'
+        'from app.services.card_loader import load_card\n'
+        'from app.services.catalog import find_card_dir\n'
+        f'card = load_card(find_card_dir({INEQUALITIES_CARD!r})).module\n'
+        'result = card.solve_inequality("(x + 1)*(x - 3)/2 + x", "<=")\n'
+        'print(result["method"], "sympy" in sys.modules)\n'
+    )
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['closed_form', 'False']
+
+def test_solution_intervals(card):
+    """해집합이 열린/닫힌 끝점과 무한대를 가진 구간 목록으로 반환되는지 테스트"""
+    assert card.solve_linear_inequality(-1, 3, '<=')['intervals'] == [
+        {'low': 3.0, 'high': None, 'low_closed': True, 'high_closed': False}
+    ]
+    assert card.solve_linear_inequality(0, 5, '<')['intervals'] == []
+
+    intervals = card.solve_quadratic_inequality(1, -3, 2, '>')['intervals']
+    assert [(item['low'], item['high']) for item in intervals] == [(None, 1.0), (2.0, None)]
+    assert card.solve_quadratic_inequality(1, -2, 1, '<=')['intervals'] == [
+        {'low': 1.0, 'high': 1.0, 'low_closed': True, 'high_closed': True}
+    ]
+    assert card.solve_quadratic_inequality(1, 0, 1, '>')['intervals'] == [
+        {'low': None, 'high': None, 'low_closed': False, 'high_closed': False}
+    ]
+
+def test_inequality_region(card):
+    """좌표평면 영역이 상자로 자른 다각형과 RLE 마스크로 반환되는지 테스트"""
+    result = card.solve_inequality_region(0, 2, 1, '>')
+    assert result['boundary'] == 'dashed'
+    assert result['polygon'][:3] == [[-10.0, -10.0], [-5.5, -10.0], [4.5, 10.0]]
+
+    result = card.solve_inequality_region(1, 0, -4, '<=', representation='mask', resolution=8)
+    mask = result['mask']
+    assert mask['shape'] == [8, 8] and sum(mask['runs']) == 64
+
+    # 마스크를 복원해 직접 평가한 결과와 비교
+    values = np.repeat(np.resize([mask['first'], not mask['first']], len(mask['runs'])), mask['runs'])
+    x = -10 + 2.5 * (np.arange(8) + 0.5)
+    assert np.array_equal(values.reshape(8, 8), x[:, None] <= x[None, :]**2 - 4)
+
+    assert not card.solve_inequality_region(1, 0, 0, '>', representation='png')['success']
+
+def test_interval_set_algebra(card):
+    """구간 집합의 합집합, 교집합, 여집합이 끝점 포함 여부를 지키는지 테스트"""
+    IntervalSet = card.IntervalSet
+    left = IntervalSet([(-np.inf, 1, False, True), (3, 5, False, False)])
+    right = IntervalSet([(1, 4, False, True)])
+
+    assert (left | right).intervals == ((-np.inf, 5.0, False, False),)
+    assert (left & right).intervals == ((3.0, 4.0, False, True),)
+    assert (~left).intervals == ((1.0, 3.0, False, True), (5.0, np.inf, True, False))
+    assert ~~left == left
+    assert not (left & ~left)
+    assert 1 in left and 3 not in left and 4.5 in left
+
+    # 맞닿은 구간은 한쪽이라도 끝점을 포함하면 병합
+    assert IntervalSet([(0, 1, True, False), (1, 2, True, True)]).intervals == ((0.0, 2.0, True, True),)
+    assert len(IntervalSet([(0, 1, True, False), (1, 2, False, True)]).intervals) == 2
+    assert IntervalSet.from_list(left.to_list()) == left
+
+def test_interval_set_shared_endpoints(card):
+    """같은 끝점을 공유하는 구간의 합집합과 교집합이 포함 여부를 잃지 않는지 테스트"""
+    IntervalSet = card.IntervalSet
+    closed_low = IntervalSet([(0, 3, True, False)])
+    open_low = IntervalSet([(0, 2, False, True)])
+    assert (closed_low | open_low).intervals == ((0.0, 3.0, True, False),)
+    assert (open_low | closed_low).intervals == ((0.0, 3.0, True, False),)
+    assert (closed_low & open_low).intervals == ((0.0, 2.0, False, True),)
+
+    open_high = IntervalSet([(1, 3, False, False)])
+    closed_high = IntervalSet([(2, 3, False, True)])
+    assert (open_high | closed_high).intervals == ((1.0, 3.0, False, True),)
+    assert (open_high & closed_high).intervals == ((2.0, 3.0, False, False),)
+    assert all(type(flag) is bool for interval in (closed_low | open_low).intervals for flag in interval[2:])
+
+    result = card.solve_compound_inequality([
+        {'a': 1, 'b': 0, 'type': '>='},
+        {'a': 1, 'b': 0, 'type': '>'}
+    ], combine='or')
+    assert result['solution'] == "x ≥ 0.00"
+
+def test_compound_and_absolute_inequalities(card):
+    """복합 부등식과 절댓값 부등식을 구간 연산으로 푸는지 테스트"""
+    result = card.solve_compound_inequality([
+        {'a': 1, 'b': 2, 'type': '>='},
+        {'a': 1, 'b': -2, 'type': '<'}
+    ])
+    assert result['solution'] == "-2.00 ≤ x < 2.00"
+
+    result = card.solve_compound_inequality([
+        {'a': 1, 'b': 0, 'c': -4, 'type': '<'},
+        {'a': 1, 'b': -3, 'type': '>'}
+    ], combine='or')
+    assert result['solution'] == "-2.00 < x < 2.00 또는 x > 3.00"
+
+    assert card.solve_absolute_inequality(2, -1, 3, '>')['solution'] == "x < -1.00 또는 x > 2.00"
+    assert card.solve_absolute_inequality(1, 0, 0, '<=')['solution'] == "x = 0.00"
+    assert card.solve_absolute_inequality(1, 0, -1, '<')['solution'] == "해 없음"
+    assert card.solve_absolute_inequality(1, 0, -1, '>')['solution'] == "모든 실수"
+
+FEASIBLE_SYSTEM = [
+    {'a': 1, 'b': 1, 'c': 4, 'type': '<='},
+    {'a': 1, 'b': 3, 'c': 6, 'type': '<='},
+    {'a': 1, 'b': 0, 'c': 0, 'type': '>='},
+    {'a': 0, 'b': 1, 'c': 0, 'type': '>'}
+]
+
+def test_linear_system(card):
+    """연립부등식의 꼭짓점, 넓이, 최적값과 유계/불능 판정 테스트"""
+    result = card.solve_linear_system(FEASIBLE_SYSTEM, objective=[3, 2])
+    assert result['feasible'] and result['bounded']
+    assert np.allclose(result['vertices'], [[0, 0], [4, 0], [3, 1], [0, 2]])
+    assert result['area'] == pytest.approx(5.0)
+    assert result['optimum']['value'] == pytest.approx(12.0)
+    assert result['boundaries'][3] == 'dashed'
+
+    minimum = card.solve_linear_system(FEASIBLE_SYSTEM, objective=[-1, -1], maximize=False)
+    assert minimum['optimum']['value'] == pytest.approx(-4.0)
+
+    quadrant = card.solve_linear_system(FEASIBLE_SYSTEM[2:], objective=[1, 1], x_range=(-5, 5), y_range=(-5, 5))
+    assert quadrant['feasible'] and not quadrant['bounded']
+    assert quadrant['vertices'] == [[0.0, 0.0]]
+    assert quadrant['optimum']['status'] == 'unbounded'
+    assert np.allclose(quadrant['polygon'], [[0, 0], [5, 0], [5, 5], [0, 5]])
+
+    # 무한 영역이어도 목적함수가 후퇴 방향으로 커지지 않으면 최적값이 유한
+    corner = card.solve_linear_system(FEASIBLE_SYSTEM[2:], objective=[-1, -1])
+    assert corner['optimum'] == {'status': 'optimal', 'value': 0.0, 'point': [0.0, 0.0]}
+    half_plane = card.solve_linear_system(FEASIBLE_SYSTEM[2:3], objective=[-1, 0])
+    assert half_plane['optimum']['status'] == 'optimal'
+    assert half_plane['optimum']['value'] == 0.0
+    assert card.solve_linear_system(FEASIBLE_SYSTEM[2:3], objective=[-1, 1])['optimum']['status'] == 'unbounded'
+
+    empty = card.solve_linear_system([{'a': 1, 'b': 0, 'c': 1, 'type': '<='},
+                                      {'a': 1, 'b': 0, 'c': 2, 'type': '>='}], objective=[1, 0])
+    assert not empty['feasible']
+    assert empty['optimum']['status'] == 'infeasible'
+
+def test_linear_system_matches_brute_force(card):
+    """많은 제약에서 최적값이 모든 경계선 교점을 검사한 값과 같은지 테스트"""
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(0, 2 * np.pi, 60)
+    planes = np.column_stack([np.cos(angles), np.sin(angles), rng.uniform(1, 5, 60)])
+    constraints = [{'a': a, 'b': b, 'c': c, 'type': '<='} for a, b, c in planes.tolist()]
+
+    result = card.solve_linear_system(constraints, objective=[1, 2])
+    assert result['bounded']
+
+    i, j = np.triu_indices(len(planes), 1)
+    det = planes[i, 0] * planes[j, 1] - planes[j, 0] * planes[i, 1]
+    x = (planes[i, 2] * planes[j, 1] - planes[j, 2] * planes[i, 1]) / det
+    y = (planes[i, 0] * planes[j, 2] - planes[j, 0] * planes[i, 2]) / det
+    inside = np.all(planes[:, :1] * x + planes[:, 1:2] * y <= planes[:, 2:] + 1e-9, axis=0)
+    assert result['optimum']['value'] == pytest.approx(np.max((x + 2 * y)[inside]))
+    assert len(result['vertices']) == inside.sum()
+
+def test_linear_system_batch(card):
+    """여러 연립부등식을 한 번에 풀어 열 단위로 반환하는지 테스트"""
+    result = card.solve_linear_system_batch([FEASIBLE_SYSTEM, FEASIBLE_SYSTEM[2:]], objective=[3, 2])
+    assert result['feasible'].tolist() == [True, True]
+    assert result['bounded'].tolist() == [True, False]
+    assert result['optimum_value'][0] == pytest.approx(12.0)
+    assert np.isnan(result['optimum_value'][1]) and np.isnan(result['area'][1])
+
+def test_quadratic_inequality_batch_matches_single(card):
+    """배치 풀이의 해 설명이 하나씩 푼 결과와 같은지 테스트"""
+    rng = np.random.default_rng(0)
+    a, b, c = rng.integers(-3, 4, (3, 300))
+    types = rng.choice(['>', '<', '>=', '<='], 300).tolist()
+    result = card.solve_quadratic_inequality_batch(a, b, c, types)
+    assert result['solution'] == [
+        card.solve_quadratic_inequality(int(a[i]), int(b[i]), int(c[i]), types[i])['solution']
+        for i in range(300)
+    ]
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+from app import create_app
+from app.services import outputs
+from app.services.outputs import build_card_output, load_card_output
+from app.services.scheduler import SchedulerOverloaded
+
+CARD_CODE = '''import matplotlib.pyplot as plt
+print("hello")
+plt.plot([0, 1], [0, 1])
+plt.show()
+'''
+
+@pytest.fixture
+def data_dir(tmp_path):
+    card_dir = tmp_path / 'data' / 'raw' / 'math' / 'sample'
+    card_dir.mkdir(parents=True)
+    (card_dir / 'metadata.json').write_text(json.dumps({'id': 'sample-001', 'category': 'math'}))
+    (card_dir / 'code.py').write_text(CARD_CODE)
+    return tmp_path / 'data'
+
+@pytest.fixture
+def client(data_dir, tmp_path):
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['DATA_DIR'] = data_dir
+    app.config['OUTPUTS_DIR'] = tmp_path / 'outputs'
+    
+    with app.test_client() as client:
+        yield client
+
+def test_output_not_built(client, data_dir, tmp_path):
+    """산출물이 없으면 실시간으로 실행해 저장하고 다음 요청부터 재사용하는지 테스트"""
+    response = client.get('/api/cards/sample-001/output')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['live']
+    assert data['output'] == 'hello\n'
+    assert client.get(data['figure_urls'][0]).status_code == 200
+    
+    data = client.get('/api/cards/sample-001/output').get_json()
+    assert 'live' not in data
+
+def test_failed_build_is_cached(client, data_dir, tmp_path, monkeypatch):
+    """실패한 빌드는 버전별로 기억해 다시 실행하지 않고, TTL이 지나면 다시 빌드하는지 테스트"""
+    card_dir = data_dir / 'raw' / 'math' / 'sample'
+    (card_dir / 'code.py').write_text('raise RuntimeError("broken")\n')
+    data = client.get('/api/cards/sample-001/output').get_json()
+    assert data['live']
+    assert not data['success']
+    assert 'broken' in data['error']
+    
+    data = client.get('/api/cards/sample-001/output').get_json()
+    assert 'live' not in data
+    assert not data['success']
+    
+    monkeypatch.setattr(outputs, 'FAILED_OUTPUT_TTL', -1)
+    assert load_card_output(card_dir, tmp_path / 'outputs') is None
+
+def test_live_build_uses_scheduler(client, monkeypatch):
+    """실시간 빌드가 코드 실행 대기열을 거치고, 대기열 거절을 Retry-After로 전달하는지 테스트"""
+    scheduler = client.application.extensions['run_scheduler']
+    
+    def reject(fn, client_id='anonymous', lane='interactive'):
+        raise SchedulerOverloaded('Run queue is full', 503, 7)
+    
+    monkeypatch.setattr(scheduler, 'submit', reject)
+    response = client.get('/api/cards/sample-001/output')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '7'
+
+def test_build_and_serve_output(client, data_dir, tmp_path):
+    """빌드한 산출물을 API로 제공하는지 테스트"""
+    manifest = build_card_output(data_dir / 'raw' / 'math' / 'sample', tmp_path / 'outputs')
+    assert manifest['success']
+    assert manifest['figures'] == ['figure-1.png']
+    
+    response = client.get('/api/cards/sample-001/output')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['output'] == 'hello\n'
+    assert data['version'] == manifest['version']
+    
+    figure = client.get(data['figure_urls'][0])
+    assert figure.status_code == 200
+    assert figure.data.startswith(b'\x89PNG')
+
+def test_stale_output_is_ignored(client, data_dir, tmp_path):
+    """코드가 바뀌면 이전 산출물 대신 바뀐 코드를 실행하는지 테스트"""
+    card_dir = data_dir / 'raw' / 'math' / 'sample'
+    manifest = build_card_output(card_dir, tmp_path / 'outputs')
+    (card_dir / 'code.py').write_text(CARD_CODE + 'print("changed")\n')
+    assert load_card_output(card_dir, tmp_path / 'outputs') is None
+    
+    data = client.get('/api/cards/sample-001/output').get_json()
+    assert data['live']
+    assert data['version'] != manifest['version']
+    assert data['output'] == 'hello\nchanged\n'
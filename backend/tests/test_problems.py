@@ -0,0 +1,137 @@
+import json
+import shutil
+
+import numpy as np
+import pytest
+from app import create_app
+from app.services.catalog import find_card_dir
+from app.services.problems import CHUNK_SIZE, format_polynomial
+
+QUADRATIC_CARD = 'math-quadratic-function-complete-001'
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+def _problems(client, card_id, query):
+    response = client.get(f'/api/cards/{card_id}/problems?{query}')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+def test_format_polynomial():
+    """계수 목록을 식으로 표시하는지 테스트"""
+    assert format_polynomial([2, -3, 1]) == '2x² - 3x + 1'
+    assert format_polynomial([-1, 0, 4]) == '-x² + 4'
+    assert format_polynomial([1, 0]) == 'x'
+
+def test_quadratic_problems(client):
+    """정수근 이차방정식과 답이 맞는지 테스트"""
+    problems = _problems(client, QUADRATIC_CARD, 'count=50&seed=3')
+    assert len(problems) == 50
+    for problem in problems:
+        a, b, c = (problem['parameters'][name] for name in 'abc')
+        roots = problem['answer']['roots']
+        assert len(roots) == 2 and all(float(root).is_integer() for root in roots)
+        assert all(a * root**2 + b * root + c == 0 for root in roots)
+
+    problems = _problems(client, QUADRATIC_CARD, 'count=50&seed=3&discriminant=negative')
+    assert all(problem['answer']['discriminant'] < 0 and problem['answer']['roots'] == []
+               for problem in problems)
+
+def test_problems_are_reproducible(client):
+    """같은 seed는 count와 상관없이 같은 문제를 앞에서부터 만드는지 테스트"""
+    query = 'seed=11&discriminant=any'
+    long = _problems(client, QUADRATIC_CARD, f'{query}&count={CHUNK_SIZE + 5}')
+    short = _problems(client, QUADRATIC_CARD, f'{query}&count=5')
+    assert short == long[:5]
+    assert long[-1]['id'] == f'11-{CHUNK_SIZE + 4}'
+
+    response = client.get(f'/api/cards/{QUADRATIC_CARD}/problems?count=2')
+    assert response.headers['X-Problem-Seed'].isdigit()
+
+def test_equation_problems(client):
+    """지수/로그방정식의 밑이 유효하고 답이 방정식을 만족하는지 테스트"""
+    card_id = 'math-exponential-logarithmic-001'
+    for problem in _problems(client, card_id, 'kind=exponential-equation&count=100&seed=1'):
+        a, b, c, target = (problem['parameters'][name] for name in ('a', 'b', 'c', 'target'))
+        assert b > 0 and b != 1
+        assert a * b ** problem['answer']['solution'] + c == pytest.approx(target)
+    for problem in _problems(client, card_id, 'kind=logarithmic-equation&count=100&seed=1'):
+        a, b, c, target = (problem['parameters'][name] for name in ('a', 'b', 'c', 'target'))
+        assert a * np.log(problem['answer']['solution']) / np.log(b) + c == pytest.approx(target)
+
+def test_equation_problems_print_exact_values(client):
+    """문제에 표시된 target과 로그방정식의 해가 반올림 없는 유한소수인지 테스트"""
+    card_id = 'math-exponential-logarithmic-001'
+    for kind in ('exponential-equation', 'logarithmic-equation'):
+        for problem in _problems(client, card_id, f'kind={kind}&count=300&seed=2&magnitude=100'):
+            printed = problem['question'].split(' = ')[-1].removesuffix('의 해를 구하시오.')
+            assert float(printed) == pytest.approx(problem['parameters']['target'], abs=1e-12)
+            solution = problem['answer']['solution']
+            assert round(solution, 6) == solution
+
+def test_problem_errors(client):
+    """지원하지 않는 카드, 종류, 옵션은 스트리밍 전에 거절하는지 테스트"""
+    assert client.get('/api/cards/math-domain-range-001/problems').status_code == 404
+    assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems?kind=unknown').status_code == 400
+    assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems?discriminant=odd').status_code == 400
+    assert client.get('/api/cards/unknown-card/problems/kinds').status_code == 404
+    assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems?count=0').status_code == 400
+    for query in ('seed=abc', 'seed=1.5', 'count=ten', 'magnitude=x'):
+        assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems?{query}').status_code == 400
+    assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems/kinds').get_json() == {
+        'kinds': ['quadratic-equation']
+    }
+
+def test_unknown_options_are_rejected(client):
+    """종류가 지원하지 않는 옵션 키는 400으로 거절하는지 테스트"""
+    response = client.get(f'/api/cards/{QUADRATIC_CARD}/problems?discriminat=negative')
+    assert response.status_code == 400
+    assert 'discriminat' in response.get_json()['error']
+    card_id = 'math-exponential-logarithmic-001'
+    assert client.get(f'/api/cards/{card_id}/problems?integer_roots=false').status_code == 400
+    _problems(client, 'math-inequalities-001', 'count=5&integer_roots=true')
+
+def test_problem_kinds_come_from_metadata(client, tmp_path):
+    """metadata.json의 problems 선언으로 문제 종류가 정해지는지 테스트"""
+    card_dir = tmp_path / 'raw' / 'math' / 'quadratic-formula'
+    shutil.copytree(find_card_dir(QUADRATIC_CARD), card_dir)
+    metadata = json.loads((card_dir / 'metadata.json').read_text(encoding='utf-8'))
+    # 생성기가 없는 종류는 건너뛰고, 선언 순서의 첫 번째가 기본값
+    metadata['problems'] = {
+        'cubic-equation': {'batch_function': 'analyze_quadratic_batch'},
+        'quadratic-inequality': {'batch_function': 'analyze_quadratic_batch'},
+        'quadratic-equation': {'batch_function': 'analyze_quadratic_batch'}
+    }
+    (card_dir / 'metadata.json').write_text(json.dumps(metadata), encoding='utf-8')
+    client.application.config['DATA_DIR'] = tmp_path
+
+    assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems/kinds').get_json() == {
+        'kinds': ['quadratic-inequality', 'quadratic-equation']
+    }
+    problems = _problems(client, QUADRATIC_CARD, 'count=3&kind=quadratic-equation')
+    assert problems[0]['kind'] == 'quadratic-equation'
+
+    del metadata['problems']
+    (card_dir / 'metadata.json').write_text(json.dumps(metadata), encoding='utf-8')
+    assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems/kinds').status_code == 404
+    assert client.get(f'/api/cards/{QUADRATIC_CARD}/problems').status_code == 404
+
+def test_problem_stream_reports_errors(client, monkeypatch):
+    """스트리밍 도중 카드 함수가 실패하면 마지막 줄에 오류를 보내는지 테스트"""
+    import app.services.problems as problems
+
+    results = iter([{'success': True}, {'success': False, 'error': 'boom'}])
+    original = problems.call_function
+    monkeypatch.setattr(problems, 'call_function',
+                        lambda module, name, kwargs: dict(original(module, name, kwargs), **next(results)))
+    response = client.get(f'/api/cards/{QUADRATIC_CARD}/problems?count={CHUNK_SIZE + 5}&seed=1')
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(lines) == CHUNK_SIZE + 1
+    assert lines[-1] == {'error': 'boom'}
@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from app import create_app
+from app.services.render import RenderError, Renderer
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+def _quadratic_spec(c):
+    x = [i / 10 for i in range(-50, 51)]
+    return {
+        'layout': '2x3',
+        'panels': [
+            {'title': 'f(x) = x² + c', 'series': [{'x': x, 'y': [v * v + c for v in x], 'label': 'f'}]},
+            {'series': [{'x_values': [0, 1, 2], 'y_values': [1, 2, 4], 'function': 'g'}]}
+        ]
+    }
+
+def test_render_png(client):
+    """선 데이터를 PNG로 렌더링하는 테스트"""
+    response = client.post('/api/render', json=_quadratic_spec(1))
+    assert response.status_code == 200
+    assert response.mimetype == 'image/png'
+    assert response.data.startswith(b'\x89PNG')
+    assert response.headers['ETag']
+
+def test_render_cache_and_pool_reuse(client):
+    """같은 내용은 캐시에서, 다른 내용은 풀의 그림을 재사용해 렌더링하는지 테스트"""
+    first = client.post('/api/render', json=_quadratic_spec(2))
+    again = client.post('/api/render', json=_quadratic_spec(2))
+    other = client.post('/api/render', json=_quadratic_spec(3))
+    assert first.data == again.data
+    assert first.data != other.data
+
+    renderer = client.application.extensions['renderer']
+    metrics = renderer.metrics()
+    assert metrics['cache_hits'] == 1
+    assert metrics['rendered'] == 2
+    assert metrics['pool']['2x3']['created'] == 1
+
+    response = client.post('/api/render', json=_quadratic_spec(2),
+                           headers={'If-None-Match': first.headers['ETag']})
+    assert response.status_code == 304
+
+def test_render_invalid_spec(client):
+    """잘못된 요청은 400을 반환하는지 테스트"""
+    assert client.post('/api/render', json={'layout': '3x3'}).status_code == 400
+    assert client.post('/api/render', json={'panels': [{}, {}]}).status_code == 400
+    bad_series = {'panels': [{'series': [{'x': [1, 2], 'y': [1]}]}]}
+    assert client.post('/api/render', json=bad_series).status_code == 400
+
+def test_render_from_multiple_threads():
+    """풀 크기보다 많은 스레드가 동시에 렌더링해도 직렬 렌더링과 같은 결과인지 테스트"""
+    specs = [_quadratic_spec(c) for c in range(8)]
+    expected = [Renderer(cache_size=0).render(spec)[2] for spec in specs]
+
+    renderer = Renderer(pool_size=2, cache_size=0)
+    with ThreadPoolExecutor(4) as executor:
+        images = [image for _, _, image in executor.map(renderer.render, specs)]
+    assert images == expected
+    pool = renderer.metrics()['pool']['2x3']
+    assert pool['created'] <= 2
+    assert pool['in_use'] == 0 and pool['idle'] == pool['created']
+
+def test_render_invalid_axis_range(client):
+    """패널 축 범위가 잘못되면 렌더링 전에 400을 반환하는지 테스트"""
+    series = [{'x': [0, 1], 'y': [0, 1]}]
+    for bad in ([1], [2, 1], ['a', 'b'], [0, float('inf')], 'wide', [True, 2]):
+        response = client.post('/api/render', json={'panels': [{'x_range': bad, 'series': series}]})
+        assert response.status_code == 400
+    assert client.post('/api/render', json={'panels': [{'y_range': [-1, 1], 'series': series}]}).status_code == 200
+
+def test_render_pool_timeout():
+    """그림이 모두 사용 중이면 제한 시간 뒤 503으로 실패하는지 테스트"""
+    renderer = Renderer(pool_size=1, cache_size=0, acquire_timeout=0.05)
+    with renderer.pool.checkout('1x1'):
+        with pytest.raises(RenderError) as busy:
+            renderer.render({'panels': [{'series': [{'x': [0, 1], 'y': [0, 1]}]}]})
+    assert busy.value.status_code == 503
+    pool = renderer.metrics()['pool']['1x1']
+    assert pool['in_use'] == 0 and pool['created'] == 1
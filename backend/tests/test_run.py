@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+from app import create_app
+from app.services.scheduler import RunScheduler, SchedulerOverloaded
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+def test_run_code(client):
+    """코드 실행 엔드포인트 테스트"""
+    response = client.post('/api/run-code', json={'code': 'print(1 + 1)'})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success']
+    assert data['output'] == '2\n'
+
+def test_run_code_requires_code(client):
+    """코드 없이 요청하면 400을 반환하는지 테스트"""
+    response = client.post('/api/run-code', json={'code': '  '})
+    assert response.status_code == 400
+
+def test_metrics(client):
+    """대기열 메트릭 엔드포인트 테스트"""
+    client.post('/api/run-code', json={'code': 'pass', 'priority': 'batch'})
+    data = client.get('/api/health/metrics').get_json()
+    scheduler = data['run_scheduler']
+    assert scheduler['completed'] == 1
+    assert scheduler['lanes']['batch']['wait_time']['count'] == 1
+
+def _blocked_scheduler(**kwargs):
+    """첫 작업이 gate가 열릴 때까지 워커를 점유하는 스케줄러"""
+    scheduler = RunScheduler(workers=1, **kwargs)
+    gate = threading.Event()
+    started = threading.Event()
+    
+    def blocker():
+        started.set()
+        gate.wait(5)
+    
+    scheduler.submit(blocker, client_id='blocker')
+    started.wait(5)
+    return scheduler, gate
+
+def test_scheduler_priority_and_fairness():
+    """대화형 레인 우선 및 클라이언트 라운드 로빈 테스트"""
+    scheduler, gate = _blocked_scheduler(batch_interval=10)
+    order = []
+    futures = [
+        scheduler.submit(lambda: order.append('batch'), client_id='c', lane='batch'),
+        scheduler.submit(lambda: order.append('a1'), client_id='a'),
+        scheduler.submit(lambda: order.append('a2'), client_id='a'),
+        scheduler.submit(lambda: order.append('b1'), client_id='b'),
+    ]
+    gate.set()
+    for future in futures:
+        future.result(5)
+    assert order == ['a1', 'b1', 'a2', 'batch']
+
+def test_scheduler_load_shedding():
+    """대기열/클라이언트 한도 초과 시 거절 테스트"""
+    scheduler, gate = _blocked_scheduler(max_queue=2, max_per_client=1)
+    scheduler.submit(lambda: None, client_id='a')
+    
+    with pytest.raises(SchedulerOverloaded) as client_limit:
+        scheduler.submit(lambda: None, client_id='a')
+    assert client_limit.value.status_code == 429
+    
+    scheduler.submit(lambda: None, client_id='b')
+    with pytest.raises(SchedulerOverloaded) as queue_full:
+        scheduler.submit(lambda: None, client_id='c')
+    assert queue_full.value.status_code == 503
+    assert queue_full.value.retry_after >= 1
+    
+    gate.set()
+    assert scheduler.metrics()['rejected_queue_full'] == 1
+
+def test_scheduler_releases_slot_on_base_exception():
+    """작업이 BaseException을 던져도 Future가 끝나고 클라이언트 슬롯이 반환되는지 테스트"""
+    scheduler = RunScheduler(workers=1, max_per_client=1)
+
+    def interrupted():
+        raise SystemExit(1)
+
+    future = scheduler.submit(interrupted, client_id='a')
+    with pytest.raises(SystemExit):
+        future.result(timeout=5)
+    assert scheduler.submit(lambda: 'ok', client_id='a').result(timeout=5) == 'ok'
+    assert scheduler.metrics()['failed'] == 1
+
+def test_client_id_header_is_ignored(client, monkeypatch):
+    """클라이언트 한도가 X-Client-Id 헤더가 아닌 원격 주소로 정해지는지 테스트"""
+    scheduler = client.application.extensions['run_scheduler']
+    submit = scheduler.submit
+    clients = []
+
+    def record(fn, client_id='anonymous', lane='interactive'):
+        clients.append(client_id)
+        return submit(fn, client_id=client_id, lane=lane)
+
+    monkeypatch.setattr(scheduler, 'submit', record)
+    client.post('/api/run-code', json={'code': 'print(1)'}, headers={'X-Client-Id': 'spoofed'},
+                environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    assert clients == ['10.0.0.1']
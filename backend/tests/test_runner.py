@@ -0,0 +1,170 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+RUNNER_PATH = Path(__file__).resolve().parents[2] / 'runner.py'
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location('runner', RUNNER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, 'BYTECODE_CACHE_DIR', tmp_path / 'bytecode')
+    return module
+
+def test_run_code_output(runner):
+    """코드 실행 결과 테스트"""
+    result = runner.run_code('print(1 + 1)')
+    assert result['success']
+    assert result['output'] == '2\n'
+
+def test_compile_code_does_not_store_user_code(runner):
+    """사용자 코드는 디스크 캐시에 기록하지 않는지 테스트"""
+    namespace = {}
+    exec(runner.compile_code('x = 1'), namespace)
+    assert namespace['x'] == 1
+    assert not runner.BYTECODE_CACHE_DIR.exists()
+
+def test_writable_cache_is_ignored(runner):
+    """실행 중인 프로세스가 쓸 수 있는 캐시의 code object는 실행하지 않는지 테스트"""
+    key = runner._source_key('y = 2', '<string>')
+    runner._store_cached_bytecode(runner.BYTECODE_CACHE_DIR / f'{key}.bin', compile('y = 3', '<string>', 'exec'))
+    namespace = {}
+    exec(runner.compile_code('y = 2'), namespace)
+    assert namespace['y'] == 2
+
+def test_trusted_cache_is_used(runner, monkeypatch):
+    """신뢰할 수 있는 캐시에 있으면 다시 컴파일하지 않는지 테스트"""
+    key = runner._source_key('y = 2', '<string>')
+    runner._store_cached_bytecode(runner.BYTECODE_CACHE_DIR / f'{key}.bin', compile('y = 2', '<string>', 'exec'))
+    monkeypatch.setattr(runner, '_is_trusted', lambda path: True)
+
+    def fail_compile(*args, **kwargs):
+        raise AssertionError('compile should not be called')
+
+    runner.compile = fail_compile
+    namespace = {}
+    exec(runner.compile_code('y = 2'), namespace)
+    assert namespace['y'] == 2
+
+def test_preload_catalog(runner):
+    """카탈로그 카드 코드 사전 컴파일 테스트"""
+    stale = runner.BYTECODE_CACHE_DIR / ('0' * 64 + '.bin')
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b'stale')
+
+    count = runner.preload_catalog()
+    assert count == len(runner.iter_catalog_sources())
+    assert count > 0
+    # 카탈로그에 없는 항목은 지워 캐시 크기를 카드 수로 제한
+    assert len(list(runner.BYTECODE_CACHE_DIR.glob('*.bin'))) == count
+    assert not stale.exists()
+
+def test_extract_variables(runner):
+    """실행 후 전역 변수 추출 테스트"""
+    code = 'import numpy as np\nx_vals = np.linspace(0, 1, 5)\nresults = [{"a": 1}]\nf = lambda: 1\n'
+    result = runner.run_code(code, variables=['x_vals', 'results', 'f', 'missing'])
+    assert result['success']
+    
+    x_vals = result['variables']['x_vals']
+    assert x_vals['type'] == 'ndarray'
+    assert x_vals['dtype'] == '<f8'
+    assert x_vals['shape'] == [5]
+    assert result['variables']['results'] == [{'a': 1}]
+    assert set(result['skipped_variables']) == {'f', 'missing'}
+
+def test_extract_variables_summarizes_and_budgets(runner):
+    """큰 컨테이너 요약과 바이트 예산 테스트"""
+    namespace = {'names': ['x'] * 500, 'big': list(range(1000)), 'small': 1}
+    variables, skipped = runner.extract_variables(namespace, ['names', 'big', 'small'], byte_budget=200)
+    assert variables['names']['length'] == 500
+    assert len(variables['names']['preview']) == runner.PREVIEW_ITEMS
+    assert 'big' in skipped
+    assert variables['small'] == 1
+
+def test_variable_budget_counts_utf8_bytes(runner):
+    """예산을 문자 수가 아니라 UTF-8 바이트 수로 계산하는지 테스트"""
+    namespace = {'title': '일차함수' * 10}
+    variables, skipped = runner.extract_variables(namespace, ['title'], byte_budget=100)
+    assert 'title' in skipped
+    variables, skipped = runner.extract_variables(namespace, ['title'], byte_budget=130)
+    assert variables['title'] == '일차함수' * 10
+
+def test_plot_spec_mode(runner):
+    """pyplot 호출을 matplotlib 없이 플롯 스펙으로 기록하는지 테스트"""
+    code = (
+        'import matplotlib.pyplot as plt\nimport numpy as np\n'
+        'x = np.linspace(-1, 1, 5)\n'
+        'plt.figure(figsize=(8, 4))\nplt.subplot(1, 2, 1)\n'
+        'plt.plot(x, x**2, "r--", label="f")\nplt.axhline(y=0, color="k")\n'
+        'plt.fill_between(x, x, 0, where=x > 0, alpha=0.3)\n'
+        'plt.title("f(x)")\nplt.legend()\nplt.grid(True)\nplt.show()\n'
+        'print(type(plt).__name__)\n'
+    )
+    result = runner.run_code(code, plot_mode='spec')
+    assert result['success']
+    assert result['plot_mode'] == 'spec'
+    assert result['output'] == 'RecordingPyplot\n'
+    
+    figure, = result['plot_spec']['figures']
+    assert figure['size'] == [8, 4]
+    axes, = figure['axes']
+    assert axes['position'] == [1, 2, 1]
+    assert axes['title']['text'] == 'f(x)'
+    line, hline, fill = axes['traces']
+    assert line['style'] == {'color': 'red', 'linestyle': '--', 'label': 'f'}
+    assert line['y']['shape'] == [5]
+    assert hline == {'type': 'hline', 'y': 0.0, 'style': {'color': 'k'}}
+    assert fill['where']['dtype'] == '|b1'
+
+def test_plot_spec_mode_falls_back_to_image(runner):
+    """기록할 수 없는 호출이 있으면 실제 렌더링으로 대체하는지 테스트"""
+    code = (
+        'import matplotlib.pyplot as plt\n'
+        'plt.plot([0, 1], [0, 1])\n'
+        'try:\n    plt.text(0, 0, "a")\nexcept Exception:\n    pass\n'
+        'print("done")\n'
+    )
+    result = runner.run_code(code, plot_mode='spec')
+    assert result['success']
+    assert result['plot_mode'] == 'image'
+    assert result['plot_fallback'] == 'pyplot.text'
+    assert result['output'] == 'done\n'
+    assert len(result['figures']) == 1
+    assert 'plot_spec' not in result
+
+def test_plot_spec_mode_runtime_fallback(runner, tmp_path):
+    """대체 여부는 가능하면 실행 전에 정하고, 실행 중에야 드러나면 이미지 모드로 다시 실행하는지 테스트"""
+    log = tmp_path / 'runs.txt'
+    side_effect = f'open({str(log)!r}, "a").write("run\\n")\n'
+
+    code = 'import matplotlib.pyplot as plt\nfrom matplotlib.figure import Figure\n' + side_effect
+    result = runner.run_code(code, plot_mode='spec')
+    assert result['success']
+    assert result['plot_fallback'] == 'import matplotlib.figure'
+    assert log.read_text() == 'run\n'
+
+    # 정적으로 보이지 않는 호출은 코드가 예외를 삼켜도 실제 matplotlib으로 다시 실행
+    log.unlink()
+    code = ('import matplotlib.pyplot as plt\n' + side_effect +
+            'def draw(axes):\n    axes.scatter([0], [0])\n'
+            'try:\n    draw(plt.gca())\nexcept Exception:\n    pass\n')
+    result = runner.run_code(code, plot_mode='spec')
+    assert result['success']
+    assert result['plot_mode'] == 'image'
+    assert result['plot_fallback'] == 'Axes.scatter'
+    assert len(result['figures']) == 1
+    assert 'plot_spec' not in result
+    assert log.read_text() == 'run\nrun\n'
+    assert issubclass(runner.UnsupportedPlotCall, Exception)
+
+def test_find_unsupported_plot_use(runner):
+    """실행 전 검사가 pyplot 별칭과 축 핸들의 미지원 사용을 찾는지 테스트"""
+    find = runner.find_unsupported_plot_use
+    assert find('import matplotlib.pyplot as plt\nax = plt.gca()\nax.set_title("a")\nplt.show()') is None
+    assert find('import matplotlib.patches as patches') == 'import matplotlib.patches'
+    assert find('from matplotlib import pyplot as p, cm') == 'import matplotlib.cm'
+    assert find('import matplotlib.pyplot as plt\nplt.gca().scatter([1], [1])') == 'Axes.scatter'
+    assert find('import matplotlib.pyplot as plt\nfig = plt.figure()\nfig.add_subplot(111)') == 'Figure.add_subplot'
+    assert find('from matplotlib.pyplot import plot, scatter') == 'pyplot.scatter'
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from app import create_app
+from app.services.sampling import adaptive_sample
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+def test_straight_line_needs_two_points():
+    """직선은 양 끝점만 남는지 테스트"""
+    x, y = adaptive_sample(lambda x: 2 * x + 3, (-10, 10))
+    assert x.tolist() == [-10.0, 10.0]
+    assert y.tolist() == [-17.0, 23.0]
+
+def test_adaptive_sample_accuracy():
+    """곡선을 허용 오차 안에서 적은 점으로 표현하는지 테스트"""
+    x, y = adaptive_sample(lambda x: x**2, (-10, 10), tolerance=1e-3)
+    assert len(x) < 100
+    dense = np.linspace(-10, 10, 10000)
+    assert np.max(np.abs(np.interp(dense, x, y) - dense**2)) < 100 * 2e-3
+
+def test_adaptive_sample_refines_near_asymptote():
+    """점근선 근처를 세분화하고 정의되지 않은 점은 제외하는지 테스트"""
+    x, y = adaptive_sample(lambda x: 1 / x, (-10, 10), max_points=300)
+    assert np.all(np.isfinite(y))
+    assert np.min(np.abs(x)) < 0.01
+    assert np.sum(np.abs(x) < 1) > np.sum(np.abs(x) > 9)
+
+def test_invoke_function_adaptive(client):
+    """카드 함수 결과를 적응형 샘플로 반환하는 테스트"""
+    response = client.post(
+        '/api/cards/math-linear-function-001/functions/analyze_linear_function?sampling=adaptive',
+        json={'m': 2, 'b': 3}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['sampling'] == 'adaptive'
+    assert data['x_values'] == [-10.0, 10.0]
+    assert data['slope'] == 2
+
+@pytest.mark.parametrize('query', ['max_points=0', 'max_points=1000000', 'tolerance=0', 'tolerance=-1', 'tolerance=2'])
+def test_invalid_sampling_args(client, query):
+    """범위를 벗어난 적응형 샘플링 인자는 400을 반환하는지 테스트"""
+    response = client.post(
+        f'/api/cards/math-linear-function-001/functions/analyze_linear_function?sampling=adaptive&{query}',
+        json={'m': 2, 'b': 3}
+    )
+    assert response.status_code == 400
+
+def test_card_declares_curves(client):
+    """카드가 선언한 곡선 함수로 이차 부등식 경계를 적응형 샘플링하는지 테스트"""
+    response = client.post(
+        '/api/cards/math-inequalities-001/functions/solve_quadratic_inequality?sampling=adaptive',
+        json={'a': 1, 'b': 0, 'c': -4, 'inequality_type': '>'}
+    )
+    data = response.get_json()
+    assert data['sampling'] == 'adaptive'
+    x = np.array(data['x_values'])
+    assert 2 < x.size < 100
+    assert np.allclose(data['y_values'], x**2 - 4)
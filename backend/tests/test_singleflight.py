@@ -0,0 +1,178 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from app import create_app
+from app.services.card_loader import load_card
+from app.services.scheduler import SchedulerOverloaded
+from app.services.singleflight import SingleFlight, single_flight
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+
+    with app.test_client() as client:
+        yield client
+
+def _concurrently(fn, count):
+    """count개 스레드에서 fn을 동시에 시작하고 결과 목록을 반환"""
+    barrier = threading.Barrier(count)
+
+    def call(_):
+        barrier.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(count) as executor:
+        return list(executor.map(call, range(count)))
+
+def test_coalesces_concurrent_calls():
+    """같은 키의 동시 호출이 한 번만 계산되고 결과를 공유하는지 테스트"""
+    flight = SingleFlight()
+    executions = []
+
+    def compute():
+        executions.append(1)
+        time.sleep(0.3)
+        return {'value': 42}
+
+    results = _concurrently(lambda: flight.do(('test', 'key'), compute), 8)
+    assert len(executions) == 1
+    assert all(result is results[0] for result in results)
+
+    metrics = flight.metrics()
+    assert metrics['in_flight'] == 0
+    assert metrics['groups']['test'] == {'calls': 8, 'executions': 1, 'coalesced': 7, 'coalescing_ratio': 7 / 8}
+
+def test_different_keys_and_later_calls_run_separately():
+    """다른 키는 따로 계산하고, 끝난 계산의 결과는 캐시하지 않는지 테스트"""
+    flight = SingleFlight()
+    assert flight.do(('test', 1), lambda: 1) == 1
+    assert flight.do(('test', 2), lambda: 2) == 2
+    assert flight.do(('test', 1), lambda: 3) == 3
+    assert flight.metrics()['groups']['test']['coalesced'] == 0
+
+def test_shares_exceptions():
+    """먼저 시작한 계산의 예외를 기다리던 호출도 받는지 테스트"""
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.3)
+        raise ValueError('boom')
+
+    def call():
+        try:
+            flight.do(('test', 'fail'), fail)
+        except ValueError as e:
+            return str(e)
+
+    assert _concurrently(call, 4) == ['boom'] * 4
+    assert flight.do(('test', 'fail'), lambda: 'ok') == 'ok'
+
+def test_shares_base_exceptions():
+    """Exception이 아닌 BaseException도 기다리던 호출에 None 대신 전달되는지 테스트"""
+    flight = SingleFlight()
+
+    class Cancelled(BaseException):
+        pass
+
+    def cancel():
+        time.sleep(0.3)
+        raise Cancelled()
+
+    def call():
+        try:
+            return flight.do(('test', 'cancel'), cancel)
+        except Cancelled:
+            return 'cancelled'
+
+    assert _concurrently(call, 4) == ['cancelled'] * 4
+
+def test_card_load_coalescing(tmp_path):
+    """같은 카드의 동시 로드가 하나로 병합되는지 테스트"""
+    (tmp_path / 'code.py').write_text(
+        'import time\n\nDELAY = time.sleep(0.3)\n\ndef double(x):\n    return 2 * x\n',
+        encoding='utf-8'
+    )
+    before = single_flight.metrics()['groups'].get('card_load', {'executions': 0})['executions']
+    cards = _concurrently(lambda: load_card(tmp_path), 6)
+    assert all(card is cards[0] for card in cards)
+    assert single_flight.metrics()['groups']['card_load']['executions'] == before + 1
+
+def test_run_code_coalescing(client):
+    """같은 코드의 동시 실행 요청이 한 번만 실행되는지 테스트"""
+    app = client.application
+    code = 'import time\ntime.sleep(0.5)\nprint("coalesced")'
+
+    def post():
+        with app.test_client() as thread_client:
+            return thread_client.post('/api/run-code', json={'code': code}).get_json()
+
+    results = _concurrently(post, 5)
+    assert all(result['output'] == 'coalesced\n' for result in results)
+    assert app.extensions['run_scheduler'].metrics()['submitted'] == 1
+
+    data = client.get('/api/health/metrics').get_json()
+    assert data['single_flight']['groups']['run_code']['coalesced'] >= 4
+
+def test_run_code_coalescing_keeps_lanes_and_admission(client):
+    """대기열이 다르면 병합하지 않고, 먼저 온 요청의 대기열 거절은 공유하지 않는지 테스트"""
+    app = client.application
+    scheduler = app.extensions['run_scheduler']
+    code = 'import time\ntime.sleep(0.5)\nprint("lanes")'
+
+    def post(priority, client_id='a'):
+        with app.test_client() as thread_client:
+            return thread_client.post('/api/run-code', json={'code': code, 'priority': priority},
+                                      environ_base={'REMOTE_ADDR': client_id})
+
+    # 대화형 요청이 배치 요청의 결과를 배치 대기열에서 기다리지 않음
+    before = scheduler.metrics()['submitted']
+    results = _concurrently(lambda: post('interactive'), 2)
+    with ThreadPoolExecutor(2) as executor:
+        responses = list(executor.map(post, ['interactive', 'batch']))
+    assert all(response.get_json()['output'] == 'lanes\n' for response in results + responses)
+    assert scheduler.metrics()['submitted'] == before + 3
+
+    submit = scheduler.submit
+
+    def reject_a(fn, client_id='anonymous', lane='interactive'):
+        if client_id == 'a':
+            time.sleep(0.3)
+            raise SchedulerOverloaded('Too many requests', 429, 1)
+        return submit(fn, client_id=client_id, lane=lane)
+
+    scheduler.submit = reject_a
+    try:
+        with ThreadPoolExecutor(3) as executor:
+            leader = executor.submit(post, 'interactive', 'a')
+            time.sleep(0.1)
+            followers = [executor.submit(post, 'interactive', client_id) for client_id in ('b', 'c')]
+            assert leader.result().status_code == 429
+            assert [response.result().status_code for response in followers] == [200, 200]
+    finally:
+        scheduler.submit = submit
+
+def test_run_code_rejects_invalid_variables(client):
+    """variables가 문자열 목록이 아니면 400인지 테스트"""
+    for variables in ('x', [1], {'x': 1}, [['x']]):
+        response = client.post('/api/run-code', json={'code': 'x = 1', 'variables': variables})
+        assert response.status_code == 400
+
+def test_card_function_coalescing(client):
+    """같은 인자의 동시 카드 함수 호출이 같은 결과를 받는지 테스트"""
+    app = client.application
+    before = single_flight.metrics()['groups'].get('card_function', {'calls': 0})['calls']
+
+    def post():
+        with app.test_client() as thread_client:
+            response = thread_client.post('/api/cards/math-linear-function-001/functions/analyze_linear_function',
+                                          json={'m': 2, 'b': 1})
+            assert response.status_code == 200
+            return response.get_json()
+
+    results = _concurrently(post, 4)
+    assert results[0]['slope'] == 2
+    assert all(result == results[0] for result in results)
+    assert single_flight.metrics()['groups']['card_function']['calls'] == before + 4
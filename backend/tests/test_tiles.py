@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from app import create_app
+from app.services.catalog import find_card_dir
+from app.services.tiles import build_card_tiles, load_card_tiles
+
+LINEAR_CARD = 'math-linear-function-001'
+
+@pytest.fixture
+def client(tmp_path):
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['TILES_DIR'] = tmp_path / 'tiles'
+    
+    with app.test_client() as client:
+        yield client
+
+def test_tiles_not_built(client):
+    """타일이 없으면 404를 반환하는지 테스트"""
+    response = client.get(f'/api/cards/{LINEAR_CARD}/tiles/lookup?m=1&b=2')
+    assert response.status_code == 404
+
+def test_build_and_lookup_tiles(client, tmp_path):
+    """격자 타일을 빌드하고 가장 가까운 격자점을 조회하는지 테스트"""
+    card_dir = find_card_dir(LINEAR_CARD)
+    meta = build_card_tiles(card_dir, tmp_path / 'tiles')
+    assert meta['count'] == 21 * 41
+
+    _, tiles = load_card_tiles(card_dir, tmp_path / 'tiles')
+    assert isinstance(tiles, np.memmap)
+
+    response = client.get(f'/api/cards/{LINEAR_CARD}/tiles')
+    assert response.get_json()['parameters']['m'][:3] == [-5.0, -4.5, -4.0]
+
+    response = client.get(f'/api/cards/{LINEAR_CARD}/tiles/lookup?m=2.1&b=-4')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['parameters'] == {'m': 2.0, 'b': -4.0}
+    assert data['snapped']
+    assert data['x_intercept'] == 2.0
+    assert np.allclose(data['y_values'], 2 * np.array(data['x_values']) - 4, atol=1e-5)
+
+    response = client.get(f'/api/cards/{LINEAR_CARD}/tiles/lookup?m=0&b=1')
+    assert response.get_json()['x_intercept'] is None
+
+    response = client.get(f'/api/cards/{LINEAR_CARD}/tiles/lookup?m=abc')
+    assert response.status_code == 400
+
+def test_tile_lookup_revalidates_with_etag(client, tmp_path):
+    """타일 조회는 ETag로 재검증하고 바뀌지 않았으면 304를 반환하는지 테스트"""
+    build_card_tiles(find_card_dir(LINEAR_CARD), tmp_path / 'tiles')
+    url = f'/api/cards/{LINEAR_CARD}/tiles/lookup?m=1&b=2'
+    
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.cache_control.no_cache
+    assert response.cache_control.max_age is None
+    etag = response.headers['ETag']
+    
+    cached = client.get(url, headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert client.get(f'{url}&format=base64', headers={'If-None-Match': etag}).status_code == 200
@@ -1,6 +1,192 @@
+import ast
+import math
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
-from sympy import symbols, solve, S, sin, cos, tan, log, exp, sqrt, oo
+from sympy import (symbols, solve, S, sin, cos, tan, asin, acos, atan, log, exp, sqrt, oo,
+                   Abs, Add, Basic, E, Interval, Mul, Pow, Union, pi, lambdify)
+from sympy.calculus.util import continuous_domain
+from sympy.printing.numpy import NumPyPrinter
+
+# 사용자 입력 수식에서 허용하는 함수와 상수 (화이트리스트)
+ALLOWED_FUNCTIONS = {
+    'sin': sin, 'cos': cos, 'tan': tan,
+    'asin': asin, 'acos': acos, 'atan': atan,
+    'log': log, 'exp': exp, 'sqrt': sqrt, 'abs': Abs
+}
+ALLOWED_CONSTANTS = {'pi': pi, 'e': E}
+MAX_EXPRESSION_LENGTH = 200
+MAX_EXPONENT = 100  # 9**9**9 같은 거대한 정수 계산 방지
+MAX_POWER_DIGITS = 300  # 숫자 거듭제곱 결과의 최대 자릿수 ((99**99)**99 같은 중첩 방지)
+# 연산은 단순화하지 않고(evaluate=False) 입력 구조 그대로 sympy 식으로 만듭니다.
+ALLOWED_OPERATORS = {
+    ast.Add: lambda a, b: Add(a, b, evaluate=False),
+    ast.Sub: lambda a, b: Add(a, Mul(-1, b, evaluate=False), evaluate=False),
+    ast.Mult: lambda a, b: Mul(a, b, evaluate=False),
+    ast.Div: lambda a, b: Mul(a, Pow(b, -1, evaluate=False), evaluate=False),
+    ast.Pow: lambda a, b: Pow(a, b, evaluate=False)
+}
+
+# 잘 알려진 함수의 도메인과 범위
+KNOWN_DOMAINS = {
+    "x**2": ("(-∞, ∞)", "[0, ∞)"),
+    "1/x": ("(-∞, 0) ∪ (0, ∞)", "(-∞, 0) ∪ (0, ∞)"),
+    "sqrt(x)": ("[0, ∞)", "[0, ∞)"),
+    "sin(x)": ("(-∞, ∞)", "[-1, 1]"),
+    "cos(x)": ("(-∞, ∞)", "[-1, 1]"),
+    "tan(x)": ("(-∞, ∞) except π/2 + nπ", "(-∞, ∞)"),
+    "log(x)": ("(0, ∞)", "(-∞, ∞)"),
+    "exp(x)": ("(-∞, ∞)", "(0, ∞)"),
+    "abs(x)": ("(-∞, ∞)", "[0, ∞)"),
+    "x**3": ("(-∞, ∞)", "(-∞, ∞)")
+}
+
+X = symbols('x')
+
+def _power_digits(base, exponent):
+    """숫자 base**exponent 결과의 대략적인 자릿수 |exponent · log10|base||"""
+    base = abs(base)
+    if base.is_Rational:
+        if base.p == 0:
+            return 0.0
+        digits = math.log10(base.p) - math.log10(base.q)
+    else:
+        try:
+            digits = math.log10(float(base))
+        except (OverflowError, ValueError, TypeError):
+            return math.inf
+    return abs(float(exponent) * digits)
+
+def _to_sympy(node):
+    """
+    허용된 AST 노드만 단순화하지 않은(evaluate=False) sympy 식으로 변환합니다.
+    
+    sqrt(x)**2나 log(exp(x))가 x로 바뀌지 않으므로 입력 그대로의 정의역을 유지합니다.
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return S(node.value)
+    if isinstance(node, ast.Name):
+        if node.id == 'x':
+            return X
+        if node.id in ALLOWED_CONSTANTS:
+            return ALLOWED_CONSTANTS[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in ALLOWED_OPERATORS:
+        left, right = _to_sympy(node.left), _to_sympy(node.right)
+        if isinstance(node.op, ast.Pow) and right.is_number and (
+                abs(right) > MAX_EXPONENT
+                or left.is_number and _power_digits(left, right) > MAX_POWER_DIGITS):
+            raise ValueError(f"지수가 너무 큽니다: {ast.unparse(node)}")
+        return ALLOWED_OPERATORS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _to_sympy(node.operand)
+        return Mul(-1, operand, evaluate=False) if isinstance(node.op, ast.USub) else operand
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+            and node.func.id in ALLOWED_FUNCTIONS and len(node.args) == 1 and not node.keywords:
+        return ALLOWED_FUNCTIONS[node.func.id](_to_sympy(node.args[0]), evaluate=False)
+    raise ValueError(f"허용되지 않는 수식 요소: {ast.unparse(node)}")
+
+@lru_cache(maxsize=256)
+def parse_expression(func_expr):
+    """
+    사용자 입력 수식을 화이트리스트 AST로 파싱해 단순화하지 않은 sympy 식으로 변환합니다.
+    
+    Args:
+        func_expr (str): 함수 표현식 (예: "x**2 + 2*x + 1")
+    
+    Returns:
+        sympy.Expr: x에 대한 식
+    """
+    if len(func_expr) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"수식이 너무 깁니다 (최대 {MAX_EXPRESSION_LENGTH}자)")
+    try:
+        tree = ast.parse(func_expr.strip(), mode='eval')
+    except SyntaxError:
+        raise ValueError(f"수식을 해석할 수 없습니다: {func_expr}")
+    return _to_sympy(tree.body)
+
+def _defined(values):
+    """중간 결과의 ±inf도 정의되지 않은 값(NaN)으로 (exp(log(0))이 0이 되지 않도록)"""
+    return np.where(np.isfinite(values), values, np.nan)
+
+def _masked_tan(values):
+    """tan의 불연속점(cos = 0) 근처는 정의되지 않은 값(NaN)으로"""
+    return np.where(np.abs(np.cos(values)) > 1e-10, np.tan(values), np.nan)
+
+class _DefinedPrinter(NumPyPrinter):
+    """모든 중간 결과를 _defined로 감싸고 tan은 _masked_tan으로 출력하는 NumPy 코드 출력기"""
+    
+    def _print(self, expr, **kwargs):
+        if isinstance(expr, tan):
+            return f'masked_tan({self._print(expr.args[0], **kwargs)})'
+        text = super()._print(expr, **kwargs)
+        return text if not isinstance(expr, Basic) or expr.is_Atom else f'defined({text})'
+
+@lru_cache(maxsize=256)
+def _lambdify_expression(f):
+    return lambdify(X, f, modules=[{'defined': _defined, 'masked_tan': _masked_tan}, 'numpy'],
+                    printer=_DefinedPrinter)
+
+def compile_expression(func_expr):
+    """
+    수식을 벡터화된 NumPy 함수로 컴파일합니다.
+    
+    단순화하지 않은 식을 그대로 lambdify하므로 정의역이 입력과 같고
+    (sqrt(x)**2는 x < 0에서 정의되지 않음), 같은 식 구조는 한 번만 컴파일됩니다.
+    
+    Returns:
+        tuple: (sympy 식, 벡터화된 함수)
+    """
+    f = parse_expression(func_expr)
+    return f, _lambdify_expression(f)
+
+def evaluate_expression(func_expr, x_vals):
+    """
+    격자 전체를 한 번의 배열 연산으로 평가합니다.
+    
+    정의되지 않는 점(0으로 나누기, 음수의 제곱근/로그, tan의 점근선 등)은 NaN입니다.
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+    _, compiled = compile_expression(func_expr)
+    with np.errstate(all='ignore'):
+        y_vals = np.asarray(compiled(x_vals), dtype=float)
+    y_vals = np.broadcast_to(y_vals, x_vals.shape).copy()
+    y_vals[~np.isfinite(y_vals)] = np.nan
+    return y_vals
+
+def _format_bound(value):
+    if value == oo:
+        return '∞'
+    if value == -oo:
+        return '-∞'
+    return str(value)
+
+def _format_set(domain):
+    """sympy 구간/합집합을 "(-∞, 0) ∪ (0, ∞)" 같은 표기로 변환합니다."""
+    if isinstance(domain, Union):
+        return ' ∪ '.join(_format_set(part) for part in domain.args)
+    if isinstance(domain, Interval):
+        left = '(' if domain.left_open or domain.start == -oo else '['
+        right = ')' if domain.right_open or domain.end == oo else ']'
+        return f'{left}{_format_bound(domain.start)}, {_format_bound(domain.end)}{right}'
+    return str(domain)
+
+def describe_domain(func_expr):
+    """
+    알려진 함수가 아니면 단순화하지 않은 식에서 정의역을 계산합니다.
+    
+    sympy가 정의역을 구하지 못하면 모든 실수에서 정의된다고 가정합니다.
+    """
+    if func_expr in KNOWN_DOMAINS:
+        return KNOWN_DOMAINS[func_expr][0]
+    f = parse_expression(func_expr)
+    try:
+        return _format_set(continuous_domain(f, X, S.Reals))
+    except (NotImplementedError, TypeError, ValueError):
+        return "(-∞, ∞)"
+
+# 분석 함수 이름 -> 같은 파라미터로 곡선을 평가하는 벡터화 함수 (서버의 적응형 샘플링에서 사용)
+CURVES = {'analyze_function': evaluate_expression}
 
 def analyze_function(func_expr, x_range=(-10, 10)):
     """
@@ -13,98 +199,22 @@ def analyze_function(func_expr, x_range=(-10, 10)):
     Returns:
         dict: 분석 결과
     """
-    x = symbols('x')
-    
     try:
-        # 함수 정의 및 도메인/범위 분석
-        if func_expr == "x**2":
-            f = x**2
-            domain = "(-∞, ∞)"
-            range_desc = "[0, ∞)"
-        elif func_expr == "1/x":
-            f = 1/x
-            domain = "(-∞, 0) ∪ (0, ∞)"
-            range_desc = "(-∞, 0) ∪ (0, ∞)"
-        elif func_expr == "sqrt(x)":
-            f = sqrt(x)
-            domain = "[0, ∞)"
-            range_desc = "[0, ∞)"
-        elif func_expr == "sin(x)":
-            f = sin(x)
-            domain = "(-∞, ∞)"
-            range_desc = "[-1, 1]"
-        elif func_expr == "cos(x)":
-            f = cos(x)
-            domain = "(-∞, ∞)"
-            range_desc = "[-1, 1]"
-        elif func_expr == "tan(x)":
-            f = tan(x)
-            domain = "(-∞, ∞) except π/2 + nπ"
-            range_desc = "(-∞, ∞)"
-        elif func_expr == "log(x)":
-            f = log(x)
-            domain = "(0, ∞)"
-            range_desc = "(-∞, ∞)"
-        elif func_expr == "exp(x)":
-            f = exp(x)
-            domain = "(-∞, ∞)"
-            range_desc = "(0, ∞)"
-        elif func_expr == "abs(x)":
-            f = abs(x)
-            domain = "(-∞, ∞)"
-            range_desc = "[0, ∞)"
-        elif func_expr == "x**3":
-            f = x**3
-            domain = "(-∞, ∞)"
-            range_desc = "(-∞, ∞)"
-        else:
-            # 사용자 정의 함수 처리
-            try:
-                f = eval(func_expr)
-                # 기본적으로 모든 실수에서 정의된다고 가정
-                domain = "(-∞, ∞)"
-                range_desc = "(-∞, ∞)"
-            except:
-                f = x**2  # 기본값
-                domain = "(-∞, ∞)"
-                range_desc = "[0, ∞)"
+        # 도메인은 입력 그대로의 식에서 계산, 범위는 알려진 함수가 아니면 모든 실수로 가정
+        domain = describe_domain(func_expr)
+        range_desc = KNOWN_DOMAINS.get(func_expr, (domain, "(-∞, ∞)"))[1]
         
-        # 그래프 생성
+        # 그래프 생성 (정의되지 않는 점은 NaN으로 표시 후 한 번에 제거)
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
-        
-        # 정의역 제한 적용
-        if func_expr == "1/x":
-            x_vals = x_vals[x_vals != 0]
-        elif func_expr == "sqrt(x)":
-            x_vals = x_vals[x_vals >= 0]
-        elif func_expr == "log(x)":
-            x_vals = x_vals[x_vals > 0]
-        elif func_expr == "tan(x)":
-            # 탄젠트 함수의 불연속점 제거
-            x_vals = x_vals[np.abs(np.cos(x_vals)) > 1e-10]
-        
-        y_vals = []
-        for x_val in x_vals:
-            try:
-                y_val = float(f.subs(x, x_val))
-                if not np.isnan(y_val) and not np.isinf(y_val):
-                    y_vals.append(y_val)
-                else:
-                    y_vals.append(None)
-            except:
-                y_vals.append(None)
-        
-        # None 값 제거
-        valid_indices = [i for i, y in enumerate(y_vals) if y is not None]
-        x_vals = x_vals[valid_indices]
-        y_vals = [y_vals[i] for i in valid_indices]
+        y_vals = evaluate_expression(func_expr, x_vals)
+        valid = ~np.isnan(y_vals)
         
         return {
             'function': func_expr,
             'domain': domain,
             'range': range_desc,
-            'x_values': x_vals.tolist(),
-            'y_values': y_vals,
+            'x_values': x_vals[valid],
+            'y_values': y_vals[valid],
             'success': True
         }
         
@@ -118,8 +228,8 @@ def analyze_function(func_expr, x_range=(-10, 10)):
 functions = ["x**2", "1/x", "sqrt(x)", "sin(x)", "log(x)", "exp(x)", "abs(x)", "x**3"]
 
 print("=== 함수 도메인과 범위 분석 ===")
-for func in functions:
-    result = analyze_function(func)
+results = [analyze_function(func) for func in functions]
+for func, result in zip(functions, results):
     if result['success']:
         print(f"\n함수: f(x) = {result['function']}")
         print(f"도메인: {result['domain']}")
@@ -130,8 +240,7 @@ for func in functions:
 # 시각화
 plt.figure(figsize=(15, 10))
 
-for i, func in enumerate(functions):
-    result = analyze_function(func)
+for i, result in enumerate(results):
     if result['success']:
         plt.subplot(2, 4, i+1)
         plt.plot(result['x_values'], result['y_values'], 'b-', linewidth=2)
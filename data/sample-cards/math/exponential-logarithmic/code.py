@@ -2,6 +2,57 @@ import numpy as np
 import matplotlib.pyplot as plt
 import math
 
+# 배치 방정식 풀이 상태 코드
+STATUS_SOLVED = 0
+STATUS_NO_SOLUTION = 1
+STATUS_INVALID_BASE = 2
+STATUS_LABELS = {
+    STATUS_SOLVED: 'solved',
+    STATUS_NO_SOLUTION: 'no_solution',
+    STATUS_INVALID_BASE: 'invalid_base'
+}
+
+def _as_column(value):
+    """파라미터를 (n, 1) 열 배열로 바꿔 x 격자(m,)와 브로드캐스트되게 합니다."""
+    return np.asarray(value, dtype=float).reshape(-1, 1)
+
+def exponential_curve(a, b, c, d, x_vals):
+    """
+    f(x) = b * a^(x+c) + d를 배열 연산으로 평가합니다.
+    
+    a, b, c, d가 스칼라면 x_vals와 같은 모양, 길이 n인 배열이면 (n, m) 행렬을
+    반환합니다. 밑수가 양수가 아닌 경우는 NaN입니다.
+    """
+    scalar = np.ndim(a) == np.ndim(b) == np.ndim(c) == np.ndim(d) == 0
+    a, b, c, d = (_as_column(p) for p in (a, b, c, d))
+    x_vals = np.asarray(x_vals, dtype=float)
+    with np.errstate(all='ignore'):
+        y_vals = np.where(a > 0, b * np.power(np.where(a > 0, a, 1.0), x_vals + c) + d, np.nan)
+    return y_vals[0] if scalar else y_vals
+
+def logarithmic_curve(a, b, c, d, x_vals):
+    """
+    f(x) = b * log_a(x+c) + d를 밑 변환(ln(x+c) / ln(a))으로 평가합니다.
+    
+    정의역 밖(x + c <= 0)이나 잘못된 밑수(a <= 0, a = 1)는 NaN입니다.
+    모양 규칙은 exponential_curve와 같습니다.
+    """
+    scalar = np.ndim(a) == np.ndim(b) == np.ndim(c) == np.ndim(d) == 0
+    a, b, c, d = (_as_column(p) for p in (a, b, c, d))
+    x_vals = np.asarray(x_vals, dtype=float)
+    argument = x_vals + c
+    mask = (argument > 0) & (a > 0) & (a != 1)
+    with np.errstate(all='ignore'):
+        y_vals = b * np.log(np.where(mask, argument, 1.0)) / np.log(a) + d
+    y_vals = np.where(mask, y_vals, np.nan)
+    return y_vals[0] if scalar else y_vals
+
+# 분석 함수 이름 -> 같은 파라미터로 곡선을 평가하는 벡터화 함수 (서버의 적응형 샘플링에서 사용)
+CURVES = {
+    'analyze_exponential_function': exponential_curve,
+    'analyze_logarithmic_function': logarithmic_curve
+}
+
 def analyze_exponential_function(a, b, c=0, d=0, x_range=(-5, 5)):
     """
     지수함수의 성질을 분석하고 시각화합니다.
@@ -63,7 +114,7 @@ def analyze_exponential_function(a, b, c=0, d=0, x_range=(-5, 5)):
         
         # 그래프 생성
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
-        y_vals = b * (a ** (x_vals + c)) + d
+        y_vals = exponential_curve(a, b, c, d, x_vals)
         
         # 특별한 경우들
         special_cases = []
@@ -88,8 +139,8 @@ def analyze_exponential_function(a, b, c=0, d=0, x_range=(-5, 5)):
             'y_intercept_desc': f"y = {y_intercept:.4f}",
             'x_intercept_desc': x_intercept_desc,
             'special_cases': special_cases,
-            'x_values': x_vals.tolist(),
-            'y_values': y_vals.tolist(),
+            'x_values': x_vals,
+            'y_values': y_vals,
             'success': True
         }
         
@@ -115,6 +166,8 @@ def analyze_logarithmic_function(a, b, c=0, d=0, x_range=(0.1, 10)):
     """
     try:
         # 로그함수 정의: f(x) = b * log_a(x + c) + d
+        if a <= 0 or a == 1:
+            raise ValueError(f"Invalid base: {a} (base must be positive and not 1)")
         
         # 기본 성질
         domain = f"({-c}, ∞)" if c < 0 else f"[{-c}, ∞)"
@@ -165,18 +218,12 @@ def analyze_logarithmic_function(a, b, c=0, d=0, x_range=(0.1, 10)):
         
         # 그래프 생성
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
-        y_vals = []
-        for x_val in x_vals:
-            if x_val + c > 0:
-                y_val = b * math.log(x_val + c, a) + d
-                y_vals.append(y_val)
-            else:
-                y_vals.append(None)
+        y_vals = logarithmic_curve(a, b, c, d, x_vals)
         
-        # None 값 제거
-        valid_indices = [i for i, y in enumerate(y_vals) if y is not None]
-        x_vals = x_vals[valid_indices]
-        y_vals = [y_vals[i] for i in valid_indices]
+        # 정의역 밖(NaN) 값을 한 번에 제거
+        valid = ~np.isnan(y_vals)
+        x_vals = x_vals[valid]
+        y_vals = y_vals[valid]
         
         # 특별한 경우들
         special_cases = []
@@ -201,7 +248,7 @@ def analyze_logarithmic_function(a, b, c=0, d=0, x_range=(0.1, 10)):
             'y_intercept_desc': y_intercept_desc,
             'x_intercept_desc': x_intercept_desc,
             'special_cases': special_cases,
-            'x_values': x_vals.tolist(),
+            'x_values': x_vals,
             'y_values': y_vals,
             'success': True
         }
@@ -212,6 +259,111 @@ def analyze_logarithmic_function(a, b, c=0, d=0, x_range=(0.1, 10)):
             'error': str(e)
         }
 
+def analyze_exponential_batch(a, b, c=0, d=0, x_range=(-5, 5), num_points=1000):
+    """
+    여러 지수함수 파라미터 세트를 한 번에 분석합니다.
+    
+    a, b, c, d는 스칼라 또는 같은 길이의 리스트이며 서로 브로드캐스트됩니다.
+    결과는 열 단위(columnar)로, 파라미터별 값은 길이 n 배열이고
+    y_values는 공통 x 격자에 대한 (n, num_points) 행렬입니다.
+    x절편이 없으면 NaN입니다.
+    
+    잘못된 밑수(a <= 0)가 있어도 배치 전체를 실패시키지 않습니다. 그 행은
+    valid_base가 False, function_type이 'invalid base'이고 절편과 y_values는 NaN입니다.
+    
+    Returns:
+        dict: 열 단위 분석 결과
+    """
+    try:
+        a, b, c, d = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in (a, b, c, d)))
+        x_vals = np.linspace(x_range[0], x_range[1], num_points)
+        valid_base = a > 0
+        
+        with np.errstate(all='ignore'):
+            y_intercept = np.where(a > 0, b * np.power(np.abs(a), c) + d, np.nan)
+            # b * a^(x+c) + d = 0  =>  x = ln(-d/b) / ln(a) - c
+            x_intercept = np.log(-d / b) / np.log(a) - c
+        has_x_intercept = (b != 0) & (a > 0) & (a != 1) & np.isfinite(x_intercept)
+        
+        function_type = np.select(
+            [(b > 0) & (a > 1), (b > 0) & (a > 0) & (a < 1), (b <= 0) & (a > 1), (b <= 0) & (a > 0) & (a < 1)],
+            ["exponential growth", "exponential decay", "exponential decay (negative)", "exponential growth (negative)"],
+            "constant"
+        )
+        function_type = np.where(valid_base, function_type, "invalid base")
+        
+        return {
+            'count': len(a),
+            'base': a,
+            'valid_base': valid_base,
+            'coefficient': b,
+            'exponent_shift': c,
+            'vertical_shift': d,
+            'function_type': function_type.tolist(),
+            'y_intercept': y_intercept,
+            'x_intercept': np.where(has_x_intercept, x_intercept, np.nan),
+            'x_values': x_vals,
+            'y_values': exponential_curve(a, b, c, d, x_vals),
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def analyze_logarithmic_batch(a, b, c=0, d=0, x_range=(0.1, 10), num_points=1000):
+    """
+    여러 로그함수 파라미터 세트를 한 번에 분석합니다.
+    
+    형식과 잘못된 밑수 처리는 analyze_exponential_batch와 같고, 정의역 밖의 y 값과
+    절편이 없는 경우는 NaN입니다. 잘못된 밑수(a <= 0, a = 1)인 행은
+    valid_base가 False, function_type이 'invalid base'이고 절편과 y_values는 NaN입니다.
+    
+    Returns:
+        dict: 열 단위 분석 결과
+    """
+    try:
+        a, b, c, d = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in (a, b, c, d)))
+        x_vals = np.linspace(x_range[0], x_range[1], num_points)
+        valid_base = (a > 0) & (a != 1)
+        
+        with np.errstate(all='ignore'):
+            y_intercept = np.where((c > 0) & valid_base, b * np.log(np.abs(c)) / np.log(a) + d, np.nan)
+            # b * log_a(x+c) + d = 0  =>  x = a^(-d/b) - c
+            x_intercept = np.power(np.abs(a), -d / b) - c
+        has_x_intercept = (b != 0) & valid_base & (x_intercept > -c) & np.isfinite(x_intercept)
+        
+        function_type = np.select(
+            [(b > 0) & (a > 1), (b > 0) & (a > 0) & (a < 1), (b <= 0) & (a > 1), (b <= 0) & (a > 0) & (a < 1)],
+            ["logarithmic growth", "logarithmic decay", "logarithmic decay (negative)", "logarithmic growth (negative)"],
+            "constant"
+        )
+        function_type = np.where(valid_base, function_type, "invalid base")
+        
+        return {
+            'count': len(a),
+            'base': a,
+            'valid_base': valid_base,
+            'coefficient': b,
+            'argument_shift': c,
+            'vertical_shift': d,
+            'domain_start': -c,
+            'function_type': function_type.tolist(),
+            'y_intercept': y_intercept,
+            'x_intercept': np.where(has_x_intercept, x_intercept, np.nan),
+            'x_values': x_vals,
+            'y_values': logarithmic_curve(a, b, c, d, x_vals),
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
 def solve_exponential_equation(a, b, c, target=0):
     """
     지수방정식을 풉니다: a * b^x + c = target
@@ -344,6 +496,81 @@ def solve_logarithmic_equation(a, b, c, target=0):
             'error': str(e)
         }
 
+def _equation_columns(a, b, c, target):
+    return np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in (a, b, c, target)))
+
+def _batch_solution(solutions, status):
+    """풀이 배열과 상태 코드로 열 단위 결과를 만듭니다."""
+    return {
+        'count': len(status),
+        'solutions': np.where(status == STATUS_SOLVED, solutions, np.nan),
+        'status': status,
+        'status_labels': STATUS_LABELS,
+        'solved_count': int(np.count_nonzero(status == STATUS_SOLVED)),
+        'success': True
+    }
+
+def solve_exponential_equations(a, b, c, target=0):
+    """
+    지수방정식 a * b^x + c = target 여러 개를 한 번에 풉니다.
+    
+    계수는 스칼라 또는 같은 길이의 리스트입니다. 각 방정식의 해는
+    x = ln((target - c) / a) / ln(b)이며, 마스크 연산으로 한 번에 계산합니다.
+    
+    Returns:
+        dict: 해 배열(해가 없으면 NaN)과 상태 코드 배열
+              (STATUS_SOLVED, STATUS_NO_SOLUTION, STATUS_INVALID_BASE)
+    """
+    try:
+        a, b, c, target = _equation_columns(a, b, c, target)
+        
+        with np.errstate(all='ignore'):
+            right_side = (target - c) / a
+            solutions = np.log(right_side) / np.log(b)
+        
+        status = np.select(
+            [a == 0, (b <= 0) | (b == 1), (right_side > 0) & np.isfinite(solutions)],
+            [STATUS_NO_SOLUTION, STATUS_INVALID_BASE, STATUS_SOLVED],
+            STATUS_NO_SOLUTION
+        ).astype(np.int8)
+        return _batch_solution(solutions, status)
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def solve_logarithmic_equations(a, b, c, target=0):
+    """
+    로그방정식 a * log_b(x) + c = target 여러 개를 한 번에 풉니다.
+    
+    각 방정식의 해는 x = b^((target - c) / a)이며, 형식은
+    solve_exponential_equations와 같습니다.
+    
+    Returns:
+        dict: 해 배열(해가 없으면 NaN)과 상태 코드 배열
+    """
+    try:
+        a, b, c, target = _equation_columns(a, b, c, target)
+        invalid_base = (b <= 0) | (b == 1)
+        
+        with np.errstate(all='ignore'):
+            solutions = np.power(np.where(invalid_base, 1.0, b), (target - c) / a)
+        
+        status = np.select(
+            [a == 0, invalid_base, (solutions > 0) & np.isfinite(solutions)],
+            [STATUS_NO_SOLUTION, STATUS_INVALID_BASE, STATUS_SOLVED],
+            STATUS_NO_SOLUTION
+        ).astype(np.int8)
+        return _batch_solution(solutions, status)
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
 # 예제 실행
 print("=== 지수함수와 로그함수 분석 ===")
 
@@ -403,14 +630,15 @@ exp_equations = [
     {"a": 2, "b": 3, "c": 1, "target": 19}
 ]
 
-for eq in exp_equations:
-    result = solve_exponential_equation(eq["a"], eq["b"], eq["c"], eq["target"])
-    if result['success']:
-        print(f"\n방정식: {result['equation']}")
-        if result['solutions']:
-            print(f"해: x = {result['solutions']}")
-        else:
-            print(f"해: {result['message']}")
+exp_batch = solve_exponential_equations(*(
+    [eq[key] for eq in exp_equations] for key in ("a", "b", "c", "target")
+))
+for eq, solution, status in zip(exp_equations, exp_batch['solutions'], exp_batch['status']):
+    print(f"\n방정식: {eq['a']} * {eq['b']}^x + {eq['c']} = {eq['target']}")
+    if status == STATUS_SOLVED:
+        print(f"해: x = [{solution}]")
+    else:
+        print(f"해: {STATUS_LABELS[status]}")
 
 print("\n--- 로그방정식 해결 ---")
 log_equations = [
@@ -419,14 +647,15 @@ log_equations = [
     {"a": 2, "b": 2, "c": 1, "target": 5}
 ]
 
-for eq in log_equations:
-    result = solve_logarithmic_equation(eq["a"], eq["b"], eq["c"], eq["target"])
-    if result['success']:
-        print(f"\n방정식: {result['equation']}")
-        if result['solutions']:
-            print(f"해: x = {result['solutions']}")
-        else:
-            print(f"해: {result['message']}")
+log_batch = solve_logarithmic_equations(*(
+    [eq[key] for eq in log_equations] for key in ("a", "b", "c", "target")
+))
+for eq, solution, status in zip(log_equations, log_batch['solutions'], log_batch['status']):
+    print(f"\n방정식: {eq['a']} * log_{eq['b']}(x) + {eq['c']} = {eq['target']}")
+    if status == STATUS_SOLVED:
+        print(f"해: x = [{solution}]")
+    else:
+        print(f"해: {STATUS_LABELS[status]}")
 
 # 시각화
 plt.figure(figsize=(20, 12))
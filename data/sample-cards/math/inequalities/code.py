@@ -1,7 +1,220 @@
+import ast
+import math
+import sys
+import time
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
-from sympy import symbols, solve, S
 import matplotlib.patches as patches
+from matplotlib.figure import Figure
+
+# 부등식 유형 -> 경계점 종류
+BOUNDARY_TYPES = {'>': 'open', '<': 'open', '>=': 'closed', '<=': 'closed'}
+# 양변에 음수를 곱할 때 뒤집히는 부등호
+FLIPPED_INEQUALITY = {'>': '<', '<': '>', '>=': '<=', '<=': '>='}
+
+# 일반 부등식(기호 풀이)에서 허용하는 함수 -> sympy 이름
+SYMBOLIC_FUNCTIONS = {
+    'sin': 'sin', 'cos': 'cos', 'tan': 'tan', 'log': 'log',
+    'exp': 'exp', 'sqrt': 'sqrt', 'abs': 'Abs'
+}
+SYMBOLIC_TIME_BUDGET = 2.0  # 초 (기본값이자 최댓값)
+MAX_EXPRESSION_LENGTH = 200
+MAX_EXPONENT = 100  # 9**9**9 같은 거대한 정수 계산 방지
+MAX_POWER_DIGITS = 300  # 숫자 거듭제곱 결과의 최대 자릿수 ((99**99)**99 같은 중첩 방지)
+
+# 2차원 영역 출력 설정
+REGION_TOLERANCE = 1 / 500  # 경계 곡선 다각형의 허용 오차 (y 범위 대비)
+REGION_MAX_POINTS = 257  # 경계 곡선 다각형의 최대 점 수
+DEFAULT_MASK_RESOLUTION = 64  # RLE 마스크 한 변의 칸 수
+
+# 연립부등식(반평면 교집합) 설정
+SYSTEM_BOUND = 1e6  # 무한 영역을 닫는 상자 (|x|, |y| ≤ SYSTEM_BOUND)
+HALF_PLANE_EPS = 1e-7
+
+class IntervalSet:
+    """
+    서로 겹치지 않는 실수 구간들의 합집합
+    
+    구간은 (아래끝, 위끝, 아래끝 포함, 위끝 포함) 튜플이며 무한대는 ±inf입니다.
+    항상 정렬되고 병합된 상태를 유지하므로 합집합은 정렬 한 번(O(n log n)),
+    교집합과 여집합은 한 번의 순회(O(n))로 계산됩니다.
+    """
+    
+    def __init__(self, intervals=()):
+        self.intervals = self._normalize(intervals)
+    
+    @staticmethod
+    def _normalize(intervals):
+        """빈 구간을 버리고 겹치거나 맞닿은 구간을 병합합니다."""
+        items = sorted(
+            (float(low), float(high), bool(low_closed and np.isfinite(low)), bool(high_closed and np.isfinite(high)))
+            for low, high, low_closed, high_closed in intervals
+            if low < high or (low == high and low_closed and high_closed)
+        )
+        merged = []
+        for low, high, low_closed, high_closed in items:
+            if merged:
+                last_low, last_high, last_low_closed, last_high_closed = merged[-1]
+                if low < last_high or (low == last_high and (low_closed or last_high_closed)):
+                    # 같은 끝점을 공유하면 어느 한쪽이라도 포함할 때 포함
+                    if low == last_low:
+                        last_low_closed = last_low_closed or low_closed
+                    if high > last_high:
+                        last_high, last_high_closed = high, high_closed
+                    elif high == last_high:
+                        last_high_closed = last_high_closed or high_closed
+                    merged[-1] = (last_low, last_high, last_low_closed, last_high_closed)
+                    continue
+            merged.append((low, high, low_closed, high_closed))
+        return tuple(merged)
+    
+    @classmethod
+    def everything(cls):
+        return cls([(-np.inf, np.inf, False, False)])
+    
+    @classmethod
+    def point(cls, value):
+        return cls([(value, value, True, True)])
+    
+    @classmethod
+    def ray(cls, boundary, inequality_type):
+        """x (부등호) boundary의 해집합"""
+        closed = BOUNDARY_TYPES[inequality_type] == 'closed'
+        if inequality_type in ('>', '>='):
+            return cls([(boundary, np.inf, closed, False)])
+        return cls([(-np.inf, boundary, False, closed)])
+    
+    @classmethod
+    def from_list(cls, items):
+        """to_list 형식(무한대는 None)의 구간 목록으로 만듭니다."""
+        return cls([
+            (-np.inf if item['low'] is None else item['low'],
+             np.inf if item['high'] is None else item['high'],
+             item.get('low_closed', False), item.get('high_closed', False))
+            for item in items
+        ])
+    
+    def to_list(self):
+        """JSON으로 보낼 수 있는 구간 목록 (무한대는 None)"""
+        return [
+            {'low': low if np.isfinite(low) else None,
+             'high': high if np.isfinite(high) else None,
+             'low_closed': low_closed, 'high_closed': high_closed}
+            for low, high, low_closed, high_closed in self.intervals
+        ]
+    
+    def union(self, other):
+        return IntervalSet(self.intervals + other.intervals)
+    
+    def intersection(self, other):
+        result = []
+        i = j = 0
+        a, b = self.intervals, other.intervals
+        while i < len(a) and j < len(b):
+            a_low, a_high, a_low_closed, a_high_closed = a[i]
+            b_low, b_high, b_low_closed, b_high_closed = b[j]
+            
+            if a_low != b_low:
+                low, low_closed = (a_low, a_low_closed) if a_low > b_low else (b_low, b_low_closed)
+            else:
+                low, low_closed = a_low, a_low_closed and b_low_closed
+            if a_high != b_high:
+                high, high_closed = (a_high, a_high_closed) if a_high < b_high else (b_high, b_high_closed)
+            else:
+                high, high_closed = a_high, a_high_closed and b_high_closed
+            result.append((low, high, low_closed, high_closed))
+            
+            # 먼저 끝나는 구간을 넘김
+            if a_high < b_high or (a_high == b_high and not a_high_closed):
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(result)
+    
+    def complement(self):
+        result = []
+        low, low_closed = -np.inf, False
+        for start, end, start_closed, end_closed in self.intervals:
+            result.append((low, start, low_closed, not start_closed))
+            low, low_closed = end, not end_closed
+        result.append((low, np.inf, low_closed, False))
+        return IntervalSet(result)
+    
+    __or__ = union
+    __and__ = intersection
+    __invert__ = complement
+    
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+    
+    def __contains__(self, value):
+        return any(
+            (low < value or (low_closed and value == low)) and (value < high or (high_closed and value == high))
+            for low, high, low_closed, high_closed in self.intervals
+        )
+    
+    def __bool__(self):
+        return bool(self.intervals)
+    
+    def __repr__(self):
+        return f"IntervalSet({self.describe()})"
+    
+    def describe(self):
+        """'x < 1.00 또는 2.00 ≤ x < 3.00' 같은 해집합 설명"""
+        if not self.intervals:
+            return "해 없음"
+        parts = []
+        for low, high, low_closed, high_closed in self.intervals:
+            lower = '≤' if low_closed else '<'
+            upper = '≤' if high_closed else '<'
+            if low == high:
+                parts.append(f"x = {low:.2f}")
+            elif np.isinf(low) and np.isinf(high):
+                parts.append("모든 실수")
+            elif np.isinf(low):
+                parts.append(f"x {upper} {high:.2f}")
+            elif np.isinf(high):
+                parts.append(f"x {'≥' if low_closed else '>'} {low:.2f}")
+            else:
+                parts.append(f"{low:.2f} {lower} x {upper} {high:.2f}")
+        return " 또는 ".join(parts)
+
+def _linear_set(a, b, inequality_type):
+    """ax + b (부등호) 0의 해집합"""
+    if a == 0:
+        holds = {'>': b > 0, '<': b < 0, '>=': b >= 0, '<=': b <= 0}[inequality_type]
+        return IntervalSet.everything() if holds else IntervalSet()
+    boundary = -b / a + 0.0
+    return IntervalSet.ray(boundary, inequality_type if a > 0 else FLIPPED_INEQUALITY[inequality_type])
+
+def _quadratic_set(roots, inequality_type):
+    """위로 볼록한(a > 0) 포물선 (부등호) 0의 해집합"""
+    if not roots:
+        return IntervalSet.everything() if inequality_type in ('>', '>=') else IntervalSet()
+    
+    # 두 근 사이(근이 하나면 그 점)에서 음수, 바깥에서 양수
+    closed = BOUNDARY_TYPES[inequality_type] == 'closed'
+    between = IntervalSet([(roots[0], roots[-1], closed, closed)])
+    if inequality_type in ('<', '<='):
+        return between
+    return ~IntervalSet([(roots[0], roots[-1], not closed, not closed)])
+
+def linear_curve(a, b, x_vals):
+    """경계 함수 ax + b를 x 배열 전체에서 한 번에 평가합니다."""
+    return a * np.asarray(x_vals, dtype=float) + b
+
+def quadratic_curve(a, b, c, x_vals):
+    """경계 함수 ax² + bx + c를 x 배열 전체에서 한 번에 평가합니다."""
+    x_vals = np.asarray(x_vals, dtype=float)
+    return a * x_vals**2 + b * x_vals + c
+
+# 분석 함수 이름 -> 같은 파라미터로 곡선을 평가하는 벡터화 함수 (서버의 적응형 샘플링에서 사용)
+CURVES = {
+    'solve_linear_inequality': linear_curve,
+    'solve_quadratic_inequality': quadratic_curve
+}
 
 def solve_linear_inequality(a, b, inequality_type, x_range=(-10, 10)):
     """
@@ -17,57 +230,30 @@ def solve_linear_inequality(a, b, inequality_type, x_range=(-10, 10)):
         dict: 해결 결과
     """
     try:
-        x = symbols('x')
-        
-        # 부등식 해결
-        if inequality_type == '>':
-            solution = solve(a*x + b > 0, x)
-            boundary_type = 'open'
-        elif inequality_type == '<':
-            solution = solve(a*x + b < 0, x)
-            boundary_type = 'open'
-        elif inequality_type == '>=':
-            solution = solve(a*x + b >= 0, x)
-            boundary_type = 'closed'
-        elif inequality_type == '<=':
-            solution = solve(a*x + b <= 0, x)
-            boundary_type = 'closed'
-        else:
+        if inequality_type not in BOUNDARY_TYPES:
             raise ValueError("Invalid inequality type")
+        boundary_type = BOUNDARY_TYPES[inequality_type]
         
         # 경계점 계산
-        boundary_point = -b / a if a != 0 else None
+        boundary_point = -b / a + 0.0 if a != 0 else None
         
         # 해집합 설명
-        if a > 0:
-            if inequality_type in ['>', '>=']:
-                solution_desc = f"x > {boundary_point:.2f}" if inequality_type == '>' else f"x ≥ {boundary_point:.2f}"
-            else:
-                solution_desc = f"x < {boundary_point:.2f}" if inequality_type == '<' else f"x ≤ {boundary_point:.2f}"
-        elif a < 0:
-            if inequality_type in ['>', '>=']:
-                solution_desc = f"x < {boundary_point:.2f}" if inequality_type == '>' else f"x ≤ {boundary_point:.2f}"
-            else:
-                solution_desc = f"x > {boundary_point:.2f}" if inequality_type == '<' else f"x ≥ {boundary_point:.2f}"
-        else:  # a == 0
-            if b > 0:
-                solution_desc = "모든 실수" if inequality_type in ['>', '>='] else "해 없음"
-            elif b < 0:
-                solution_desc = "해 없음" if inequality_type in ['>', '>='] else "모든 실수"
-            else:  # b == 0
-                solution_desc = "모든 실수" if inequality_type in ['>=', '<='] else "해 없음"
+        solution_set = _linear_set(a, b, inequality_type)
         
         # 그래프 생성
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
-        y_vals = a * x_vals + b
+        y_vals = linear_curve(a, b, x_vals)
         
         return {
             'inequality': f"{a}x + {b} {inequality_type} 0",
-            'solution': solution_desc,
+            'inequality_type': inequality_type,
+            'coefficients': [a, b],
+            'solution': solution_set.describe(),
+            'intervals': solution_set.to_list(),
             'boundary_point': boundary_point,
             'boundary_type': boundary_type,
-            'x_values': x_vals.tolist(),
-            'y_values': y_vals.tolist(),
+            'x_values': x_vals,
+            'y_values': y_vals,
             'success': True
         }
         
@@ -77,6 +263,48 @@ def solve_linear_inequality(a, b, inequality_type, x_range=(-10, 10)):
             'error': str(e)
         }
 
+def _quadratic_roots(a, b, c):
+    """
+    이차방정식 ax² + bx + c = 0의 실근을 배열 단위로 오름차순 계산합니다.
+    
+    q = -(b + sign(b)·√D) / 2로 한 근을 구하고 다른 근은 c/q로 구해
+    b² ≫ 4ac일 때의 자릿수 상쇄를 피합니다.
+    
+    Returns:
+        tuple: (작은 근, 큰 근, 실근 개수) - 근이 없으면 NaN, 중근이면 두 값이 같음
+    """
+    a, b, c = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (a, b, c)))
+    discriminant = b**2 - 4*a*c
+    with np.errstate(all='ignore'):
+        q = -0.5 * (b + np.copysign(np.sqrt(np.maximum(discriminant, 0)), b))
+        first, second = q / a, np.where(q != 0, c / q, q / a)
+        repeated = -b / (2*a)
+    
+    conditions = [discriminant > 0, discriminant == 0]
+    root_count = np.select(conditions, [2, 1], 0)
+    root1 = np.select(conditions, [np.minimum(first, second), repeated], np.nan) + 0.0  # -0.0 정규화
+    root2 = np.select(conditions, [np.maximum(first, second), repeated], np.nan) + 0.0
+    return root1, root2, root_count
+
+def _quadratic_solution_desc(roots, inequality_type):
+    """위로 볼록한(a > 0) 포물선의 해집합을 닫힌 형태로 설명합니다."""
+    strict = BOUNDARY_TYPES[inequality_type] == 'open'
+    positive = inequality_type in ('>', '>=')
+    
+    if len(roots) == 2:
+        lt, gt = ('<', '>') if strict else ('≤', '≥')
+        if positive:
+            return f"x {lt} {roots[0]:.2f} 또는 x {gt} {roots[1]:.2f}"
+        return f"{roots[0]:.2f} {lt} x {lt} {roots[1]:.2f}"
+    if len(roots) == 1:
+        return {
+            '>': f"x ≠ {roots[0]:.2f}",
+            '>=': "모든 실수",
+            '<': "해 없음",
+            '<=': f"x = {roots[0]:.2f}"
+        }[inequality_type]
+    return "모든 실수" if positive else "해 없음"
+
 def solve_quadratic_inequality(a, b, c, inequality_type, x_range=(-10, 10)):
     """
     이차 부등식을 해결하고 시각화합니다.
@@ -90,77 +318,425 @@ def solve_quadratic_inequality(a, b, c, inequality_type, x_range=(-10, 10)):
         dict: 해결 결과
     """
     try:
-        x = symbols('x')
+        if inequality_type not in BOUNDARY_TYPES:
+            raise ValueError("Invalid inequality type")
         
-        # 판별식 계산
-        discriminant = b**2 - 4*a*c
+        # a = 0이면 일차 부등식 bx + c (부등호) 0
+        if a == 0:
+            result = solve_linear_inequality(b, c, inequality_type, x_range)
+            if result['success']:
+                boundary = result.pop('boundary_point')
+                result.update(
+                    inequality=f"{a}x² + {b}x + {c} {inequality_type} 0",
+                    coefficients=[a, b, c],
+                    roots=[boundary] if boundary is not None else [],
+                    discriminant=b**2,
+                    root_type="linear"
+                )
+            return result
         
-        # 근 계산
-        if discriminant > 0:
-            x1 = (-b + np.sqrt(discriminant)) / (2*a)
-            x2 = (-b - np.sqrt(discriminant)) / (2*a)
-            roots = [min(x1, x2), max(x1, x2)]
-            root_type = "two_distinct"
-        elif discriminant == 0:
-            x1 = -b / (2*a)
-            roots = [x1]
-            root_type = "one_repeated"
-        else:
-            roots = []
-            root_type = "no_real"
-        
-        # 부등식 해결
-        if inequality_type == '>':
-            solution = solve(a*x**2 + b*x + c > 0, x)
-        elif inequality_type == '<':
-            solution = solve(a*x**2 + b*x + c < 0, x)
-        elif inequality_type == '>=':
-            solution = solve(a*x**2 + b*x + c >= 0, x)
-        elif inequality_type == '<=':
-            solution = solve(a*x**2 + b*x + c <= 0, x)
-        else:
-            raise ValueError("Invalid inequality type")
+        # 판별식과 근 (자릿수 상쇄를 피하는 공식)
+        discriminant = b**2 - 4*a*c
+        root1, root2, root_count = _quadratic_roots(a, b, c)
+        roots = [float(root1), float(root2)][:int(root_count)]
+        root_type = ("two_distinct", "one_repeated", "no_real")[2 - len(roots)]
         
-        # 해집합 설명
-        if a > 0:  # 위로 볼록한 포물선
-            if root_type == "two_distinct":
-                if inequality_type in ['>', '>=']:
-                    solution_desc = f"x < {roots[0]:.2f} 또는 x > {roots[1]:.2f}"
-                else:
-                    solution_desc = f"{roots[0]:.2f} ≤ x ≤ {roots[1]:.2f}"
-            elif root_type == "one_repeated":
-                if inequality_type in ['>', '>=']:
-                    solution_desc = f"x ≠ {roots[0]:.2f}"
-                else:
-                    solution_desc = f"x = {roots[0]:.2f}"
-            else:  # no_real
-                solution_desc = "모든 실수" if inequality_type in ['>', '>='] else "해 없음"
-        else:  # a < 0, 아래로 볼록한 포물선
-            if root_type == "two_distinct":
-                if inequality_type in ['>', '>=']:
-                    solution_desc = f"{roots[0]:.2f} ≤ x ≤ {roots[1]:.2f}"
-                else:
-                    solution_desc = f"x < {roots[0]:.2f} 또는 x > {roots[1]:.2f}"
-            elif root_type == "one_repeated":
-                if inequality_type in ['>', '>=']:
-                    solution_desc = f"x = {roots[0]:.2f}"
-                else:
-                    solution_desc = f"x ≠ {roots[0]:.2f}"
-            else:  # no_real
-                solution_desc = "해 없음" if inequality_type in ['>', '>='] else "모든 실수"
+        # a < 0이면 양변에 -1을 곱해 위로 볼록한 경우로 바꿔 설명
+        upward_type = inequality_type if a > 0 else FLIPPED_INEQUALITY[inequality_type]
+        solution_desc = _quadratic_solution_desc(roots, upward_type)
         
         # 그래프 생성
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
-        y_vals = a * x_vals**2 + b * x_vals + c
+        y_vals = quadratic_curve(a, b, c, x_vals)
         
         return {
             'inequality': f"{a}x² + {b}x + {c} {inequality_type} 0",
+            'inequality_type': inequality_type,
+            'coefficients': [a, b, c],
             'solution': solution_desc,
+            'intervals': _quadratic_set(roots, upward_type).to_list(),
             'roots': roots,
             'discriminant': discriminant,
             'root_type': root_type,
-            'x_values': x_vals.tolist(),
-            'y_values': y_vals.tolist(),
+            'x_values': x_vals,
+            'y_values': y_vals,
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def solve_quadratic_inequality_batch(a, b, c, inequality_type):
+    """
+    이차 부등식 ax² + bx + c (부등호) 0 여러 개를 한 번에 풉니다.
+    
+    계수와 부등호는 스칼라 또는 같은 길이의 리스트입니다. 근은 안정적인
+    공식으로 한 번에 계산하고(a = 0인 행은 일차 부등식의 경계점), 해 설명은
+    solve_quadratic_inequality와 같은 형식입니다.
+    
+    Returns:
+        dict: 열 단위 결과 (없는 근은 NaN, root1 <= root2)
+    """
+    try:
+        a, b, c = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in (a, b, c)))
+        types = np.broadcast_to(np.atleast_1d(np.asarray(inequality_type, dtype=object)), a.shape)
+        if not set(types.tolist()) <= set(BOUNDARY_TYPES):
+            raise ValueError("Invalid inequality type")
+        
+        discriminant = b**2 - 4*a*c
+        root1, root2, root_count = _quadratic_roots(a, b, c)
+        
+        # a = 0인 행은 일차 부등식 bx + c의 경계점
+        quadratic = a != 0
+        with np.errstate(all='ignore'):
+            linear = np.where(b != 0, -c / b, np.nan) + 0.0
+        root_count = np.where(quadratic, root_count, (b != 0).astype(int))
+        root1 = np.where(quadratic, root1, linear)
+        root2 = np.where(quadratic, root2, linear)
+        
+        solutions = []
+        for index in range(len(a)):
+            roots = [float(root1[index]), float(root2[index])][:root_count[index]]
+            if quadratic[index]:
+                upward_type = types[index] if a[index] > 0 else FLIPPED_INEQUALITY[types[index]]
+                solutions.append(_quadratic_solution_desc(roots, upward_type))
+            else:
+                solutions.append(_linear_set(b[index], c[index], types[index]).describe())
+        
+        return {
+            'count': len(a),
+            'discriminant': discriminant,
+            'root1': root1,
+            'root2': root2,
+            'root_count': root_count,
+            'solution': solutions,
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def _polynomial_set(a, b, c, inequality_type):
+    """ax² + bx + c (부등호) 0의 해집합 (a = 0이면 일차)"""
+    if a == 0:
+        return _linear_set(b, c, inequality_type)
+    root1, root2, root_count = _quadratic_roots(a, b, c)
+    roots = [float(root1), float(root2)][:int(root_count)]
+    return _quadratic_set(roots, inequality_type if a > 0 else FLIPPED_INEQUALITY[inequality_type])
+
+def solve_compound_inequality(inequalities, combine='and'):
+    """
+    여러 부등식을 '그리고'(교집합) 또는 '또는'(합집합)으로 묶은 복합 부등식을 풉니다.
+    
+    각 부등식의 해집합을 구간 집합으로 구한 뒤 구간 연산으로 합치므로
+    기호 풀이가 필요 없습니다.
+    
+    Args:
+        inequalities (list): {'a', 'b', 'c'(선택), 'type'} 목록.
+            c가 없으면 ax + b (부등호) 0, 있으면 ax² + bx + c (부등호) 0
+        combine (str): 'and'(교집합) 또는 'or'(합집합)
+    
+    Returns:
+        dict: 해결 결과
+    """
+    try:
+        if combine not in ('and', 'or'):
+            raise ValueError(f"Invalid combine: {combine}")
+        if not inequalities:
+            raise ValueError("No inequalities")
+        
+        parts = []
+        descriptions = []
+        for item in inequalities:
+            if item['type'] not in BOUNDARY_TYPES:
+                raise ValueError("Invalid inequality type")
+            if 'c' in item:
+                a, b, c = item['a'], item['b'], item['c']
+                descriptions.append(f"{a}x² + {b}x + {c} {item['type']} 0")
+            else:
+                a, b, c = 0, item['a'], item['b']
+                descriptions.append(f"{b}x + {c} {item['type']} 0")
+            parts.append(_polynomial_set(a, b, c, item['type']))
+        
+        solution = parts[0]
+        for part in parts[1:]:
+            solution = solution & part if combine == 'and' else solution | part
+        
+        return {
+            'inequality': (" 그리고 " if combine == 'and' else " 또는 ").join(descriptions),
+            'solution': solution.describe(),
+            'intervals': solution.to_list(),
+            'parts': [part.to_list() for part in parts],
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def solve_absolute_inequality(a, b, c, inequality_type):
+    """
+    절댓값 부등식 |ax + b| (부등호) c를 풉니다.
+    
+    |u| < c는 -c < u < c (교집합), |u| > c는 u < -c 또는 u > c (합집합)로
+    바꿔 구간 연산으로 풉니다. c가 음수인 경우도 같은 연산으로 처리됩니다.
+    
+    Args:
+        a, b (float): 절댓값 안의 일차식 계수
+        c (float): 우변
+        inequality_type (str): 부등식 유형 ('>', '<', '>=', '<=')
+    
+    Returns:
+        dict: 해결 결과
+    """
+    try:
+        if inequality_type not in BOUNDARY_TYPES:
+            raise ValueError("Invalid inequality type")
+        
+        # u - c (부등호) 0 과 u + c (반대 부등호) 0
+        above = _linear_set(a, b - c, inequality_type)
+        below = _linear_set(a, b + c, FLIPPED_INEQUALITY[inequality_type])
+        solution = above & below if inequality_type in ('<', '<=') else above | below
+        
+        return {
+            'inequality': f"|{a}x + {b}| {inequality_type} {c}",
+            'solution': solution.describe(),
+            'intervals': solution.to_list(),
+            'method': 'interval_algebra',
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def _half_planes(constraints):
+    """
+    제약 {'a', 'b', 'c', 'type'} (ax + by (부등호) c) 목록을 a·x + b·y ≤ c 형태의
+    (n, 3) 배열로 바꿉니다. a = b = 0인 제약은 항상 참이면 버리고 거짓이면 None을 반환합니다.
+    """
+    rows = []
+    for item in constraints:
+        inequality_type = item['type']
+        if inequality_type not in BOUNDARY_TYPES:
+            raise ValueError("Invalid inequality type")
+        sign = 1.0 if inequality_type in ('<', '<=') else -1.0
+        a, b, c = sign * float(item['a']), sign * float(item['b']), sign * float(item['c'])
+        if a == 0 and b == 0:
+            if 0 > c or (0 == c and BOUNDARY_TYPES[inequality_type] == 'open'):
+                return None
+            continue
+        rows.append((a, b, c))
+    return np.array(rows, dtype=float).reshape(-1, 3)
+
+def _box_planes(x_range, y_range):
+    """x_range × y_range 상자를 이루는 네 반평면"""
+    (x_min, x_max), (y_min, y_max) = x_range, y_range
+    return np.array([(-1, 0, -x_min), (1, 0, x_max), (0, -1, -y_min), (0, 1, y_max)], dtype=float)
+
+def _line_intersection(p, q):
+    det = p[0] * q[1] - q[0] * p[1]
+    return ((p[2] * q[1] - q[2] * p[1]) / det, (p[0] * q[2] - q[0] * p[2]) / det)
+
+def _outside(plane, point):
+    return plane[0] * point[0] + plane[1] * point[1] > plane[2] + HALF_PLANE_EPS
+
+def half_plane_intersection(planes):
+    """
+    반평면 a·x + b·y ≤ c들의 교집합을 O(n log n)으로 구합니다.
+    
+    경계선 방향(법선을 오른쪽에 두는 방향)의 각도로 정렬하고, 평행한 반평면은
+    가장 좁은 것만 남긴 뒤 덱으로 한 번 훑습니다. 교집합이 유계라는 가정이
+    필요하므로 호출자는 상자(_box_planes)를 함께 넘겨야 합니다.
+    
+    Args:
+        planes (np.ndarray): (n, 3) 배열 [a, b, c]
+    
+    Returns:
+        list: 반시계 방향 꼭짓점 [(x, y), ...] (비어 있으면 [])
+    """
+    norms = np.hypot(planes[:, 0], planes[:, 1])
+    planes = planes / norms[:, None]
+    angles = np.round(np.arctan2(planes[:, 0], -planes[:, 1]), 12)
+    
+    # 각도 순, 같은 각도에서는 c가 작은(더 좁은) 반평면이 먼저
+    order = np.lexsort((planes[:, 2], angles))
+    first = np.r_[True, angles[order][1:] != angles[order][:-1]]
+    planes = [tuple(row) for row in planes[order[first]].tolist()]
+    
+    deque = []
+    head = 0
+    for plane in planes:
+        while len(deque) - head >= 2 and _outside(plane, _line_intersection(deque[-1], deque[-2])):
+            deque.pop()
+        while len(deque) - head >= 2 and _outside(plane, _line_intersection(deque[head], deque[head + 1])):
+            head += 1
+        if len(deque) - head >= 1:
+            last = deque[-1]
+            if abs(plane[0] * last[1] - last[0] * plane[1]) < HALF_PLANE_EPS:
+                # 반대 방향 평행선이 이웃하면 그 사이가 모두 제거된 것이므로 교집합이 비어 있음
+                return []
+        deque.append(plane)
+    
+    while len(deque) - head >= 3 and _outside(deque[head], _line_intersection(deque[-1], deque[-2])):
+        deque.pop()
+    while len(deque) - head >= 3 and _outside(deque[-1], _line_intersection(deque[head], deque[head + 1])):
+        head += 1
+    deque = deque[head:]
+    if len(deque) < 3:
+        return []
+    
+    vertices = []
+    for index, plane in enumerate(deque):
+        point = _line_intersection(plane, deque[(index + 1) % len(deque)])
+        if not vertices or abs(point[0] - vertices[-1][0]) + abs(point[1] - vertices[-1][1]) > HALF_PLANE_EPS:
+            vertices.append(point)
+    if len(vertices) > 1 and abs(vertices[0][0] - vertices[-1][0]) + abs(vertices[0][1] - vertices[-1][1]) <= HALF_PLANE_EPS:
+        vertices.pop()
+    return vertices
+
+def _polygon_area(vertices):
+    if len(vertices) < 3:
+        return 0.0
+    x, y = np.array(vertices).T
+    return float(abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / 2)
+
+def _improves_along_recession(planes, direction):
+    """
+    영역의 후퇴 방향(recession direction) r (모든 제약에서 a·r ≤ 0) 중
+    direction·r > 0인 방향이 있는지, 즉 목적함수가 끝없이 커질 수 있는지 확인합니다.
+    
+    후퇴 방향들의 원뿔을 [-1, 1]² 상자로 잘라 반평면 교집합으로 구하고
+    그 꼭짓점에서 direction·r의 최댓값을 봅니다.
+    """
+    cone = np.column_stack([planes[:, :2], np.zeros(len(planes))])
+    vertices = half_plane_intersection(np.vstack([cone, _box_planes((-1, 1), (-1, 1))]))
+    scale = np.hypot(*direction)
+    return any(direction[0] * x + direction[1] * y > HALF_PLANE_EPS * scale for x, y in vertices)
+
+def solve_linear_system(constraints, objective=None, maximize=True, x_range=(-10, 10), y_range=(-10, 10)):
+    """
+    연립 일차부등식 ax + by (부등호) c의 해 영역(실행 가능 영역)을 구합니다.
+    
+    반평면 교집합으로 영역의 꼭짓점을 구하고, 목적함수가 주어지면 꼭짓점에서
+    최적값을 찾습니다(선형계획법). 무한 영역은 SYSTEM_BOUND 상자로 닫아
+    계산하며, 상자에 닿은 꼭짓점이 있으면 영역이 유계가 아닌 것으로 판정합니다.
+    목적함수가 유계가 아닌지는 영역이 아니라 후퇴 방향으로 판정하므로, 무한 영역에서도
+    최적값이 유한하면(예: x ≥ 0에서 -x 최대화 -> 0) 'optimal'입니다.
+    최적점이 한 변 전체일 때는 상자에 닿지 않은 꼭짓점을 우선합니다.
+    경계가 포함되지 않는 제약(<, >)도 영역은 닫힌 영역으로 계산됩니다.
+    
+    Args:
+        constraints (list): {'a', 'b', 'c', 'type'} 목록
+        objective (list): 목적함수 px + qy의 [p, q] (선택)
+        maximize (bool): 최대화 여부 (False면 최소화)
+        x_range, y_range (tuple): 그리기용 다각형(polygon)을 자를 범위
+    
+    Returns:
+        dict: 해결 결과
+    """
+    try:
+        planes = _half_planes(constraints)
+        descriptions = [f"{item['a']}x + {item['b']}y {item['type']} {item['c']}" for item in constraints]
+        
+        region = []
+        if planes is not None:
+            box = _box_planes((-SYSTEM_BOUND, SYSTEM_BOUND), (-SYSTEM_BOUND, SYSTEM_BOUND))
+            region = half_plane_intersection(np.vstack([planes, box]))
+        on_box = [max(abs(x), abs(y)) >= SYSTEM_BOUND * (1 - 1e-9) for x, y in region]
+        bounded = bool(region) and not any(on_box)
+        
+        polygon = []
+        if region:
+            polygon = half_plane_intersection(np.vstack([planes, _box_planes(x_range, y_range)]))
+        
+        result = {
+            'constraints': descriptions,
+            'feasible': bool(region),
+            'bounded': bounded,
+            'vertices': [[x, y] for (x, y), edge in zip(region, on_box) if not edge],
+            'area': _polygon_area(region) if bounded else None,
+            'polygon': [[x, y] for x, y in polygon],
+            'boundaries': ['solid' if BOUNDARY_TYPES[item['type']] == 'closed' else 'dashed'
+                           for item in constraints],
+            'success': True
+        }
+        
+        if objective is not None:
+            p, q = objective
+            if not region:
+                result['optimum'] = {'status': 'infeasible', 'value': None, 'point': None}
+            elif _improves_along_recession(planes, (p, q) if maximize else (-p, -q)):
+                result['optimum'] = {'status': 'unbounded', 'value': None, 'point': None}
+            else:
+                values = np.array([p * x + q * y for x, y in region])
+                target = values.max() if maximize else values.min()
+                # 같은 최적값이면 상자에 닿지 않은 꼭짓점을 우선
+                tolerance = HALF_PLANE_EPS * max(1.0, abs(target))
+                best = min(np.flatnonzero(np.abs(values - target) <= tolerance), key=lambda index: on_box[index])
+                result['optimum'] = {'status': 'optimal', 'value': float(values[best]) + 0.0,
+                                     'point': list(region[best])}
+        return result
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def solve_linear_system_batch(systems, objective=None, maximize=True):
+    """
+    연립 일차부등식 여러 개를 한 번에 풉니다 (같은 목적함수).
+    
+    Args:
+        systems (list): 제약 목록의 목록
+        objective (list): 목적함수 [p, q] (선택)
+        maximize (bool): 최대화 여부
+    
+    Returns:
+        dict: 열 단위 결과 (영역이 없거나 유계가 아니면 area, 최적값은 NaN)
+    """
+    try:
+        count = len(systems)
+        feasible = np.zeros(count, dtype=bool)
+        bounded = np.zeros(count, dtype=bool)
+        vertex_count = np.zeros(count, dtype=np.int32)
+        area = np.full(count, np.nan)
+        optimum_value = np.full(count, np.nan)
+        optimum_point = np.full((count, 2), np.nan)
+        
+        for index, constraints in enumerate(systems):
+            result = solve_linear_system(constraints, objective, maximize)
+            if not result['success']:
+                raise ValueError(f"system {index}: {result['error']}")
+            feasible[index] = result['feasible']
+            bounded[index] = result['bounded']
+            vertex_count[index] = len(result['vertices'])
+            if result['area'] is not None:
+                area[index] = result['area']
+            if objective is not None and result['optimum']['status'] == 'optimal':
+                optimum_value[index] = result['optimum']['value']
+                optimum_point[index] = result['optimum']['point']
+        
+        return {
+            'count': count,
+            'feasible': feasible,
+            'bounded': bounded,
+            'vertex_count': vertex_count,
+            'area': area,
+            'optimum_value': optimum_value,
+            'optimum_x': optimum_point[:, 0],
+            'optimum_y': optimum_point[:, 1],
             'success': True
         }
         
@@ -170,11 +746,322 @@ def solve_quadratic_inequality(a, b, c, inequality_type, x_range=(-10, 10)):
             'error': str(e)
         }
 
-def visualize_number_line(inequality_result, x_range=(-10, 10)):
+def _power_digits(base, exponent):
+    """숫자 base**exponent 결과의 대략적인 자릿수 |exponent · log10|base||"""
+    base = abs(base)
+    if base.is_Rational:
+        if base.p == 0:
+            return 0.0
+        digits = math.log10(base.p) - math.log10(base.q)
+    else:
+        try:
+            digits = math.log10(float(base))
+        except (OverflowError, ValueError, TypeError):
+            return math.inf
+    return abs(float(exponent) * digits)
+
+def _to_symbolic(node, sympy, x):
+    """허용된 AST 노드만 sympy 식으로 변환합니다."""
+    operators = {ast.Add: '__add__', ast.Sub: '__sub__', ast.Mult: '__mul__',
+                 ast.Div: '__truediv__', ast.Pow: '__pow__'}
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return sympy.nsimplify(node.value)
+    if isinstance(node, ast.Name) and node.id in ('x', 'pi', 'e'):
+        return {'x': x, 'pi': sympy.pi, 'e': sympy.E}[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in operators:
+        left = _to_symbolic(node.left, sympy, x)
+        right = _to_symbolic(node.right, sympy, x)
+        # 정의역·치역 카드의 수식 파서와 같은 거듭제곱 크기 제한
+        if isinstance(node.op, ast.Pow) and right.is_number and (
+                abs(right) > MAX_EXPONENT
+                or left.is_number and _power_digits(left, right) > MAX_POWER_DIGITS):
+            raise ValueError(f"지수가 너무 큽니다: {ast.unparse(node)}")
+        return getattr(left, operators[type(node.op)])(right)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _to_symbolic(node.operand, sympy, x)
+        return -operand if isinstance(node.op, ast.USub) else operand
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+            and node.func.id in SYMBOLIC_FUNCTIONS and len(node.args) == 1 and not node.keywords:
+        function = getattr(sympy, SYMBOLIC_FUNCTIONS[node.func.id])
+        return function(_to_symbolic(node.args[0], sympy, x))
+    raise ValueError(f"허용되지 않는 수식 요소: {ast.unparse(node)}")
+
+def _power_digits_float(base, exponent):
+    """실수 base**exponent 결과의 대략적인 자릿수"""
+    return 0.0 if base == 0 else abs(exponent * math.log10(abs(base)))
+
+def _polynomial_coefficients(node):
+    """
+    x의 다항식인 AST를 NumPy 계수 배열(낮은 차수부터)로 바꿉니다.
+    
+    함수 호출, x로 나누기, 정수가 아닌 지수처럼 다항식이 아닌 식이거나
+    차수가 MAX_EXPONENT를 넘으면 None을 반환합니다.
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return np.array([float(node.value)])
+    if isinstance(node, ast.Name) and node.id in ('x', 'pi', 'e'):
+        return np.array({'x': [0.0, 1.0], 'pi': [np.pi], 'e': [np.e]}[node.id])
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _polynomial_coefficients(node.operand)
+        if operand is None or isinstance(node.op, ast.UAdd):
+            return operand
+        return -operand
+    if not isinstance(node, ast.BinOp):
+        return None
+    
+    left = _polynomial_coefficients(node.left)
+    right = _polynomial_coefficients(node.right)
+    if left is None or right is None:
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        return np.polynomial.polynomial.polyadd(left, right if isinstance(node.op, ast.Add) else -right)
+    if isinstance(node.op, ast.Mult):
+        if len(left) + len(right) - 2 > MAX_EXPONENT:
+            return None
+        return np.polynomial.polynomial.polymul(left, right)
+    if isinstance(node.op, ast.Div) and len(right) == 1 and right[0] != 0:
+        return left / right[0]
+    if isinstance(node.op, ast.Pow) and len(right) == 1 and float(right[0]).is_integer() \
+            and 0 <= right[0] and (len(left) - 1) * right[0] <= MAX_EXPONENT:
+        if len(left) == 1 and _power_digits_float(left[0], right[0]) > MAX_POWER_DIGITS:
+            return None
+        return np.polynomial.polynomial.polypow(left, int(right[0]))
+    return None
+
+def _parse_inequality_expression(expression):
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"수식이 너무 깁니다 (최대 {MAX_EXPRESSION_LENGTH}자)")
+    try:
+        return ast.parse(expression, mode='eval').body
+    except SyntaxError:
+        raise ValueError(f"수식을 해석할 수 없습니다: {expression}")
+
+@lru_cache(maxsize=128)
+def _symbolic_solution(expression, inequality_type):
+    """
+    sympy로 expression (부등호) 0을 풉니다. 같은 (식, 부등호)는 한 번만 풉니다.
+    
+    sympy는 여기서 처음 필요할 때만 가져옵니다.
+    """
+    import sympy
+    
+    x = sympy.Symbol('x', real=True)
+    expr = _to_symbolic(_parse_inequality_expression(expression), sympy, x)
+    relation = {'>': sympy.Gt, '<': sympy.Lt, '>=': sympy.Ge, '<=': sympy.Le}[inequality_type]
+    solution_set = sympy.solve_univariate_inequality(relation(expr, 0), x, relational=False)
+    return str(solution_set)
+
+class _SymbolicTimeout(BaseException):
+    """기호 풀이가 제한 시간을 넘으면 sympy 안에서 발생 (except Exception에 잡히지 않도록 BaseException)"""
+
+def _solve_with_budget(expression, inequality_type, time_budget):
+    """
+    현재 스레드에서 기호 풀이를 하고, 제한 시간 안에 끝나지 않으면 None을 반환합니다.
+    
+    sympy는 순수 Python이므로 함수 호출마다 마감 시각을 확인하는 추적 함수(sys.settrace)로
+    협조적으로 중단합니다. 프로세스를 만들지 않으므로 멀티스레드 서버에서도 안전하고,
+    sympy 가져오기는 제한 시간 밖에서 한 번만 합니다. 성공한 풀이만 _symbolic_solution에
+    캐시되고 시간 초과는 캐시되지 않습니다.
+    """
+    import sympy  # noqa: F401 (가져오는 시간은 제한 시간에 넣지 않음)
+    
+    deadline = time.monotonic() + time_budget
+    
+    def tracer(frame, event, arg):
+        if time.monotonic() > deadline:
+            raise _SymbolicTimeout()
+        return None
+    
+    previous = sys.gettrace()
+    sys.settrace(tracer)
+    try:
+        return _symbolic_solution(expression, inequality_type)
+    except _SymbolicTimeout:
+        return None
+    finally:
+        sys.settrace(previous)
+
+def solve_inequality(expression, inequality_type, x_range=(-10, 10), time_budget=SYMBOLIC_TIME_BUDGET):
+    """
+    x에 대한 일반 부등식 expression (부등호) 0을 풉니다.
+    
+    이차 이하 다항식은 solve_quadratic_inequality의 닫힌 형태로 풀고,
+    그 외의 식만 sympy 기호 풀이(메모이즈, 제한 시간 time_budget초)로 풉니다.
+    
+    Args:
+        expression (str): x에 대한 식 (예: "x**3 - x", "sin(x)")
+        inequality_type (str): 부등식 유형 ('>', '<', '>=', '<=')
+        x_range (tuple): x축 범위
+        time_budget (float): 기호 풀이 제한 시간 (초, 0~SYMBOLIC_TIME_BUDGET으로 제한)
+    
+    Returns:
+        dict: 해결 결과
+    """
+    try:
+        if inequality_type not in BOUNDARY_TYPES:
+            raise ValueError("Invalid inequality type")
+        time_budget = min(max(float(time_budget), 0.0), SYMBOLIC_TIME_BUDGET)
+        
+        # 이차 이하 다항식은 sympy 없이 NumPy 계수로 바로 닫힌 형태로 풂
+        coefficients = _polynomial_coefficients(_parse_inequality_expression(expression.strip()))
+        if coefficients is not None:
+            coefficients = np.trim_zeros(coefficients, 'b')
+        if coefficients is not None and len(coefficients) <= 3:
+            a, b, c = (float(value) for value in np.pad(coefficients, (0, 3 - len(coefficients)))[::-1])
+            result = solve_quadratic_inequality(a, b, c, inequality_type, x_range)
+            if result['success']:
+                result.update(inequality=f"{expression} {inequality_type} 0", method='closed_form')
+            return result
+        
+        value = _solve_with_budget(expression.strip(), inequality_type, time_budget)
+        if value is None:
+            return {
+                'inequality': f"{expression} {inequality_type} 0",
+                'success': False,
+                'error': f"기호 풀이가 제한 시간({time_budget}초)을 넘었습니다"
+            }
+        
+        return {
+            'inequality': f"{expression} {inequality_type} 0",
+            'solution': value,
+            'method': 'symbolic',
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def _boundary_polygon(coefficients, x_range, y_range, upper):
+    """
+    y = 다항식 경계와 축 범위 상자로 둘러싸인 영역의 다각형 꼭짓점을 반환합니다.
+    
+    직선은 두 점, 포물선은 현(chord) 오차가 y 범위의 REGION_TOLERANCE 이하가
+    되도록 점 수를 정하고, 상자 밖으로 나간 곡선은 상자 경계로 자릅니다.
+    """
+    (x_min, x_max), (y_min, y_max) = x_range, y_range
+    curvature = abs(coefficients[0]) if len(coefficients) == 3 else 0.0
+    if curvature == 0:
+        num_points = 2
+    else:
+        # 2차 다항식의 현 오차는 |a|·h²/4
+        step = np.sqrt(4 * REGION_TOLERANCE * (y_max - y_min) / curvature)
+        num_points = int(min(REGION_MAX_POINTS, np.ceil((x_max - x_min) / step) + 1))
+    
+    # 곡선이 상자 위아래 경계와 만나는 점을 더해 자른 모양이 정확하도록 함
+    crossings = np.concatenate([np.roots(np.polysub(coefficients, [bound])) for bound in (y_min, y_max)])
+    crossings = crossings[np.isreal(crossings)].real
+    crossings = crossings[(crossings > x_min) & (crossings < x_max)]
+    x = np.union1d(np.linspace(x_min, x_max, num_points), crossings)
+    y = np.clip(np.polyval(coefficients, x), y_min, y_max)
+    num_points = x.size
+    
+    # 상자 경계에 붙은 연속 점은 양 끝만 남김
+    edge = (y == y_min) | (y == y_max)
+    redundant = np.zeros(num_points, dtype=bool)
+    redundant[1:-1] = edge[1:-1] & (y[:-2] == y[1:-1]) & (y[2:] == y[1:-1])
+    x, y = x[~redundant], y[~redundant]
+    
+    corner_y = y_max if upper else y_min
+    points = np.column_stack([np.r_[x, x_max, x_min], np.r_[y, corner_y, corner_y]])
+    return np.round(points, 6).tolist()
+
+def _region_mask(coefficients, inequality_type, x_range, y_range, resolution):
+    """
+    칸 중심에서 부등식을 평가한 격자를 행 우선 RLE로 인코딩합니다.
+    0행이 y 범위의 아래쪽이며, runs는 first 값부터 번갈아 나오는 길이입니다.
+    """
+    (x_min, x_max), (y_min, y_max) = x_range, y_range
+    x_step = (x_max - x_min) / resolution
+    y_step = (y_max - y_min) / resolution
+    x = x_min + x_step * (np.arange(resolution) + 0.5)
+    y = y_min + y_step * (np.arange(resolution) + 0.5)
+    
+    boundary = np.polyval(coefficients, x)
+    compare = {'>': np.greater, '<': np.less, '>=': np.greater_equal, '<=': np.less_equal}
+    inside = compare[inequality_type](y[:, None], boundary[None, :]).ravel()
+    
+    changes = np.flatnonzero(np.diff(inside)) + 1
+    runs = np.diff(np.r_[0, changes, inside.size])
+    return {
+        'shape': [resolution, resolution],
+        'origin': 'lower',
+        'first': bool(inside[0]),
+        'runs': runs.tolist()
+    }
+
+def solve_inequality_region(a, b, c, inequality_type, x_range=(-10, 10), y_range=(-10, 10),
+                            representation='polygon', resolution=DEFAULT_MASK_RESOLUTION):
+    """
+    좌표평면의 부등식 y (부등호) ax² + bx + c의 영역을 벡터 형태로 반환합니다.
+    
+    서버에서 래스터화하지 않고 다각형 또는 RLE 마스크 몇백 바이트만 보내므로
+    클라이언트가 어느 배율에서든 영역을 그릴 수 있습니다.
+    
+    Args:
+        a, b, c (float): 경계 곡선 계수 (a = 0이면 직선)
+        inequality_type (str): 부등식 유형 ('>', '<', '>=', '<=')
+        x_range, y_range (tuple): 축 범위
+        representation (str): 'polygon'(경계 다각형) 또는 'mask'(RLE 마스크)
+        resolution (int): 마스크 한 변의 칸 수
+    
+    Returns:
+        dict: 영역 결과
+    """
+    try:
+        if inequality_type not in BOUNDARY_TYPES:
+            raise ValueError("Invalid inequality type")
+        if representation not in ('polygon', 'mask'):
+            raise ValueError(f"Invalid representation: {representation}")
+        
+        coefficients = [a, b, c]
+        result = {
+            'inequality': f"y {inequality_type} {a}x² + {b}x + {c}",
+            'representation': representation,
+            'x_range': list(x_range),
+            'y_range': list(y_range),
+            # 경계를 포함하지 않으면 점선으로 그림
+            'boundary': 'solid' if BOUNDARY_TYPES[inequality_type] == 'closed' else 'dashed',
+            'success': True
+        }
+        if representation == 'polygon':
+            result['polygon'] = _boundary_polygon(
+                coefficients, x_range, y_range, upper=inequality_type in ('>', '>=')
+            )
+        else:
+            result['mask'] = _region_mask(coefficients, inequality_type, x_range, y_range, int(resolution))
+        return result
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def _figure_axes(ax, figsize):
+    """
+    그릴 축을 반환합니다. ax가 없으면 pyplot 전역 상태와 무관한 새 Figure를
+    만들므로 여러 스레드에서 동시에 호출해도 안전합니다.
+    """
+    if ax is None:
+        ax = Figure(figsize=figsize).subplots()
+    return ax.figure, ax
+
+def visualize_number_line(inequality_result, x_range=(-10, 10), ax=None):
     """
     수직선상에서 부등식의 해를 시각화합니다.
+    
+    Args:
+        inequality_result (dict): 부등식 풀이 결과
+        x_range (tuple): x축 범위
+        ax (Axes): 그릴 축 (없으면 새 Figure를 만듭니다)
+    
+    Returns:
+        Figure: 그림
     """
-    fig, ax = plt.subplots(figsize=(12, 3))
+    fig, ax = _figure_axes(ax, (12, 3))
     
     # 수직선 그리기
     ax.axhline(y=0, color='black', linewidth=2)
@@ -186,46 +1073,34 @@ def visualize_number_line(inequality_result, x_range=(-10, 10)):
     ax.set_yticks([])
     ax.grid(True, alpha=0.3)
     
-    # 부등식 해 표시
-    if 'boundary_point' in inequality_result:  # 일차 부등식
-        boundary = inequality_result['boundary_point']
-        if boundary is not None:
-            # 경계점 표시
-            if inequality_result['boundary_type'] == 'closed':
-                ax.plot(boundary, 0, 'ko', markersize=10)
+    # 해집합 구간 표시 (무한 구간은 축 끝의 화살표 표시)
+    for interval in inequality_result['intervals']:
+        low = x_range[0] if interval['low'] is None else interval['low']
+        high = x_range[1] if interval['high'] is None else interval['high']
+        ax.plot([low, high], [0, 0], color='red', linewidth=6, alpha=0.6, solid_capstyle='butt')
+        for end, closed, arrow in ((interval['low'], interval['low_closed'], '<'),
+                                   (interval['high'], interval['high_closed'], '>')):
+            if end is None:
+                ax.plot(low if arrow == '<' else high, 0, marker=arrow, color='red', markersize=12)
             else:
-                ax.plot(boundary, 0, 'ko', markersize=10, markerfacecolor='white')
-            
-            # 해집합 표시
-            if '>' in inequality_result['inequality'] or '>=' in inequality_result['inequality']:
-                if 'x >' in inequality_result['solution']:
-                    ax.arrow(boundary + 0.5, 0, 5, 0, head_width=0.1, head_length=0.2, fc='red', ec='red')
-                else:
-                    ax.arrow(boundary - 5, 0, -5, 0, head_width=0.1, head_length=0.2, fc='red', ec='red')
-            else:
-                if 'x <' in inequality_result['solution']:
-                    ax.arrow(boundary - 5, 0, -5, 0, head_width=0.1, head_length=0.2, fc='red', ec='red')
-                else:
-                    ax.arrow(boundary + 0.5, 0, 5, 0, head_width=0.1, head_length=0.2, fc='red', ec='red')
-    
-    elif 'roots' in inequality_result:  # 이차 부등식
-        roots = inequality_result['roots']
-        for root in roots:
-            ax.plot(root, 0, 'ko', markersize=8)
-        
-        # 해집합 표시 (간단한 버전)
-        if '≤' in inequality_result['solution']:
-            if len(roots) == 2:
-                ax.axvspan(roots[0], roots[1], alpha=0.3, color='red')
+                ax.plot(end, 0, 'ko', markersize=10, markerfacecolor='black' if closed else 'white')
     
     ax.set_title(f"수직선상 해집합: {inequality_result['solution']}", fontsize=14, fontweight='bold')
     return fig
 
-def visualize_quadrant_region(inequality_result, x_range=(-10, 10), y_range=(-10, 10)):
+def visualize_quadrant_region(inequality_result, x_range=(-10, 10), y_range=(-10, 10), ax=None):
     """
     사분면에서 부등식의 영역을 시각화합니다.
+    
+    Args:
+        inequality_result (dict): 부등식 풀이 결과
+        x_range, y_range (tuple): 축 범위
+        ax (Axes): 그릴 축 (없으면 새 Figure를 만듭니다)
+    
+    Returns:
+        Figure: 그림
     """
-    fig, ax = plt.subplots(figsize=(10, 10))
+    fig, ax = _figure_axes(ax, (10, 10))
     
     # 좌표축 그리기
     ax.axhline(y=0, color='black', linewidth=1, alpha=0.5)
@@ -234,26 +1109,19 @@ def visualize_quadrant_region(inequality_result, x_range=(-10, 10), y_range=(-10
     ax.set_ylim(y_range[0], y_range[1])
     ax.grid(True, alpha=0.3)
     
-    # 부등식 그래프 그리기
+    # 경계 곡선과 축 범위로 둘러싸인 해 영역 (y (부등호) f(x))
+    coefficients = inequality_result['coefficients']
+    inequality_type = inequality_result['inequality_type']
+    polygon = np.array(_boundary_polygon(
+        coefficients, x_range, y_range, upper=inequality_type in ('>', '>=')
+    ))
+    ax.fill(polygon[:, 0], polygon[:, 1], alpha=0.3, color='red', label='해집합')
+    
+    # 함수 그래프 그리기 (경계를 포함하지 않으면 점선)
     x_vals = np.array(inequality_result['x_values'])
     y_vals = np.array(inequality_result['y_values'])
-    
-    # 부등식 유형에 따른 영역 표시
-    inequality_type = None
-    for op in ['>', '<', '>=', '<=']:
-        if op in inequality_result['inequality']:
-            inequality_type = op
-            break
-    
-    if inequality_type in ['>', '>=']:
-        # 부등식 위쪽 영역 표시
-        ax.fill_between(x_vals, y_vals, y_range[1], alpha=0.3, color='red', label='해집합')
-    else:
-        # 부등식 아래쪽 영역 표시
-        ax.fill_between(x_vals, y_range[0], y_vals, alpha=0.3, color='red', label='해집합')
-    
-    # 함수 그래프 그리기
-    ax.plot(x_vals, y_vals, 'b-', linewidth=2, label='경계선')
+    linestyle = '-' if BOUNDARY_TYPES[inequality_type] == 'closed' else '--'
+    ax.plot(x_vals, y_vals, color='blue', linestyle=linestyle, linewidth=2, label='경계선')
     
     # 근 표시 (이차 부등식인 경우)
     if 'roots' in inequality_result:
@@ -309,6 +1177,33 @@ for example in quadratic_examples:
         if result['roots']:
             print(f"근: {[f'{r:.2f}' for r in result['roots']]}")
 
+# 복합 부등식과 절댓값 부등식 (구간 연산)
+print("\n--- 복합 부등식과 절댓값 부등식 ---")
+compound_result = solve_compound_inequality([
+    {"a": 1, "b": 2, "type": ">="},
+    {"a": 1, "b": -2, "type": "<="}
+])
+absolute_results = [solve_absolute_inequality(1, 0, 2, "<="), solve_absolute_inequality(2, -1, 3, ">")]
+for result in [compound_result] + absolute_results:
+    if result['success']:
+        print(f"\n부등식: {result['inequality']}")
+        print(f"해: {result['solution']}")
+
+# 연립 일차부등식과 선형계획법 (반평면 교집합)
+print("\n--- 연립 일차부등식 ---")
+system_result = solve_linear_system([
+    {"a": 1, "b": 1, "c": 4, "type": "<="},
+    {"a": 1, "b": 3, "c": 6, "type": "<="},
+    {"a": 1, "b": 0, "c": 0, "type": ">="},
+    {"a": 0, "b": 1, "c": 0, "type": ">="}
+], objective=[3, 2])
+if system_result['success']:
+    print(f"\n연립부등식: {', '.join(system_result['constraints'])}")
+    print(f"꼭짓점: {[f'({x:.2f}, {y:.2f})' for x, y in system_result['vertices']]}")
+    print(f"영역 넓이: {system_result['area']:.2f}")
+    optimum = system_result['optimum']
+    print(f"3x + 2y의 최댓값: {optimum['value']:.2f} (x = {optimum['point'][0]:.2f}, y = {optimum['point'][1]:.2f})")
+
 # 시각화
 plt.figure(figsize=(15, 10))
 
@@ -363,13 +1258,13 @@ for i, result in enumerate(quadratic_results[:2]):
 # 수직선상 해집합
 plt.subplot(2, 3, 5)
 if linear_results:
-    visualize_number_line(linear_results[0])
+    visualize_number_line(linear_results[0], ax=plt.gca())
     plt.title("수직선상 해집합", fontweight='bold')
 
 # 사분면상 영역
 plt.subplot(2, 3, 6)
 if quadratic_results:
-    visualize_quadrant_region(quadratic_results[0])
+    visualize_quadrant_region(quadratic_results[0], ax=plt.gca())
     plt.title("사분면상 영역", fontweight='bold')
 
 plt.tight_layout()
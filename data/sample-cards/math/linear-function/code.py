@@ -1,6 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+def linear_curve(m, b, x_vals):
+    """f(x) = mx + b를 x 배열 전체에서 한 번에 평가합니다."""
+    return m * np.asarray(x_vals, dtype=float) + b
+
+# 분석 함수 이름 -> 같은 파라미터로 곡선을 평가하는 벡터화 함수 (서버의 적응형 샘플링에서 사용)
+CURVES = {'analyze_linear_function': linear_curve}
+
 def analyze_linear_function(m, b, x_range=(-10, 10)):
     """
     일차함수의 성질을 분석하고 시각화합니다.
@@ -45,7 +52,7 @@ def analyze_linear_function(m, b, x_range=(-10, 10)):
         
         # 그래프 생성
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
-        y_vals = m * x_vals + b
+        y_vals = linear_curve(m, b, x_vals)
         
         # 특별한 경우들
         special_cases = []
@@ -70,8 +77,42 @@ def analyze_linear_function(m, b, x_range=(-10, 10)):
             'x_intercept_desc': x_intercept_desc,
             'y_intercept_desc': y_intercept_desc,
             'special_cases': special_cases,
-            'x_values': x_vals.tolist(),
-            'y_values': y_vals.tolist(),
+            'x_values': x_vals,
+            'y_values': y_vals,
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def analyze_linear_batch(m, b, x_range=(-10, 10), num_points=1000):
+    """
+    여러 일차함수 (기울기, y절편) 세트를 한 번의 브로드캐스트 연산으로 분석합니다.
+    
+    m, b는 스칼라 또는 같은 길이의 리스트입니다. 결과는 열 단위(columnar)로,
+    y_values는 (n, num_points) 행렬이고 x절편이 없으면(m = 0) NaN입니다.
+    
+    Returns:
+        dict: 열 단위 분석 결과
+    """
+    try:
+        m, b = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in (m, b)))
+        x_vals = np.linspace(x_range[0], x_range[1], num_points)
+        
+        with np.errstate(all='ignore'):
+            x_intercept = np.where(m != 0, -b / m, np.nan) + 0.0  # -0.0 정규화
+        
+        return {
+            'count': len(m),
+            'slope': m,
+            'y_intercept': b,
+            'x_intercept': x_intercept,
+            'slope_type': np.select([m > 0, m < 0], ["increasing", "decreasing"], "constant").tolist(),
+            'x_values': x_vals,
+            'y_values': m[:, None] * x_vals + b[:, None],
             'success': True
         }
         
@@ -169,10 +210,9 @@ y_intercept = 2
 slopes = [-3, -1, 0, 1, 3]
 
 plt.subplot(2, 2, 1)
-for m in slopes:
-    x_vals = np.linspace(-5, 5, 100)
-    y_vals = m * x_vals + y_intercept
-    plt.plot(x_vals, y_vals, linewidth=2, label=f'm = {m}')
+sweep = analyze_linear_batch(slopes, y_intercept, x_range=(-5, 5), num_points=100)
+for m, y_vals in zip(slopes, sweep['y_values']):
+    plt.plot(sweep['x_values'], y_vals, linewidth=2, label=f'm = {m}')
 plt.title('다양한 기울기 (y절편 = 2)', fontweight='bold')
 plt.xlabel('x')
 plt.ylabel('y')
@@ -186,10 +226,9 @@ slope = 1
 y_intercepts = [-3, -1, 0, 1, 3]
 
 plt.subplot(2, 2, 2)
-for b in y_intercepts:
-    x_vals = np.linspace(-5, 5, 100)
-    y_vals = slope * x_vals + b
-    plt.plot(x_vals, y_vals, linewidth=2, label=f'b = {b}')
+sweep = analyze_linear_batch(slope, y_intercepts, x_range=(-5, 5), num_points=100)
+for b, y_vals in zip(y_intercepts, sweep['y_values']):
+    plt.plot(sweep['x_values'], y_vals, linewidth=2, label=f'b = {b}')
 plt.title('다양한 y절편 (기울기 = 1)', fontweight='bold')
 plt.xlabel('x')
 plt.ylabel('y')
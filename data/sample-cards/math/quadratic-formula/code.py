@@ -1,6 +1,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+def quadratic_curve(a, b, c, x_vals):
+    """f(x) = ax² + bx + c를 x 배열 전체에서 한 번에 평가합니다."""
+    x_vals = np.asarray(x_vals, dtype=float)
+    return a * x_vals**2 + b * x_vals + c
+
+# 분석 함수 이름 -> 같은 파라미터로 곡선을 평가하는 벡터화 함수 (서버의 적응형 샘플링에서 사용)
+CURVES = {'analyze_quadratic_function': quadratic_curve}
+
 def analyze_quadratic_function(a, b, c, x_range=(-10, 10)):
     """
     이차함수의 성질을 분석하고 시각화합니다.
@@ -30,16 +38,13 @@ def analyze_quadratic_function(a, b, c, x_range=(-10, 10)):
         # y절편
         y_intercept = c
         
-        # x절편 계산 (근의 공식)
-        if discriminant > 0:
-            x1 = (-b + np.sqrt(discriminant)) / (2*a)
-            x2 = (-b - np.sqrt(discriminant)) / (2*a)
-            x_intercepts = [x1, x2]
-            x_intercepts_desc = f"x = {x1:.4f}, x = {x2:.4f}"
-        elif discriminant == 0:
-            x1 = -b / (2*a)
-            x_intercepts = [x1]
-            x_intercepts_desc = f"x = {x1:.4f} (중근)"
+        # x절편 계산 (자릿수 상쇄가 없는 근의 공식, 오름차순)
+        root1, root2, root_count = quadratic_roots(a, b, c)
+        x_intercepts = [float(root) for root in (root1, root2)[:int(root_count)]]
+        if len(x_intercepts) == 2:
+            x_intercepts_desc = f"x = {x_intercepts[0]:.4f}, x = {x_intercepts[1]:.4f}"
+        elif len(x_intercepts) == 1:
+            x_intercepts_desc = f"x = {x_intercepts[0]:.4f} (중근)"
         else:
             x_intercepts = []
             x_intercepts_desc = "실근이 없음"
@@ -54,7 +59,7 @@ def analyze_quadratic_function(a, b, c, x_range=(-10, 10)):
         
         # 그래프 생성
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
-        y_vals = a * x_vals**2 + b * x_vals + c
+        y_vals = quadratic_curve(a, b, c, x_vals)
         
         # 꼭짓점 형태로 변환
         vertex_form = f"f(x) = {a}(x - {vertex_x:.4f})² + {vertex_y:.4f}"
@@ -81,8 +86,78 @@ def analyze_quadratic_function(a, b, c, x_range=(-10, 10)):
             'x_intercepts_desc': x_intercepts_desc,
             'y_intercept_desc': f"y = {c:.4f}",
             'special_cases': special_cases,
-            'x_values': x_vals.tolist(),
-            'y_values': y_vals.tolist(),
+            'x_values': x_vals,
+            'y_values': y_vals,
+            'success': True
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def quadratic_roots(a, b, c):
+    """
+    이차방정식 ax² + bx + c = 0의 실근을 배열 단위로 계산합니다.
+    
+    근의 공식을 그대로 쓰면 b² ≫ 4ac일 때 -b ± √D에서 자릿수 상쇄가
+    생기므로, q = -(b + sign(b)·√D) / 2로 한 근을 구하고 다른 근은
+    근과 계수의 관계(x₁x₂ = c/a)로 구합니다.
+    
+    Returns:
+        tuple: (작은 근, 큰 근, 실근 개수) - 근이 없으면 NaN, 중근이면 큰 근이 NaN
+    """
+    a, b, c = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (a, b, c)))
+    discriminant = b**2 - 4*a*c
+    root_count = np.where(a == 0, 0, np.select([discriminant > 0, discriminant == 0], [2, 1], 0))
+    
+    with np.errstate(all='ignore'):
+        sqrt_d = np.sqrt(np.where(discriminant >= 0, discriminant, np.nan))
+        q = -0.5 * (b + np.copysign(sqrt_d, b))
+        first = q / a
+        second = np.where(q != 0, c / q, first)
+    
+    root1 = np.where(root_count > 0, np.fmin(first, second), np.nan) + 0.0  # -0.0 정규화
+    root2 = np.where(root_count == 2, np.fmax(first, second), np.nan) + 0.0
+    return root1, root2, root_count
+
+def analyze_quadratic_batch(a, b, c, x_range=(-10, 10), num_points=1000):
+    """
+    여러 이차함수 계수 세트를 한 번의 브로드캐스트 연산으로 분석합니다.
+    
+    a, b, c는 스칼라 또는 같은 길이의 리스트입니다. 결과는 열 단위(columnar)로,
+    계수별 값은 길이 n 배열이고 y_values는 (n, num_points) 행렬입니다.
+    a = 0인 행(이차함수가 아님)의 꼭짓점과 근은 NaN입니다.
+    
+    Returns:
+        dict: 열 단위 분석 결과
+    """
+    try:
+        a, b, c = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in (a, b, c)))
+        x_vals = np.linspace(x_range[0], x_range[1], num_points)
+        
+        discriminant = b**2 - 4*a*c
+        with np.errstate(all='ignore'):
+            vertex_x = np.where(a != 0, -b / (2*a), np.nan) + 0.0  # -0.0 정규화
+            vertex_y = np.where(a != 0, c - b**2 / (4*a), np.nan)
+        root1, root2, root_count = quadratic_roots(a, b, c)
+        
+        return {
+            'count': len(a),
+            'a': a,
+            'b': b,
+            'c': c,
+            'discriminant': discriminant,
+            'vertex_x': vertex_x,
+            'vertex_y': vertex_y,
+            'root1': root1,
+            'root2': root2,
+            'root_count': root_count,
+            'y_intercept': c,
+            'range_type': np.where(a > 0, "minimum", "maximum").tolist(),
+            'x_values': x_vals,
+            'y_values': (a[:, None] * x_vals + b[:, None]) * x_vals + c[:, None],
             'success': True
         }
         
@@ -3,25 +3,704 @@
 Python Code Runner for Interactive Educational Platform
 """
 
+import ast
+import base64
+import hashlib
+import importlib.util
 import json
+import marshal
+import math
+import os
 import sys
+import tempfile
+import time
 import traceback
-from io import StringIO
-from contextlib import redirect_stdout, redirect_stderr
-import matplotlib
-matplotlib.use('Agg')  # GUI 없이 실행
+import types
+from io import BytesIO, StringIO
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
+from pathlib import Path
 
-def run_code(code: str, timeout: int = 30) -> dict:
+# GUI 없이 실행. matplotlib은 실행 코드가 import할 때까지 로드하지 않고,
+# 백엔드만 환경 변수로 미리 지정합니다.
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+# 카탈로그 카드 코드의 컴파일된 code object 캐시 (소스 해시 -> code object)
+# 이미지 빌드 시 --preload로만 채우며, 실행 중에는 읽기만 합니다.
+BYTECODE_CACHE_DIR = Path(os.environ.get('RUNNER_BYTECODE_CACHE') or '/opt/runner/bytecode')
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent / 'data'
+
+def _source_key(code: str, filename: str) -> str:
+    """소스 코드와 인터프리터 버전으로 캐시 키를 만듭니다."""
+    digest = hashlib.sha256()
+    digest.update(importlib.util.MAGIC_NUMBER)
+    digest.update(filename.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(code.encode('utf-8'))
+    return digest.hexdigest()
+
+def _is_trusted(path: Path) -> bool:
+    """
+    현재 프로세스(와 그 안에서 실행되는 사용자 코드)가 바꿀 수 없는 경로인지 확인합니다.
+    
+    다른 사용자(빌드 시점의 root) 소유이고 그룹/기타 쓰기 권한이 없어야 합니다.
+    root로 실행 중이면 어떤 파일이든 바꿀 수 있으므로 항상 False입니다.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return os.geteuid() != 0 and stat.st_uid != os.geteuid() and not stat.st_mode & 0o022
+
+def _load_cached_bytecode(path: Path):
+    """신뢰할 수 있는 디스크 캐시에서 code object를 읽습니다. 없거나 신뢰할 수 없으면 None."""
+    if not (_is_trusted(path.parent) and _is_trusted(path)):
+        return None
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    magic = importlib.util.MAGIC_NUMBER
+    if not data.startswith(magic):
+        return None
+    try:
+        return marshal.loads(data[len(magic):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+def _store_cached_bytecode(path: Path, code_obj) -> None:
+    """code object를 원자적으로 디스크 캐시에 기록합니다 (읽기 전용 권한)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(importlib.util.MAGIC_NUMBER)
+        f.write(marshal.dumps(code_obj))
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+def compile_code(code: str, filename: str = '<string>'):
+    """
+    소스 코드를 컴파일합니다. 카탈로그 카드 코드는 빌드 시 만든 캐시에서 읽습니다.
+    
+    사용자 코드는 디스크에 기록하지 않으며, 캐시 디렉터리는 실행 중인 프로세스가
+    쓸 수 없을 때만 사용합니다 (_is_trusted).
+    
+    Args:
+        code (str): 컴파일할 Python 코드
+        filename (str): 트레이스백에 표시될 파일 이름
+    
+    Returns:
+        code: 실행 가능한 code object
+    """
+    code_obj = _load_cached_bytecode(BYTECODE_CACHE_DIR / f'{_source_key(code, filename)}.bin')
+    if code_obj is None:
+        code_obj = compile(code, filename, 'exec')
+    return code_obj
+
+def iter_catalog_sources(data_dir=DEFAULT_DATA_DIR):
+    """카탈로그(data/raw)의 모든 카드 code.py 경로를 반환합니다."""
+    raw_dir = Path(data_dir) / 'raw'
+    if not raw_dir.exists():
+        return []
+    return sorted(raw_dir.glob('*/*/code.py'))
+
+def preload_catalog(data_dir=DEFAULT_DATA_DIR) -> int:
+    """
+    카탈로그의 모든 카드 코드를 컴파일해 디스크 캐시에 기록합니다.
+    
+    현재 카탈로그에 없는 캐시 파일은 지우므로 캐시 크기는 카드 수로 제한됩니다.
+    이미지 빌드 시(실행 사용자와 다른 사용자로) 한 번만 실행합니다.
+    
+    Returns:
+        int: 컴파일된 카드 수
+    """
+    keys = set()
+    for source_path in iter_catalog_sources(data_dir):
+        try:
+            code = source_path.read_text(encoding='utf-8')
+            key = _source_key(code, '<string>')
+            _store_cached_bytecode(BYTECODE_CACHE_DIR / f'{key}.bin', compile(code, '<string>', 'exec'))
+            keys.add(key)
+        except (OSError, SyntaxError) as e:
+            print(f"카드 코드 컴파일 오류 ({source_path}): {e}", file=sys.stderr)
+    for stale in BYTECODE_CACHE_DIR.glob('*.bin'):
+        if stale.stem not in keys:
+            stale.unlink()
+    return len(keys)
+
+def capture_figures(dpi: int = 100) -> list:
+    """
+    열려 있는 모든 matplotlib 그림을 PNG로 저장하고 닫습니다.
+    
+    Returns:
+        list: {'format', 'data'(base64)} 딕셔너리 목록
+    """
+    import matplotlib.pyplot as plt
+    
+    figures = []
+    for num in plt.get_fignums():
+        buffer = BytesIO()
+        plt.figure(num).savefig(buffer, format='png', dpi=dpi)
+        figures.append({
+            'format': 'png',
+            'data': base64.b64encode(buffer.getvalue()).decode('ascii')
+        })
+    plt.close('all')
+    return figures
+
+# 결과 변수 추출 설정
+DEFAULT_VARIABLE_BUDGET = 512 * 1024  # 응답당 변수 직렬화 최대 바이트
+MAX_CONTAINER_ITEMS = 100  # 이보다 큰 컨테이너는 요약
+PREVIEW_ITEMS = 10
+MAX_STRING_LENGTH = 1000
+MAX_DEPTH = 4
+
+class UnserializableValue(Exception):
+    """JSON으로 표현할 수 없는 값"""
+
+def _encode_ndarray(array) -> dict:
+    """NumPy 배열을 리틀엔디언 바이너리 블록(base64)으로 인코딩합니다."""
+    import numpy as np
+    
+    if array.dtype.kind not in 'biuf':
+        raise UnserializableValue(f'unsupported dtype {array.dtype}')
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+    return {
+        'type': 'ndarray',
+        'dtype': array.dtype.str,
+        'shape': list(array.shape),
+        'data': base64.b64encode(array.tobytes()).decode('ascii')
+    }
+
+def _is_numeric_sequence(value) -> bool:
+    return all(
+        isinstance(item, (int, float)) and not isinstance(item, bool)
+        for item in value
+    )
+
+def encode_value(value, depth: int = 0):
+    """
+    실행 결과 값을 크기가 제한된 JSON 호환 형태로 변환합니다.
+    
+    NumPy 배열과 큰 숫자 리스트는 바이너리 블록으로, 큰 컨테이너는 요약으로
+    바꿉니다. 표현할 수 없는 값은 UnserializableValue를 발생시킵니다.
+    """
+    numpy = sys.modules.get('numpy')
+    
+    if value is None or isinstance(value, (bool, int)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, str):
+        if len(value) > MAX_STRING_LENGTH:
+            return {'type': 'str', 'length': len(value), 'preview': value[:MAX_STRING_LENGTH]}
+        return value
+    if numpy is not None:
+        if isinstance(value, numpy.ndarray):
+            return _encode_ndarray(value)
+        if isinstance(value, numpy.generic):
+            return encode_value(value.item(), depth)
+    if depth >= MAX_DEPTH:
+        raise UnserializableValue('nesting too deep')
+    
+    if isinstance(value, (list, tuple)):
+        if len(value) > MAX_CONTAINER_ITEMS:
+            if numpy is not None and _is_numeric_sequence(value):
+                return _encode_ndarray(numpy.asarray(value))
+            return {
+                'type': type(value).__name__,
+                'length': len(value),
+                'preview': [encode_value(item, depth + 1) for item in value[:PREVIEW_ITEMS]]
+            }
+        return [encode_value(item, depth + 1) for item in value]
+    if isinstance(value, dict):
+        if len(value) > MAX_CONTAINER_ITEMS:
+            return {
+                'type': 'dict',
+                'length': len(value),
+                'keys': [str(key) for key in list(value)[:PREVIEW_ITEMS]]
+            }
+        return {str(key): encode_value(item, depth + 1) for key, item in value.items()}
+    
+    raise UnserializableValue(f'unsupported type {type(value).__name__}')
+
+def extract_variables(namespace: dict, names, byte_budget: int = DEFAULT_VARIABLE_BUDGET):
+    """
+    실행이 끝난 네임스페이스에서 요청된 전역 변수를 추출합니다.
+    
+    Args:
+        namespace (dict): 코드가 실행된 전역 네임스페이스
+        names (list): 추출할 변수 이름 목록
+        byte_budget (int): 직렬화된 변수 전체의 최대 바이트 수
+    
+    Returns:
+        tuple: (변수 딕셔너리, 건너뛴 변수와 사유 딕셔너리)
+    """
+    variables = {}
+    skipped = {}
+    used = 0
+    
+    for name in names:
+        if name not in namespace:
+            skipped[name] = 'not found'
+            continue
+        try:
+            encoded = encode_value(namespace[name])
+        except (UnserializableValue, RecursionError) as e:
+            skipped[name] = f'unserializable: {e}'
+            continue
+        
+        size = len(json.dumps(encoded, ensure_ascii=False).encode('utf-8'))
+        if used + size > byte_budget:
+            skipped[name] = f'over budget ({size} bytes)'
+            continue
+        
+        variables[name] = encoded
+        used += size
+    
+    return variables, skipped
+
+# 플롯 스펙 모드 설정
+PLOT_MODES = ('image', 'spec')
+PLOT_SPEC_VERSION = 1
+DEFAULT_FIGSIZE = (6.4, 4.8)
+FMT_COLORS = {
+    'b': 'blue', 'g': 'green', 'r': 'red', 'c': 'cyan',
+    'm': 'magenta', 'y': 'yellow', 'k': 'black', 'w': 'white'
+}
+FMT_LINESTYLES = ('--', '-.', '-', ':')
+FMT_MARKERS = '.,ov^<>1234sp*hH+xDd|_'
+
+# 지금 기록 중인 RecordingPyplot (recording_pyplot 블록 안에서만 설정)
+_active_pyplot = None
+
+class UnsupportedPlotCall(Exception):
+    """
+    플롯 스펙으로 기록할 수 없는 matplotlib 호출
+    
+    실행 코드가 `except Exception`으로 잡아 삼켜도 대체가 빠지지 않도록,
+    생성될 때 기록 중인 RecordingPyplot에 첫 번째 사유를 남깁니다.
+    """
+    
+    def __init__(self, reason):
+        super().__init__(reason)
+        if _active_pyplot is not None and _active_pyplot.unsupported is None:
+            _active_pyplot.unsupported = reason
+
+def _parse_fmt(fmt: str) -> dict:
+    """'ro', 'b--' 같은 plot 서식 문자열을 스타일 딕셔너리로 바꿉니다."""
+    style = {}
+    rest = fmt
+    for linestyle in FMT_LINESTYLES:
+        if linestyle in rest:
+            style['linestyle'] = linestyle
+            rest = rest.replace(linestyle, '', 1)
+            break
+    for char in rest:
+        if char in FMT_COLORS:
+            style['color'] = FMT_COLORS[char]
+        elif char in FMT_MARKERS:
+            style['marker'] = char
+        else:
+            raise UnsupportedPlotCall(f'plot format {fmt!r}')
+    if 'marker' in style and 'linestyle' not in style:
+        style['linestyle'] = 'none'
+    return style
+
+def _plot_array(values, size=None):
+    """plot 인자를 1차원 float 배열로 바꿉니다. size가 주어지면 스칼라를 늘립니다."""
+    import numpy as np
+    
+    try:
+        array = np.atleast_1d(np.asarray(values, dtype=float))
+    except (TypeError, ValueError):
+        raise UnsupportedPlotCall('non-numeric plot data')
+    if array.ndim != 1:
+        raise UnsupportedPlotCall('multi-dimensional plot data')
+    if size is not None and array.size != size:
+        if array.size != 1:
+            raise UnsupportedPlotCall('plot data lengths differ')
+        array = np.full(size, array[0])
+    return array
+
+def _plot_style(kwargs) -> dict:
+    """키워드 인자를 JSON 스타일 딕셔너리로 바꿉니다. 배열 같은 값은 기록할 수 없습니다."""
+    for key, value in kwargs.items():
+        if value is not None and not isinstance(value, (bool, int, float, str)):
+            raise UnsupportedPlotCall(f'plot argument {key}={type(value).__name__}')
+    return dict(kwargs)
+
+class RecordingAxes:
+    """축 호출을 트레이스와 축 설정으로 기록하는 대역"""
+    
+    def __init__(self, position):
+        self.spec = {'position': list(position), 'traces': []}
+    
+    def __getattr__(self, name):
+        raise UnsupportedPlotCall(f'Axes.{name}')
+    
+    def plot(self, *args, **kwargs):
+        style = _plot_style(kwargs)
+        index = 0
+        while index < len(args):
+            if index + 1 < len(args) and not isinstance(args[index + 1], str):
+                x = _plot_array(args[index])
+                y = _plot_array(args[index + 1], x.size)
+                index += 2
+            else:
+                y = _plot_array(args[index])
+                x = _plot_array(range(y.size))
+                index += 1
+            fmt = {}
+            if index < len(args) and isinstance(args[index], str):
+                fmt = _parse_fmt(args[index])
+                index += 1
+            self.spec['traces'].append({'type': 'line', 'x': x, 'y': y, 'style': dict(fmt, **style)})
+    
+    def axhline(self, y=0, **kwargs):
+        self.spec['traces'].append({'type': 'hline', 'y': float(y), 'style': _plot_style(kwargs)})
+    
+    def axvline(self, x=0, **kwargs):
+        self.spec['traces'].append({'type': 'vline', 'x': float(x), 'style': _plot_style(kwargs)})
+    
+    def fill_between(self, x, y1, y2=0, where=None, **kwargs):
+        x = _plot_array(x)
+        trace = {
+            'type': 'fill',
+            'x': x,
+            'y1': _plot_array(y1, x.size),
+            'y2': _plot_array(y2, x.size),
+            'style': _plot_style(kwargs)
+        }
+        if where is not None:
+            import numpy as np
+            trace['where'] = np.asarray(where, dtype=bool).ravel()
+            if trace['where'].size != x.size:
+                raise UnsupportedPlotCall('fill_between where length differs')
+        self.spec['traces'].append(trace)
+    
+    def set_title(self, label, **kwargs):
+        self.spec['title'] = {'text': str(label), 'style': _plot_style(kwargs)}
+    
+    def set_xlabel(self, label, **kwargs):
+        self.spec['xlabel'] = str(label)
+    
+    def set_ylabel(self, label, **kwargs):
+        self.spec['ylabel'] = str(label)
+    
+    def set_xlim(self, left=None, right=None):
+        if isinstance(left, (list, tuple)):
+            left, right = left
+        self.spec['xlim'] = [left, right]
+    
+    def set_ylim(self, bottom=None, top=None):
+        if isinstance(bottom, (list, tuple)):
+            bottom, top = bottom
+        self.spec['ylim'] = [bottom, top]
+    
+    def legend(self, *args, **kwargs):
+        if args:
+            raise UnsupportedPlotCall('legend with explicit handles')
+        self.spec['legend'] = _plot_style(kwargs)
+    
+    def grid(self, visible=None, **kwargs):
+        self.spec['grid'] = {'visible': True if visible is None else bool(visible),
+                             'style': _plot_style(kwargs)}
+
+class RecordingFigure:
+    """plt.figure()가 반환하는 그림 핸들 대역 (메서드는 지원하지 않음)"""
+    
+    def __getattr__(self, name):
+        raise UnsupportedPlotCall(f'Figure.{name}')
+
+class RecordingPyplot(types.ModuleType):
+    """
+    matplotlib.pyplot 대역
+    
+    카드 코드가 주로 쓰는 호출(figure, subplot, plot, axhline, axvline,
+    fill_between, title, legend, grid 등)만 기록하고, 그 외 속성에 접근하면
+    UnsupportedPlotCall을 발생시켜 실제 렌더링으로 넘어가게 합니다.
+    """
+    
+    def __init__(self):
+        super().__init__('matplotlib.pyplot')
+        self.figures = []
+        self.unsupported = None  # 실행 중 처음 만난 기록할 수 없는 호출
+        self._axes = None
+    
+    def __getattr__(self, name):
+        raise UnsupportedPlotCall(f'pyplot.{name}')
+    
+    def figure(self, num=None, figsize=None, **kwargs):
+        if num is not None:
+            raise UnsupportedPlotCall('figure with num')
+        self.figures.append({'size': list(figsize or DEFAULT_FIGSIZE), 'axes': {}})
+        self._axes = None
+        return RecordingFigure()
+    
+    def subplot(self, *args):
+        if len(args) == 1 and isinstance(args[0], int):
+            args = tuple(int(digit) for digit in str(args[0]))
+        if len(args) != 3 or not all(isinstance(arg, int) for arg in args):
+            raise UnsupportedPlotCall('subplot arguments')
+        if not self.figures:
+            self.figure()
+        axes = self.figures[-1]['axes']
+        if args not in axes:
+            axes[args] = RecordingAxes(args)
+        self._axes = axes[args]
+        return self._axes
+    
+    def gca(self):
+        return self._axes or self.subplot(1, 1, 1)
+    
+    def plot(self, *args, **kwargs):
+        self.gca().plot(*args, **kwargs)
+    
+    def axhline(self, y=0, **kwargs):
+        self.gca().axhline(y, **kwargs)
+    
+    def axvline(self, x=0, **kwargs):
+        self.gca().axvline(x, **kwargs)
+    
+    def fill_between(self, x, y1, y2=0, **kwargs):
+        self.gca().fill_between(x, y1, y2, **kwargs)
+    
+    def title(self, label, **kwargs):
+        self.gca().set_title(label, **kwargs)
+    
+    def xlabel(self, label, **kwargs):
+        self.gca().set_xlabel(label, **kwargs)
+    
+    def ylabel(self, label, **kwargs):
+        self.gca().set_ylabel(label, **kwargs)
+    
+    def xlim(self, *args, **kwargs):
+        self.gca().set_xlim(*args, **kwargs)
+    
+    def ylim(self, *args, **kwargs):
+        self.gca().set_ylim(*args, **kwargs)
+    
+    def legend(self, *args, **kwargs):
+        self.gca().legend(*args, **kwargs)
+    
+    def grid(self, visible=None, **kwargs):
+        self.gca().grid(visible, **kwargs)
+    
+    def tight_layout(self, **kwargs):
+        pass
+    
+    def show(self, **kwargs):
+        pass
+    
+    def close(self, fig=None):
+        if fig == 'all':
+            self.figures.clear()
+        elif fig is None and self.figures:
+            self.figures.pop()
+        elif fig is not None:
+            raise UnsupportedPlotCall('close with figure handle')
+        self._axes = None
+    
+    def to_spec(self) -> dict:
+        """기록된 그림을 배열이 바이너리 블록으로 인코딩된 플롯 스펙으로 만듭니다."""
+        numpy = sys.modules.get('numpy')
+        
+        def encode(value):
+            if isinstance(value, dict):
+                return {key: encode(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [encode(item) for item in value]
+            if numpy is not None and isinstance(value, numpy.ndarray):
+                return _encode_ndarray(value)
+            if isinstance(value, float):
+                return float(value) if math.isfinite(value) else None
+            return value
+        
+        figures = [
+            {'size': figure['size'], 'axes': [axes.spec for axes in figure['axes'].values()]}
+            for figure in self.figures
+        ]
+        return {'version': PLOT_SPEC_VERSION, 'figures': encode(figures)}
+
+class _MatplotlibSubmoduleBlocker:
+    """기록 모드에서 pyplot 외 matplotlib 하위 모듈(import) 사용을 대체 사유로 바꿉니다."""
+    
+    def find_spec(self, name, path=None, target=None):
+        if name.startswith('matplotlib.') and name != 'matplotlib.pyplot':
+            raise UnsupportedPlotCall(f'import {name}')
+        return None
+
+@contextmanager
+def recording_pyplot():
+    """
+    실행 동안 matplotlib과 matplotlib.pyplot을 기록 대역으로 바꿉니다.
+    
+    실제 matplotlib은 import하지 않으며, 끝나면 원래 모듈을 복원합니다.
+    """
+    global _active_pyplot
+    pyplot = RecordingPyplot()
+    package = types.ModuleType('matplotlib')
+    package.__path__ = []
+    package.pyplot = pyplot
+    package.use = lambda *args, **kwargs: None
+    
+    saved = {name: sys.modules.get(name) for name in ('matplotlib', 'matplotlib.pyplot')}
+    blocker = _MatplotlibSubmoduleBlocker()
+    sys.modules.update({'matplotlib': package, 'matplotlib.pyplot': pyplot})
+    sys.meta_path.insert(0, blocker)
+    _active_pyplot = pyplot
+    try:
+        yield pyplot
+    finally:
+        _active_pyplot = None
+        sys.meta_path.remove(blocker)
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+def _recorded_calls(cls) -> frozenset:
+    """기록 대역 클래스가 지원하는 공개 메서드 이름"""
+    return frozenset(name for name, value in vars(cls).items()
+                     if callable(value) and not name.startswith('_') and name != 'to_spec')
+
+class _PlotUseScanner(ast.NodeVisitor):
+    """
+    실행 전에 소스에서 기록할 수 없는 matplotlib 사용을 찾습니다.
+    
+    pyplot/matplotlib 별칭과 plt.figure(), plt.subplot(), plt.gca()의 반환값을
+    받은 이름을 추적해, 대역이 지원하지 않는 하위 모듈 import와 속성 접근을
+    찾으면 첫 번째 사유를 reason에 남깁니다. 인자 형식처럼 정적으로 알 수 없는
+    경우는 실행 중 UnsupportedPlotCall로 드러납니다.
+    """
+    
+    PYPLOT_CALLS = _recorded_calls(RecordingPyplot)
+    AXES_CALLS = _recorded_calls(RecordingAxes)
+    
+    def __init__(self):
+        self.reason = None
+        self.pyplot = set()
+        self.package = set()
+        self.handles = {}  # 이름 -> 'Axes' 또는 'Figure'
+    
+    def _unsupported(self, reason):
+        if self.reason is None:
+            self.reason = reason
+    
+    def _check_module(self, name):
+        if name.startswith('matplotlib.') and name != 'matplotlib.pyplot':
+            self._unsupported(f'import {name}')
+    
+    def visit_Import(self, node):
+        for alias in node.names:
+            self._check_module(alias.name)
+            if alias.name == 'matplotlib.pyplot' and alias.asname:
+                self.pyplot.add(alias.asname)
+            elif alias.name.split('.')[0] == 'matplotlib':
+                self.package.add(alias.asname or 'matplotlib')
+    
+    def visit_ImportFrom(self, node):
+        module = node.module or ''
+        self._check_module(module)
+        for alias in node.names:
+            if module == 'matplotlib':
+                if alias.name == 'pyplot':
+                    self.pyplot.add(alias.asname or alias.name)
+                elif alias.name != 'use':
+                    self._unsupported(f'import matplotlib.{alias.name}')
+            elif module == 'matplotlib.pyplot' and alias.name not in self.PYPLOT_CALLS:
+                self._unsupported(f'pyplot.{alias.name}')
+    
+    def _handle_kind(self, node):
+        """node가 추적 중인 그림/축 핸들을 만드는 식이면 'Figure' 또는 'Axes'"""
+        if isinstance(node, ast.Name):
+            return self.handles.get(node.id)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and self._is_pyplot(node.func.value):
+            return {'figure': 'Figure', 'subplot': 'Axes', 'gca': 'Axes'}.get(node.func.attr)
+        return None
+    
+    def _is_pyplot(self, node):
+        if isinstance(node, ast.Name):
+            return node.id in self.pyplot
+        return (isinstance(node, ast.Attribute) and node.attr == 'pyplot'
+                and isinstance(node.value, ast.Name) and node.value.id in self.package)
+    
+    def visit_Assign(self, node):
+        self.generic_visit(node)
+        kind = self._handle_kind(node.value)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                if kind is None:
+                    self.handles.pop(target.id, None)
+                else:
+                    self.handles[target.id] = kind
+    
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        if self._is_pyplot(node.value):
+            if node.attr not in self.PYPLOT_CALLS:
+                self._unsupported(f'pyplot.{node.attr}')
+        elif isinstance(node.value, ast.Name) and node.value.id in self.package:
+            if node.attr not in ('pyplot', 'use'):
+                self._unsupported(f'matplotlib.{node.attr}')
+        else:
+            kind = self._handle_kind(node.value)
+            if kind == 'Figure' or kind == 'Axes' and node.attr not in self.AXES_CALLS:
+                self._unsupported(f'{kind}.{node.attr}')
+
+def find_unsupported_plot_use(code: str):
+    """
+    플롯 스펙으로 기록할 수 없는 matplotlib 사용을 실행 전에 찾습니다.
+    
+    Returns:
+        str: 첫 번째 대체 사유 (예: 'import matplotlib.patches', 'pyplot.text'), 없으면 None
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    scanner = _PlotUseScanner()
+    scanner.visit(tree)
+    return scanner.reason
+
+def run_code(code: str, timeout: int = 30, figures: bool = False,
+             variables=None, variable_budget: int = DEFAULT_VARIABLE_BUDGET,
+             plot_mode: str = 'image') -> dict:
     """
     Python 코드를 실행하고 결과를 반환합니다.
     
     Args:
         code (str): 실행할 Python 코드
         timeout (int): 실행 제한 시간 (초)
+        figures (bool): 실행 후 생성된 그림을 PNG로 반환할지 여부
+        variables (list): 실행 후 추출할 전역 변수 이름 목록 (선택)
+        variable_budget (int): 추출된 변수 직렬화 최대 바이트 수
+        plot_mode (str): 'spec'이면 pyplot 호출을 플롯 스펙(plot_spec)으로 기록합니다.
+            실행 전 검사에서 기록할 수 없는 사용이 보이면 처음부터 실제 matplotlib으로
+            실행해 PNG를 반환하고, 실행 중에야 드러나면 실제 matplotlib으로 다시 실행
     
     Returns:
         dict: 실행 결과를 포함한 딕셔너리
     """
+    if plot_mode == 'spec':
+        # 대체 여부는 가능하면 실행 전에 정해 코드를 한 번만 실행
+        reason = find_unsupported_plot_use(code)
+        if reason is None:
+            with recording_pyplot() as pyplot:
+                result = run_code(code, timeout, False, variables, variable_budget)
+            reason = pyplot.unsupported
+        if reason is not None:
+            # 실행 중에야 드러난 경우에도 실제 matplotlib으로 다시 실행해 그림을 반환
+            result = run_code(code, timeout, True, variables, variable_budget)
+            result.update(plot_mode='image', plot_fallback=reason)
+            return result
+        result['plot_mode'] = 'spec'
+        if result['success']:
+            result['plot_spec'] = pyplot.to_spec()
+        return result
+    
     result = {
         'success': False,
         'output': '',
@@ -29,7 +708,11 @@ def run_code(code: str, timeout: int = 30) -> dict:
         'execution_time': 0,
         'variables': {}
     }
+    if figures:
+        result['figures'] = []
     
+    namespace = {}
+    start_time = time.perf_counter()
     try:
         # 표준 출력과 에러를 캡처
         stdout_capture = StringIO()
@@ -37,20 +720,52 @@ def run_code(code: str, timeout: int = 30) -> dict:
         
         # 코드 실행
         with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-            exec(code, {})
+            exec(compile_code(code), namespace)
         
         result['output'] = stdout_capture.getvalue()
         result['error'] = stderr_capture.getvalue()
         result['success'] = True
         
+        if variables:
+            result['variables'], skipped = extract_variables(namespace, variables, variable_budget)
+            if skipped:
+                result['skipped_variables'] = skipped
+        
     except Exception as e:
         result['error'] = f"Error: {str(e)}\n{traceback.format_exc()}"
         result['success'] = False
     
+    result['execution_time'] = time.perf_counter() - start_time
+    
+    if figures and 'matplotlib.pyplot' in sys.modules:
+        result['figures'] = capture_figures()
+    
     return result
 
-def main():
+def main(argv=None):
     """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Interactive Edu Python Code Runner')
+    parser.add_argument('--preload', action='store_true',
+                        help='카탈로그의 모든 카드 코드를 미리 컴파일하고 종료합니다')
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR),
+                        help='카드 데이터 디렉터리 (기본값: 저장소의 data/)')
+    parser.add_argument('--figures', action='store_true',
+                        help='실행 후 생성된 그림을 PNG(base64)로 결과에 포함합니다')
+    parser.add_argument('--variables', default='',
+                        help='실행 후 추출할 전역 변수 이름 (쉼표로 구분)')
+    parser.add_argument('--plot-mode', choices=PLOT_MODES, default='image',
+                        help="'spec'이면 그림을 렌더링하지 않고 플롯 스펙(JSON)으로 기록합니다")
+    parser.add_argument('--variable-budget', type=int, default=DEFAULT_VARIABLE_BUDGET,
+                        help='추출된 변수 직렬화 최대 바이트 수')
+    args = parser.parse_args(argv)
+    
+    if args.preload:
+        count = preload_catalog(args.data_dir)
+        print(json.dumps({'success': True, 'preloaded': count}))
+        return
+    
     try:
         # 표준 입력에서 코드 읽기
         code = sys.stdin.read()
@@ -63,7 +778,14 @@ def main():
             return
         
         # 코드 실행
-        result = run_code(code)
+        variable_names = [name.strip() for name in args.variables.split(',') if name.strip()]
+        result = run_code(
+            code,
+            figures=args.figures,
+            variables=variable_names,
+            variable_budget=args.variable_budget,
+            plot_mode=args.plot_mode
+        )
         
         # 결과를 JSON으로 출력
         print(json.dumps(result, ensure_ascii=False))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+서버 측 그래프 렌더링 스레드 확장성 벤치마크
+
+백엔드 렌더러(스레드 수만큼의 Figure 풀)로 서로 다른 그래프를 스레드 수를
+바꿔 가며 렌더링하고 초당 렌더링 수를 보고합니다. 캐시 효과를 배제하기 위해
+모든 요청의 내용이 다릅니다. Agg 래스터화와 PNG 인코딩 중 GIL이 풀리는
+만큼 스레드 수에 비례해 처리량이 늘어납니다.
+
+사용법:
+    python scripts/benchmark_render.py
+    python scripts/benchmark_render.py --threads 1 2 4 8 --renders 64 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'backend'))
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+from app.services.render import Renderer  # noqa: E402
+
+def make_spec(index, layout, points):
+    """index마다 내용이 다른 이차함수 그래프 요청"""
+    x = np.linspace(-10, 10, points)
+    panels = [
+        {'title': f'f(x) = x² + {index}.{panel}',
+         'series': [{'x': x.tolist(), 'y': (x**2 + index + panel / 10).tolist()}]}
+        for panel in range(int(layout[0]) * int(layout[-1]))
+    ]
+    return {'layout': layout, 'panels': panels}
+
+def measure(threads, renders, layout, points, dpi):
+    """threads개 스레드로 renders개를 렌더링하고 초당 렌더링 수를 반환합니다."""
+    renderer = Renderer(pool_size=threads, cache_size=0)
+    specs = [dict(make_spec(i, layout, points), dpi=dpi) for i in range(renders)]
+
+    # 풀의 그림 생성 비용은 제외
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(renderer.render, [dict(make_spec(-i, layout, points), dpi=dpi)
+                                            for i in range(1, threads * 2 + 1)]))
+        start = time.perf_counter()
+        list(executor.map(renderer.render, specs))
+        elapsed = time.perf_counter() - start
+    return renders / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='서버 측 그래프 렌더링 스레드 확장성 벤치마크')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--renders', type=int, default=32, help='스레드 수별 렌더링 수')
+    parser.add_argument('--layout', default='1x1', choices=['1x1', '2x3', '2x4'])
+    parser.add_argument('--points', type=int, default=1000, help='선당 점 수')
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = []
+    for threads in args.threads:
+        throughput = measure(threads, args.renders, args.layout, args.points, args.dpi)
+        results.append({'threads': threads, 'renders_per_second': throughput})
+    baseline = results[0]['renders_per_second']
+    for result in results:
+        result['speedup'] = result['renders_per_second'] / baseline
+
+    if args.json:
+        print(json.dumps({'layout': args.layout, 'cpu_count': os.cpu_count(), 'results': results}, indent=2))
+        return
+
+    print(f'레이아웃 {args.layout}, 선당 {args.points}점, dpi {args.dpi} (CPU {os.cpu_count()}개)')
+    for result in results:
+        print(f"  스레드 {result['threads']:2d}: {result['renders_per_second']:7.1f} 렌더/초 "
+              f"(x{result['speedup']:.2f})")
+
+if __name__ == '__main__':
+    main()
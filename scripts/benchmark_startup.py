@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Python Runner 콜드 스타트 벤치마크
+
+`python -X importtime`으로 runner와 카드 코드가 사용하는 라이브러리의
+모듈별 import 시간을 측정하고, 빈 코드 실행의 전체 시작 시간을 보고합니다.
+
+사용법:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --top 20 --json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RUNNER_PATH = PROJECT_ROOT / 'runner.py'
+
+# 카드 코드가 import하는 무거운 라이브러리
+TARGETS = ['runner', 'numpy', 'matplotlib.pyplot', 'sympy']
+
+def measure_import_times(module):
+    """새 인터프리터에서 모듈을 import하고 모듈별 (self, cumulative) 시간(us)을 반환합니다."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=dict(os.environ, MPLBACKEND='Agg')
+    )
+    if completed.returncode != 0:
+        return None
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+def measure_runner_startup(repeat=3):
+    """빈 코드를 runner로 실행하는 데 걸리는 전체 시간(초)의 최솟값"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(RUNNER_PATH)],
+            input='pass\n',
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT
+        )
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Python Runner 콜드 스타트 벤치마크')
+    parser.add_argument('--top', type=int, default=10, help='대상별로 표시할 느린 모듈 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    report = {'runner_startup_seconds': measure_runner_startup(), 'imports': {}}
+    for target in TARGETS:
+        timings = measure_import_times(target)
+        if timings is None:
+            report['imports'][target] = None
+            continue
+        slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+        report['imports'][target] = {
+            'total_ms': timings.get(target, (0, 0))[1] / 1000,
+            'slowest_modules_ms': [
+                {'module': name, 'self_ms': self_us / 1000, 'cumulative_ms': cumulative_us / 1000}
+                for name, (self_us, cumulative_us) in slowest
+            ]
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"runner 시작 (빈 코드 실행): {report['runner_startup_seconds'] * 1000:.1f} ms")
+    for target, result in report['imports'].items():
+        if result is None:
+            print(f'\n{target}: import 실패 (설치되지 않음)')
+            continue
+        print(f"\n{target}: {result['total_ms']:.1f} ms")
+        for entry in result['slowest_modules_ms']:
+            print(f"  {entry['self_ms']:8.1f} ms  (누적 {entry['cumulative_ms']:8.1f} ms)  {entry['module']}")
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,14 @@ cd ..
 echo "🐍 백엔드 빌드 중..."
 cd backend
 pip install -r requirements.txt
+
+# 카드 기본 실행 결과 사전 계산
+echo "🖼️ 카드 기본 실행 결과 생성 중..."
+flask --app app.main build-outputs
+
+# 슬라이더 파라미터 격자 타일 사전 계산
+echo "🧩 슬라이더 타일 생성 중..."
+flask --app app.main build-tiles
 cd ..
 
 echo "✅ 빌드 완료!"